@@ -0,0 +1,216 @@
+import json
+
+from django.conf import settings
+from django.db import transaction
+from django.http import Http404, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+
+from .entities import ENTITIES
+from .models import VERSION_CONFLICT_ERROR
+from .page_cache import invalidate_model
+from .pagination import keyset_paginate
+from .search import get_search_query, search
+
+
+class ApiError(Exception):
+    """
+    Error de una request a la API, con el estado HTTP y el cuerpo de la respuesta.
+    """
+
+    def __init__(self, status, body):
+        super().__init__(body)
+        self.status = status
+        self.body = body
+
+
+def _parse_body(request):
+    """
+    Lee el cuerpo JSON de una request de escritura, que debe ser una lista de registros.
+
+    Exigir `Content-Type: application/json` evita que un formulario de otro sitio
+    pueda enviar la request, ya que el navegador la bloquearía por CORS.
+
+    Raises:
+        ApiError: Si el cuerpo no es una lista JSON válida dentro del tamaño máximo.
+    """
+    if request.content_type != "application/json":
+        raise ApiError(415, {"error": "El cuerpo debe ser JSON (Content-Type: application/json)"})
+
+    try:
+        records = json.loads(request.body)
+    except ValueError:
+        raise ApiError(400, {"error": "El cuerpo no es un JSON válido"}) from None
+
+    if not isinstance(records, list):
+        raise ApiError(400, {"error": "El cuerpo debe ser una lista de registros"})
+    if len(records) > settings.API_MAX_BATCH_SIZE:
+        raise ApiError(400, {"error": f"Se permiten hasta {settings.API_MAX_BATCH_SIZE} registros por request"})
+
+    return records
+
+
+def _serialize(entity, instance):
+    """
+    Convierte una instancia del modelo en un diccionario con los campos del registro.
+    """
+    return {field: getattr(instance, field) for field in entity.fields}
+
+
+def _list(request, entity):
+    """
+    Lista los registros de una entidad, paginados por cursor y filtrados por ?q=.
+    Cada registro incluye su versión, para enviarla luego al actualizarlo.
+    """
+    queryset = search(entity.model.objects.all(), get_search_query(request))
+    page = keyset_paginate(request, queryset.values(*entity.export_fields, "version"))
+
+    return JsonResponse(
+        {
+            "results": page.object_list,
+            "next": page.next_cursor,
+            "previous": page.previous_cursor,
+        }
+    )
+
+
+def _create(request, entity):
+    """
+    Crea un lote de registros. Si alguno es inválido no se guarda ninguno.
+    """
+    records = _parse_body(request)
+    errors = {
+        str(index): {"record": "El registro debe ser un objeto"}
+        for index, data in enumerate(records)
+        if not isinstance(data, dict)
+    }
+    if errors:
+        raise ApiError(400, {"errors": errors})
+
+    records = [entity.normalize(data) for data in records]
+    batch_errors = entity.validate_batch(records)
+    if batch_errors:
+        errors = {str(index): record_errors for index, record_errors in batch_errors.as_dict().items()}
+        raise ApiError(400, {"errors": errors})
+
+    instances = [entity.build(record) for record in records]
+
+    with transaction.atomic():
+        entity.model.objects.bulk_create(instances)
+        invalidate_model(entity.model)
+
+    return JsonResponse(
+        {"created": len(instances), "ids": [instance.pk for instance in instances]},
+        status=201,
+    )
+
+
+def _record_id(data):
+    """
+    Obtiene el id de un registro a actualizar, o None si no es válido.
+    """
+    record_id = data.get("id") if isinstance(data, dict) else None
+    if isinstance(record_id, int) and not isinstance(record_id, bool):
+        return record_id
+    return None
+
+
+def _update(request, entity):
+    """
+    Actualiza un lote de registros identificados por su id, con una sola lectura y una
+    sola escritura. Los campos no enviados conservan su valor. Si un registro incluye
+    "version", solo se actualiza si no fue modificado desde esa versión. Si alguno es
+    inválido no se guarda ninguno.
+    """
+    records = _parse_body(request)
+    ids = [_record_id(data) for data in records]
+
+    errors = {}
+    instances = []
+
+    with transaction.atomic():
+        existing = entity.model.objects.select_for_update().in_bulk(
+            [record_id for record_id in ids if record_id is not None]
+        )
+
+        for index, (record_id, data) in enumerate(zip(ids, records)):
+            instance = existing.get(record_id)
+            if instance is None:
+                errors[str(index)] = {"id": "No existe un registro con ese id"}
+                continue
+
+            expected_version = instance._expected_version(data)
+            if expected_version is not None and expected_version != instance.version:
+                errors[str(index)] = {"version": VERSION_CONFLICT_ERROR}
+                continue
+
+            current = _serialize(entity, instance)
+            record = entity.normalize({**current, **data})
+            record_errors = entity.validate(record)
+            if record_errors:
+                errors[str(index)] = record_errors
+                continue
+
+            for field in entity.fields:
+                setattr(instance, field, record[field])
+            instance.version += 1
+            instances.append(instance)
+
+        if errors:
+            raise ApiError(400, {"errors": errors})
+
+        entity.model.objects.bulk_update(instances, entity.fields + ("version",))
+        invalidate_model(entity.model)
+
+    return JsonResponse({"updated": len(instances)})
+
+
+def _delete(request, entity):
+    """
+    Elimina un lote de registros a partir de una lista de ids.
+    """
+    ids = _parse_body(request)
+    if not all(isinstance(record_id, int) and not isinstance(record_id, bool) for record_id in ids):
+        raise ApiError(400, {"error": "El cuerpo debe ser una lista de ids"})
+
+    with transaction.atomic():
+        deleted, _ = entity.model.objects.filter(pk__in=ids).delete()
+        invalidate_model(entity.model)
+
+    return JsonResponse({"deleted": deleted})
+
+
+HANDLERS = {
+    "GET": _list,
+    "POST": _create,
+    "PATCH": _update,
+    "DELETE": _delete,
+}
+
+
+@csrf_exempt
+def records_api(request, entity):
+    """
+    API JSON de una entidad, que opera sobre lotes de registros en una sola request.
+
+    - GET: lista los registros, paginados con ?after= / ?before= y filtrados con ?q=.
+    - POST: crea una lista de registros.
+    - PATCH: actualiza una lista de registros, cada uno con su "id".
+    - DELETE: elimina una lista de ids.
+
+    Las escrituras se validan con las mismas funciones que los formularios y se
+    confirman en una única transacción: si un registro es inválido no se guarda
+    ninguno y se responden los errores indexados por la posición del registro.
+    """
+    if entity not in ENTITIES:
+        raise Http404(f"No existe la entidad '{entity}'")
+
+    handler = HANDLERS.get(request.method)
+    if handler is None:
+        response = JsonResponse({"error": "Método no permitido"}, status=405)
+        response["Allow"] = ", ".join(HANDLERS)
+        return response
+
+    try:
+        return handler(request, ENTITIES[entity])
+    except ApiError as error:
+        return JsonResponse(error.body, status=error.status)
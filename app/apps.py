@@ -1,4 +1,7 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate, post_save
 
 
 class AppConfig(AppConfig):
@@ -15,3 +18,28 @@ class AppConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "app"
+
+    def ready(self):
+        """
+        Conecta las señales de la aplicación.
+
+        Luego de cada `migrate` se reinstalan los índices de búsqueda, ya que SQLite
+        descarta los triggers cuando una migración reconstruye una tabla. Además se
+        cuentan las conexiones abiertas a la base de datos para las métricas, se
+        aplican los PRAGMAs configurados a cada conexión SQLite y se invalidan los
+        listados en cache cuando se guarda un registro (las eliminaciones los
+        invalidan explícitamente, para no perder el DELETE en una sola consulta).
+        Si está configurado, se compilan todos los templates antes de atender requests.
+        """
+        from . import metrics, page_cache, search, sqlite, template_backend
+
+        post_migrate.connect(search.install_after_migrate, sender=self)
+        connection_created.connect(metrics.count_connection)
+        connection_created.connect(sqlite.apply_pragmas)
+
+        for label in page_cache.DEPENDENCIES:
+            model = self.apps.get_model(label)
+            post_save.connect(page_cache.invalidate_on_change, sender=model)
+
+        if settings.TEMPLATE_WARM_UP:
+            template_backend.warm_up()
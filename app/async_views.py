@@ -0,0 +1,136 @@
+from django.http import Http404
+from django.shortcuts import aget_object_or_404, redirect, render, reverse
+
+from .entities import get_entity
+from .page_cache import acached_page
+from .pagination import akeyset_paginate
+from .search import get_search_query, search
+from .streaming import astream_repository, is_stream_request
+
+# Variantes asíncronas de las vistas de views.py, con los mismos nombres y templates.
+# Se usan en lugar de las sincrónicas cuando settings.ASYNC_VIEWS está activo (ver urls.py).
+
+
+async def home(request):
+
+    """
+    Renderiza el template home.html que vendría a ser el menú principal (la pantalla de cards)
+    """
+
+    return render(request, "home.html")
+
+def repository_view(key):
+
+    """
+    Crea la vista asíncrona del listado de una entidad (template <key>/repository.html), con la misma búsqueda, paginación, streaming y cache que render_repository
+    """
+
+    entity = get_entity(key)
+    template_name = f"{key}/repository.html"
+
+    async def repository(request):
+        search_query = get_search_query(request)
+        queryset = search(entity.rows(), search_query)
+        context = {"search_query": search_query}
+
+        if is_stream_request(request):
+            return astream_repository(
+                request, queryset, template_name, f"{key}/rows.html", entity.context_name, context
+            )
+
+        async def render_page(csrf_token):
+            page = await akeyset_paginate(request, queryset)
+            context.update({entity.context_name: page.object_list, "page": page})
+            if csrf_token is not None:
+                context["csrf_token"] = csrf_token
+            return render(request, template_name, context)
+
+        return await acached_page(request, key, render_page)
+
+    return repository
+
+def form_view(key):
+
+    """
+    Crea la vista asíncrona del formulario de creación/edición de una entidad (template <key>/form.html).
+    Valida con las mismas reglas que la vista sincrónica (con el ORM asíncrono para las claves foráneas), crea con acreate y actualiza con aupdate_by_id
+    """
+
+    entity = get_entity(key)
+    template_name = f"{key}/form.html"
+
+    async def form(request, id=None):
+        if request.method == "POST":
+            record_id = request.POST.get("id", "")
+            errors = await entity.avalidate(request.POST)
+            saved = not errors
+
+            if saved and record_id == "":
+                await entity.model.objects.acreate(**entity.model_values(request.POST))
+            elif saved:
+                try:
+                    saved, errors = await entity.model.aupdate_by_id(
+                        record_id, request.POST, entity.model.UPDATE_FIELDS
+                    )
+                except entity.model.DoesNotExist:
+                    raise Http404
+
+            if saved:
+                return redirect(reverse(f"{key}_repo"))
+
+            return render(
+                request,
+                template_name,
+                {"errors": errors, entity.instance_name: request.POST, **await entity.aform_choices()},
+            )
+
+        instance = None
+        if id is not None:
+            instance = await aget_object_or_404(entity.model, pk=id)
+
+        return render(
+            request, template_name, {entity.instance_name: instance, **await entity.aform_choices()}
+        )
+
+    return form
+
+def delete_view(key):
+
+    """
+    Crea la vista asíncrona que recupera un registro de la entidad (por <instance_name>_id) y si existe lo elimina
+    """
+
+    entity = get_entity(key)
+
+    async def delete(request):
+        record_id = request.POST.get(f"{entity.instance_name}_id")
+        instance = await aget_object_or_404(entity.model, pk=int(record_id))
+        await instance.adelete()
+
+        return redirect(reverse(f"{key}_repo"))
+
+    return delete
+
+clients_repository = repository_view("clients")
+clients_form = form_view("clients")
+clients_delete = delete_view("clients")
+
+providers_repository = repository_view("providers")
+providers_form = form_view("providers")
+providers_delete = delete_view("providers")
+
+medicine_repository = repository_view("medicine")
+medicine_form = form_view("medicine")
+medicine_delete = delete_view("medicine")
+
+products_repository = repository_view("products")
+products_form = form_view("products")
+products_delete = delete_view("products")
+
+pets_repository = repository_view("pets")
+pets_form = form_view("pets")
+pets_delete = delete_view("pets")
+
+vets_repository = repository_view("vets")
+vets_form = form_view("vets")
+vets_delete = delete_view("vets")
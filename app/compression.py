@@ -0,0 +1,197 @@
+import zlib
+from collections import Counter
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli es opcional
+    brotli = None
+
+# Cantidad de respuestas comprimidas por codificación y bytes antes y después de
+# comprimir, en este proceso, para las métricas
+stats = Counter()
+
+
+class GzipCompressor:
+    """
+    Compresor gzip incremental: cada bloque se emite completo (Z_SYNC_FLUSH), para
+    que el navegador pueda mostrar la página a medida que llega.
+    """
+
+    encoding = "gzip"
+
+    def __init__(self, level):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data):
+        """Comprime un bloque y retorna los bytes listos para enviar."""
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        """Retorna el final del stream gzip."""
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    """
+    Compresor brotli incremental, que también emite cada bloque completo.
+    """
+
+    encoding = "br"
+
+    def __init__(self, quality):
+        self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=quality)
+
+    def compress(self, data):
+        """Comprime un bloque y retorna los bytes listos para enviar."""
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self):
+        """Retorna el final del stream brotli."""
+        return self._compressor.finish()
+
+
+def accepted_encodings(header):
+    """
+    Obtiene las codificaciones que acepta el cliente a partir de Accept-Encoding.
+
+    Args:
+        header (str): El valor del header (p. ej. "gzip, deflate, br;q=0.9").
+
+    Returns:
+        set: Las codificaciones aceptadas, sin las que tienen q=0.
+    """
+    encodings = set()
+    for item in header.lower().split(","):
+        name, _, params = item.partition(";")
+        name = name.strip()
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if name:
+            encodings.add(name)
+    return encodings
+
+
+def get_compressor(request):
+    """
+    Elige el compresor para la request: brotli si está instalado, habilitado y el
+    cliente lo acepta; si no, gzip. Retorna None si el cliente no acepta ninguno.
+    """
+    encodings = accepted_encodings(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    if brotli is not None and settings.COMPRESSION_BROTLI and "br" in encodings:
+        return BrotliCompressor(settings.COMPRESSION_BROTLI_QUALITY)
+    if "gzip" in encodings or "*" in encodings:
+        return GzipCompressor(settings.COMPRESSION_GZIP_LEVEL)
+    return None
+
+
+def is_compressible(response):
+    """
+    Indica si vale la pena comprimir la respuesta: su tipo de contenido está en
+    COMPRESSION_CONTENT_TYPES, no está ya codificada y, si no es streaming, tiene
+    al menos COMPRESSION_MIN_SIZE bytes.
+    """
+    content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+    if content_type not in settings.COMPRESSION_CONTENT_TYPES:
+        return False
+    if response.has_header("Content-Encoding"):
+        return False
+    if "no-transform" in response.get("Cache-Control", ""):
+        return False
+    return response.streaming or len(response.content) >= settings.COMPRESSION_MIN_SIZE
+
+
+def compress_stream(chunks, compressor):
+    """
+    Comprime los bloques de una respuesta streaming a medida que se generan.
+    """
+    size = 0
+    compressed = 0
+    for chunk in chunks:
+        size += len(chunk)
+        data = compressor.compress(chunk)
+        compressed += len(data)
+        if data:
+            yield data
+    data = compressor.finish()
+    _count(compressor.encoding, size, compressed + len(data))
+    yield data
+
+
+async def acompress_stream(chunks, compressor):
+    """
+    Versión asíncrona de `compress_stream`, para las respuestas de las vistas asíncronas.
+    """
+    size = 0
+    compressed = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        data = compressor.compress(chunk)
+        compressed += len(data)
+        if data:
+            yield data
+    data = compressor.finish()
+    _count(compressor.encoding, size, compressed + len(data))
+    yield data
+
+
+def _count(encoding, size, compressed):
+    """
+    Registra una respuesta comprimida en las métricas.
+    """
+    stats[f"{encoding}_responses"] += 1
+    stats["bytes_in"] += size
+    stats["bytes_out"] += compressed
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Comprime las respuestas HTML, JSON, CSV y de texto con brotli o gzip, según lo
+    que acepte el cliente.
+
+    Las respuestas comunes se comprimen de una vez y solo si quedan más chicas; las
+    respuestas streaming (listados completos y exportaciones, sincrónicas o
+    asíncronas) se comprimen bloque a bloque, sin acumularlas en memoria. Los
+    archivos estáticos no pasan por aquí: WhiteNoise los sirve ya comprimidos.
+    """
+
+    def process_response(self, request, response):
+        """Comprime la respuesta si corresponde y agrega Vary: Accept-Encoding."""
+        if not is_compressible(response):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        compressor = get_compressor(request)
+        if compressor is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = acompress_stream(response.streaming_content, compressor)
+            else:
+                response.streaming_content = compress_stream(response.streaming_content, compressor)
+            del response.headers["Content-Length"]
+        else:
+            content = compressor.compress(response.content) + compressor.finish()
+            if len(content) >= len(response.content):
+                return response
+            _count(compressor.encoding, len(response.content), len(content))
+            response.content = content
+            response.headers["Content-Length"] = str(len(content))
+
+        # El ETag fuerte deja de corresponder a los bytes enviados (RFC 9110, 8.8.1)
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = compressor.encoding
+
+        return response
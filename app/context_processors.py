@@ -1,3 +1,7 @@
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+
 from django.urls import reverse
 
 links = [
@@ -11,36 +15,65 @@ links = [
 ]
 
 
-def navbar(request):
+def build_sections(links):
     """
-    Generate a dictionary with links and their active status based on the request path.
+    Precompute the navbar links for every possible active section.
 
-    This function takes a Django HttpRequest object and generates a dictionary
-    where each link in `links` is checked against the request path to determine
-    if it should be marked as active. The active status is added to the link's
-    dictionary.
+    Each section maps to an immutable tuple of read-only links, with the 'active'
+    key already set, so a request only has to look up its section.
 
-    :param request: The HttpRequest object containing metadata about the request.
-    :return: A dictionary containing the links with their active status.
+    :param links: The list of link dictionaries, each with at least an 'href' key.
+    :return: A read-only mapping from section href ('' for none) to its links.
+    """
+    sections = {}
+    for section in ["", *(link["href"] for link in links)]:
+        sections[section] = tuple(
+            MappingProxyType({**link, "active": link["href"] == section}) for link in links
+        )
+    return MappingProxyType(sections)
+
+
+SECTIONS = build_sections(links)
+
+# Sorted prefixes of every section but home, which only matches its exact path
+PREFIXES = tuple(sorted(link["href"] for link in links if link["href"] != "/"))
+
+
+@lru_cache(maxsize=1024)
+def active_section(path):
+    """
+    Return the href of the navbar section that contains the given path.
+
+    The prefix table is searched with bisect: the longest prefix of the path is the
+    greatest prefix that sorts before it. Results are memoised per path. The value
+    identifies the rendered navbar, so it is also used as the key of its cached fragment.
+
+    :param path: The request path.
+    :return: The href of the active link, or an empty string if none matches.
     """
-    def add_active(link):
-        """
-        Add an 'active' key to the link dictionary based on the request path.
+    if path == "/":
+        return "/" if "/" in SECTIONS else ""
 
-        This helper function creates a copy of the link dictionary and determines
-        if the link should be marked as active based on whether the request path
-        matches or starts with the link's href.
+    index = bisect_right(PREFIXES, path)
+    while index:
+        index -= 1
+        prefix = PREFIXES[index]
+        if path.startswith(prefix):
+            return prefix
+        if prefix[:2] != path[:2]:
+            break
+    return ""
 
-        :param link: A dictionary representing a link with at least an 'href' key.
-        :return: A copy of the link dictionary with an added 'active' key.
-        """
-        copy = link.copy()
 
-        if copy["href"] == "/":
-            copy["active"] = request.path == "/"
-        else:
-            copy["active"] = request.path.startswith(copy.get("href", ""))
+def navbar(request):
+    """
+    Provide the navbar links with their active status based on the request path.
 
-        return copy
+    The links are precomputed per section by `build_sections`, so this only looks
+    up the active section of the path.
 
-    return {"links": map(add_active, links)}
\ No newline at end of file
+    :param request: The HttpRequest object containing metadata about the request.
+    :return: A dictionary containing the links with their active status and the active section.
+    """
+    section = active_section(request.path)
+    return {"links": SECTIONS[section], "active_section": section}
@@ -0,0 +1,256 @@
+from django.db.models import F, Func, IntegerField, OuterRef, Subquery
+
+from .models import (
+    Client,
+    Medicine,
+    Pet,
+    Product,
+    Provider,
+    Vet,
+    client_validator,
+    medicine_validator,
+    pet_validator,
+    product_validator,
+    provider_validator,
+    vet_validator,
+)
+
+
+class Entity:
+    """
+    Describe una de las entidades del sistema para los procesos genéricos (importación, exportación, API).
+
+    Args:
+        key (str): El identificador de la entidad, igual al directorio de sus templates.
+        model (Model): El modelo de Django.
+        validator (Validator): Las reglas que validan los datos de un registro o de un lote.
+        fields (tuple): Los campos que se cargan desde los datos de un registro.
+        label (str): El nombre en plural de la entidad, para los mensajes.
+        instance_name (str): El nombre con el que los templates reciben un registro (p. ej. "client").
+        context_name (str): El nombre con el que los templates reciben el listado (p. ej. "clients").
+        columns (tuple): Los campos que muestra el listado. Por defecto, los del registro.
+        related (dict): Los campos de otros modelos que muestra el listado: {nombre: lookup}.
+        counts (dict): Los conteos que muestra el listado: {nombre: relación a contar}.
+        choices (tuple): Las claves foráneas que el formulario ofrece como opciones.
+    """
+
+    def __init__(
+        self, key, model, validator, fields, label, instance_name, context_name,
+        columns=None, related=None, counts=None, choices=(),
+    ):
+        self.key = key
+        self.model = model
+        self.validator = validator
+        self.fields = fields
+        self.label = label
+        self.instance_name = instance_name
+        self.context_name = context_name
+        self.columns = columns or fields
+        self.related = related or {}
+        self.counts = counts or {}
+        self.choices = choices
+
+    @property
+    def export_fields(self):
+        """Las columnas que se exportan: el id y los campos del registro."""
+        return ("id",) + self.fields
+
+    def __repr__(self):
+        """Retorna una representación de la entidad para depuración."""
+        return f"<Entity {self.key}>"
+
+    def _annotated(self):
+        """
+        Retorna todos los registros con los conteos del listado anotados.
+
+        Cada conteo es una subconsulta correlacionada (que usa el índice de la clave
+        foránea) en lugar de un JOIN con GROUP BY: así la consulta del listado no agrupa
+        todas las filas antes del LIMIT, y con una búsqueda SQLite puede detenerse al
+        completar la página.
+        """
+        queryset = self.model.objects.all()
+        if self.counts:
+            queryset = queryset.annotate(
+                **{name: self._count(relation) for name, relation in self.counts.items()}
+            )
+        return queryset
+
+    def _count(self, relation):
+        """
+        Retorna la subconsulta que cuenta los registros relacionados de cada fila (p. ej. "pets").
+        """
+        remote_field = self.model._meta.get_field(relation).field
+        related = remote_field.model.objects.filter(**{remote_field.name: OuterRef("pk")}).order_by()
+        return Subquery(
+            related.annotate(count=Func("pk", function="COUNT", output_field=IntegerField())).values("count")
+        )
+
+    def rows(self):
+        """
+        Retorna los registros del listado como filas livianas (tuplas con nombres) con
+        solo las columnas que muestra su template, sin instanciar modelos. Las
+        relaciones y los conteos se obtienen en la misma consulta.
+
+        Returns:
+            QuerySet: Las filas del listado, con el id y las columnas mostradas.
+        """
+        queryset = self._annotated()
+        if self.related:
+            queryset = queryset.annotate(
+                **{name: F(lookup) for name, lookup in self.related.items()}
+            )
+        return queryset.values_list(
+            "id", *self.columns, *self.counts, *self.related, named=True
+        )
+
+    def _choice_querysets(self):
+        """
+        Retorna, por cada clave foránea del formulario, el nombre de sus opciones en el
+        template (p. ej. "owner_choices") y los registros a ofrecer.
+        """
+        for name in self.choices:
+            related_model = self.model._meta.get_field(name).related_model
+            yield f"{name}_choices", related_model.objects.only("id", "name").order_by("name")
+
+    def form_choices(self):
+        """
+        Obtiene las opciones de las claves foráneas del formulario.
+
+        Returns:
+            dict: Los registros a ofrecer por cada clave foránea.
+        """
+        return {name: list(queryset) for name, queryset in self._choice_querysets()}
+
+    async def aform_choices(self):
+        """
+        Versión asíncrona de `form_choices`.
+        """
+        return {name: [item async for item in queryset] for name, queryset in self._choice_querysets()}
+
+    def validate(self, data):
+        """
+        Valida los datos de un registro con las mismas reglas que los formularios.
+
+        Args:
+            data (dict): Los datos del registro.
+
+        Returns:
+            dict: Los errores encontrados, por campo.
+        """
+        return self.validator(data)
+
+    async def avalidate(self, data):
+        """
+        Versión asíncrona de `validate`.
+        """
+        return await self.validator.avalidate(data)
+
+    def validate_batch(self, records):
+        """
+        Valida un lote de registros en una sola pasada.
+
+        Args:
+            records (Sequence): Los registros normalizados.
+
+        Returns:
+            BatchErrors: Los errores, con la posición de cada registro en el lote.
+        """
+        return self.validator.validate_records(records)
+
+    def normalize(self, data):
+        """
+        Convierte los valores de un registro al formato de texto que esperan las validaciones.
+
+        Los datos que llegan de un formulario son siempre texto; los que llegan de un
+        archivo JSON pueden ser números. Los campos ausentes o nulos quedan vacíos.
+
+        Args:
+            data (dict): Los datos del registro.
+
+        Returns:
+            dict: Los datos del registro con todos sus campos como texto.
+        """
+        normalized = {}
+        for field in self.fields:
+            value = data.get(field)
+            normalized[field] = "" if value is None else str(value).strip()
+        return normalized
+
+    def build(self, data):
+        """
+        Crea una instancia del modelo, sin guardarla, a partir de datos ya validados.
+
+        Args:
+            data (dict): Los datos normalizados del registro.
+
+        Returns:
+            Model: La instancia del modelo.
+        """
+        return self.model(**self.model_values(data))
+
+    def model_values(self, data):
+        """
+        Toma de los datos los valores de los campos del modelo. Los campos opcionales
+        que admiten nulos (p. ej. las claves foráneas) quedan en None si están vacíos.
+
+        Args:
+            data (dict): Los datos del registro.
+
+        Returns:
+            dict: Los valores de cada campo del registro.
+        """
+        values = {}
+        for field in self.fields:
+            value = data.get(field)
+            if value == "" and self.model._meta.get_field(field).null:
+                value = None
+            values[field] = value
+        return values
+
+
+ENTITIES = {
+    entity.key: entity
+    for entity in (
+        Entity(
+            "clients", Client, client_validator, ("name", "phone", "email", "address"), "clientes",
+            "client", "clients", counts={"pet_count": "pets"},
+        ),
+        Entity(
+            "providers", Provider, provider_validator, ("name", "email", "address"), "proveedores",
+            "provider", "providers",
+        ),
+        Entity(
+            "medicine", Medicine, medicine_validator, ("name", "description", "dose"), "medicinas",
+            "medicine", "medicines",
+        ),
+        Entity(
+            "products", Product, product_validator, ("name", "type", "price"), "productos",
+            "product", "products",
+        ),
+        Entity(
+            "pets", Pet, pet_validator, ("name", "breed", "birthday", "owner_id", "vet_id"), "mascotas",
+            "pet", "pets", columns=("name", "breed", "birthday"),
+            related={"owner_name": "owner__name", "vet_name": "vet__name"}, choices=("owner", "vet"),
+        ),
+        Entity(
+            "vets", Vet, vet_validator, ("name", "email", "phone", "speciality"), "veterinarios",
+            "vet", "vets",
+        ),
+    )
+}
+
+
+def get_entity(key):
+    """
+    Obtiene una entidad por su identificador.
+
+    Args:
+        key (str): El identificador de la entidad (p. ej. "clients").
+
+    Returns:
+        Entity: La entidad encontrada.
+
+    Raises:
+        KeyError: Si no existe una entidad con ese identificador.
+    """
+    return ENTITIES[key]
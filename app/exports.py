@@ -0,0 +1,93 @@
+import csv
+import json
+import zlib
+
+from django.conf import settings
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+}
+
+
+class _LineBuffer:
+    """
+    Destino de escritura para csv.writer que retorna la línea en lugar de guardarla.
+    """
+
+    def write(self, value):
+        """Retorna el texto recibido."""
+        return value
+
+
+def export_lines(entity, queryset=None, format="csv", chunk_size=None):
+    """
+    Genera las líneas de la exportación de una entidad sin instanciar modelos.
+
+    Las filas se leen con `values_list(...).iterator()`, por lo que la memoria usada
+    es constante sin importar la cantidad de registros.
+
+    Args:
+        entity (Entity): La entidad a exportar.
+        queryset (QuerySet): Los registros a exportar. Por defecto, todos.
+        format (str): El formato de salida: csv o jsonl.
+        chunk_size (int): La cantidad de filas que se leen por consulta.
+
+    Yields:
+        str: El encabezado (en CSV) y luego una línea por registro.
+    """
+    if queryset is None:
+        queryset = entity.model.objects.all()
+    if chunk_size is None:
+        chunk_size = settings.REPOSITORY_STREAM_CHUNK_SIZE
+
+    columns = entity.export_fields
+    rows = queryset.order_by("id").values_list(*columns).iterator(chunk_size=chunk_size)
+
+    if format == "csv":
+        writer = csv.writer(_LineBuffer())
+        yield writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow(row)
+    else:
+        for row in rows:
+            yield json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=str) + "\n"
+
+
+def encode_chunks(lines, compress=False, chunk_size=64 * 1024):
+    """
+    Codifica las líneas en UTF-8 y las agrupa en bloques, comprimidos con gzip si se pide.
+
+    Args:
+        lines (iterable): Las líneas de texto a emitir.
+        compress (bool): Si se comprime la salida con gzip.
+        chunk_size (int): El tamaño aproximado en bytes de cada bloque.
+
+    Yields:
+        bytes: Los bloques de la salida.
+    """
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if compress else None
+    buffer = []
+    size = 0
+
+    def flush():
+        """Retorna el contenido acumulado, comprimido si corresponde."""
+        data = b"".join(buffer)
+        buffer.clear()
+        return compressor.compress(data) if compressor else data
+
+    for line in lines:
+        data = line.encode("utf-8")
+        buffer.append(data)
+        size += len(data)
+        if size >= chunk_size:
+            size = 0
+            chunk = flush()
+            if chunk:
+                yield chunk
+
+    chunk = flush()
+    if compressor:
+        chunk += compressor.flush()
+    if chunk:
+        yield chunk
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app.entities import ENTITIES, get_entity
+from app.exports import EXPORT_FORMATS, encode_chunks, export_lines
+
+
+class Command(BaseCommand):
+    """
+    Exporta todos los registros de una entidad en CSV o JSONL, opcionalmente comprimidos con gzip.
+
+    Las filas se leen y escriben de forma incremental, por lo que la memoria usada
+    no depende de la cantidad de registros.
+    """
+
+    help = "Exporta los registros de clientes, mascotas, productos, etc. en CSV o JSONL"
+
+    def add_arguments(self, parser):
+        """Define los argumentos del comando."""
+        parser.add_argument("model", choices=sorted(ENTITIES), help="La entidad a exportar")
+        parser.add_argument("--format", choices=sorted(EXPORT_FORMATS), default="csv")
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help="El archivo de salida. Por defecto se escribe en la salida estándar",
+        )
+        parser.add_argument("--gzip", action="store_true", help="Comprime la salida con gzip")
+
+    def handle(self, *args, **options):
+        """Exporta los registros de la entidad indicada."""
+        entity = get_entity(options["model"])
+        output = options["output"]
+        lines = export_lines(entity, format=options["format"])
+
+        if output is None:
+            if options["gzip"]:
+                raise CommandError("--gzip requiere indicar un archivo con --output")
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+
+        with open(output, "wb") as file:
+            for chunk in encode_chunks(lines, compress=options["gzip"]):
+                file.write(chunk)
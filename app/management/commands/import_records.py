@@ -0,0 +1,151 @@
+import csv
+import json
+import time
+from itertools import islice
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from app.entities import ENTITIES, get_entity
+from app.page_cache import invalidate_model
+
+FORMATS = ("csv", "jsonl", "json")
+
+
+def read_records(path, format):
+    """
+    Lee los registros de un archivo de a uno, sin cargarlo completo en memoria.
+
+    Los archivos CSV y JSONL se leen fila a fila. Un archivo JSON debe contener una
+    lista de objetos y, por su formato, se carga completo. Las filas que no se pueden
+    interpretar no detienen la lectura: se informan con su error.
+
+    Args:
+        path (Path): La ruta del archivo.
+        format (str): El formato del archivo: csv, jsonl o json.
+
+    Yields:
+        tuple: El número de fila (la línea del archivo en CSV y JSONL, la posición en
+        la lista en JSON), los datos del registro y el error de lectura o None.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        if format == "csv":
+            reader = csv.DictReader(file)
+            line = 1
+            for data in reader:
+                # La fila empieza en la línea siguiente a la anterior (puede ocupar varias)
+                yield line + 1, data, None
+                line = reader.line_num
+        elif format == "jsonl":
+            for line, text in enumerate(file, start=1):
+                if not text.strip():
+                    continue
+                try:
+                    yield line, json.loads(text), None
+                except json.JSONDecodeError as error:
+                    yield line, None, f"JSON inválido ({error.msg})"
+        else:
+            try:
+                records = json.load(file)
+            except json.JSONDecodeError as error:
+                raise CommandError(f"El archivo JSON no es válido: {error}")
+            if not isinstance(records, list):
+                raise CommandError("El archivo JSON debe contener una lista de registros")
+            for index, data in enumerate(records, start=1):
+                yield index, data, None
+
+
+def batched(iterable, size):
+    """
+    Agrupa un iterable en listas de a lo sumo `size` elementos.
+    """
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    """
+    Importa registros masivamente desde un archivo CSV, JSONL o JSON.
+
+    Los registros se validan por lote con las mismas reglas que los formularios y se
+    guardan con bulk_create, en una transacción por lote. Las filas inválidas (o que
+    no se pueden interpretar) se informan con su número de línea y se omiten. Al terminar se invalidan los listados en cache.
+    """
+
+    help = "Importa registros de clientes, mascotas, productos, etc. desde un archivo CSV, JSONL o JSON"
+
+    def add_arguments(self, parser):
+        """Define los argumentos del comando."""
+        parser.add_argument("model", choices=sorted(ENTITIES), help="La entidad a importar")
+        parser.add_argument("file", type=Path, help="El archivo con los registros")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="El formato del archivo. Por defecto se deduce de su extensión",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="La cantidad de registros que se validan y guardan por transacción",
+        )
+
+    def handle(self, *args, **options):
+        """Importa los registros del archivo indicado."""
+        entity = get_entity(options["model"])
+        path = options["file"]
+        format = options["format"] or path.suffix.lstrip(".").lower()
+        batch_size = options["batch_size"]
+
+        if format not in FORMATS:
+            raise CommandError(f"Formato no soportado: '{format}'. Use --format con {', '.join(FORMATS)}")
+        if not path.exists():
+            raise CommandError(f"No existe el archivo '{path}'")
+        if batch_size < 1:
+            raise CommandError("--batch-size debe ser mayor a cero")
+
+        start = time.perf_counter()
+        imported = 0
+        failed = 0
+
+        for batch in batched(read_records(path, format), batch_size):
+            rows = []
+            for row_number, data, error in batch:
+                if error is None and not isinstance(data, dict):
+                    error = "El registro debe ser un objeto"
+                if error is None:
+                    rows.append((row_number, data))
+                else:
+                    self.stderr.write(f"Fila {row_number}: {error}")
+                    failed += 1
+
+            records = [entity.normalize(data) for _, data in rows]
+            errors = entity.validate_batch(records)
+
+            for index, record_errors in errors.as_dict().items():
+                for field, message in record_errors.items():
+                    self.stderr.write(f"Fila {rows[index][0]}: {field}: {message}")
+            failed += len(errors)
+
+            if errors:
+                instances = [entity.build(records[index]) for index in errors.valid_indexes()]
+            else:
+                instances = [entity.build(record) for record in records]
+
+            with transaction.atomic():
+                entity.model.objects.bulk_create(instances)
+            imported += len(instances)
+
+        if imported:
+            invalidate_model(entity.model)
+
+        elapsed = time.perf_counter() - start
+        rate = imported / elapsed if elapsed else imported
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Se importaron {imported} {entity.label} ({failed} filas con errores) "
+                f"en {elapsed:.2f} s ({rate:.0f} filas/s)"
+            )
+        )
@@ -0,0 +1,73 @@
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections
+from django.http import Http404, JsonResponse
+
+from . import compression, page_cache, template_backend
+from .sqlite import current_pragmas
+
+# Conexiones abiertas por alias desde que arrancó el proceso
+connections_opened = Counter()
+
+
+def count_connection(sender, connection, **kwargs):
+    """
+    Receptor de `connection_created` que cuenta las conexiones abiertas por este proceso.
+    """
+    connections_opened[connection.alias] += 1
+
+
+def database_metrics():
+    """
+    Reúne el estado de las conexiones a la base de datos de este proceso.
+
+    Returns:
+        dict: Por cada alias, la configuración de reutilización, si la conexión está
+        abierta, cuántas se abrieron, los PRAGMAs vigentes en SQLite y, si hay un
+        pool de psycopg, sus estadísticas.
+    """
+    metrics = {}
+    for connection in connections.all(initialized_only=True):
+        data = {
+            "vendor": connection.vendor,
+            "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+            "conn_health_checks": connection.settings_dict["CONN_HEALTH_CHECKS"],
+            "connected": connection.connection is not None,
+            "connections_opened": connections_opened[connection.alias],
+        }
+
+        if connection.vendor == "sqlite" and data["connected"] and settings.SQLITE_PRAGMAS:
+            data["pragmas"] = current_pragmas(connection, settings.SQLITE_PRAGMAS)
+
+        pool = getattr(connection, "pool", None)
+        if pool is not None:
+            data["pool"] = pool.get_stats()
+
+        metrics[connection.alias] = data
+    return metrics
+
+
+def metrics(request):
+    """
+    Expone las métricas del proceso en formato JSON, para el monitoreo.
+
+    Incluyen la configuración de la base y detalles internos, por lo que solo las ven
+    los usuarios staff, salvo que METRICS_PUBLIC esté activo. Para los demás el
+    endpoint no existe (404).
+    """
+    if not settings.METRICS_PUBLIC and not request.user.is_staff:
+        raise Http404
+
+    return JsonResponse(
+        {
+            "database": database_metrics(),
+            "repository_cache": {
+                "timeout": settings.REPOSITORY_CACHE_TIMEOUT,
+                "hits": page_cache.stats["hits"],
+                "misses": page_cache.stats["misses"],
+            },
+            "templates": template_backend.template_metrics(),
+            "compression": dict(compression.stats),
+        }
+    )
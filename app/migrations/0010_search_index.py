@@ -0,0 +1,70 @@
+from django.db import migrations
+
+# Columnas indexadas para la búsqueda de cada tabla al crear la migración. El SQL se
+# arma aquí y no con app.search, para que la migración no cambie si cambia ese módulo.
+SEARCH_FIELDS = {
+    "app_client": ("name", "email", "phone"),
+    "app_provider": ("name", "email", "address"),
+    "app_medicine": ("name", "description"),
+    "app_product": ("name", "type"),
+    "app_pet": ("name", "breed"),
+    "app_vet": ("name", "email", "phone", "speciality"),
+}
+
+
+def trigger_sql(table, fields):
+    index = f"{table}_search"
+    columns = ", ".join(fields)
+    new_values = ", ".join(f"new.{field}" for field in fields)
+    old_values = ", ".join(f"old.{field}" for field in fields)
+    insert = f"INSERT INTO {index}(rowid, {columns}) VALUES (new.id, {new_values});"
+    delete = f"INSERT INTO {index}({index}, rowid, {columns}) VALUES ('delete', old.id, {old_values});"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {index}_ai AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {index}_ad AFTER DELETE ON {table} BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {index}_au AFTER UPDATE OF {columns} ON {table} BEGIN {delete} {insert} END",
+    ]
+
+
+def index_sql(table, fields):
+    index = f"{table}_search"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5({', '.join(fields)}, "
+        f"content='{table}', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        f"INSERT INTO {index}({index}) VALUES ('rebuild')",
+        *trigger_sql(table, fields),
+    ]
+
+
+def drop_sql(table):
+    index = f"{table}_search"
+    return [
+        *(f"DROP TRIGGER IF EXISTS {index}_{suffix}" for suffix in ("ai", "ad", "au")),
+        f"DROP TABLE IF EXISTS {index}",
+    ]
+
+
+class SQLiteRunSQL(migrations.RunSQL):
+    """RunSQL que solo se aplica en SQLite (FTS5); en otros motores la búsqueda usa icontains."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "sqlite":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "sqlite":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0009_provider_address_alter_vet_speciality'),
+    ]
+
+    operations = [
+        SQLiteRunSQL(
+            sql=[statement for table, fields in SEARCH_FIELDS.items() for statement in index_sql(table, fields)],
+            reverse_sql=[statement for table in SEARCH_FIELDS for statement in drop_sql(table)],
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.0.4 on 2026-10-17 00:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0010_search_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='client',
+            options={'ordering': ['id']},
+        ),
+        migrations.AlterModelOptions(
+            name='medicine',
+            options={'ordering': ['id']},
+        ),
+        migrations.AlterModelOptions(
+            name='pet',
+            options={'ordering': ['id']},
+        ),
+        migrations.AlterModelOptions(
+            name='product',
+            options={'ordering': ['id']},
+        ),
+        migrations.AlterModelOptions(
+            name='provider',
+            options={'ordering': ['id']},
+        ),
+        migrations.AlterModelOptions(
+            name='vet',
+            options={'ordering': ['id']},
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['name'], name='client_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['email'], name='client_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['phone'], name='client_phone_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='medicine',
+            index=models.Index(fields=['name'], name='medicine_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(fields=['name'], name='pet_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(fields=['birthday'], name='pet_birthday_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['name'], name='product_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['type'], name='product_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='provider',
+            index=models.Index(fields=['name'], name='provider_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vet',
+            index=models.Index(fields=['name'], name='vet_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vet',
+            index=models.Index(fields=['speciality'], name='vet_speciality_idx'),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.0.4 on 2026-10-17 00:46
+
+from django.db import migrations, models
+
+# SQLite descarta los triggers del índice de búsqueda (0010) al reconstruir las tablas
+# para agregar la columna, por lo que se vuelven a crear. El SQL se fija aquí y no se
+# toma de app.search, para que la migración no cambie si cambia ese módulo.
+SEARCH_TRIGGERS_SQL = [
+    "CREATE TRIGGER IF NOT EXISTS app_client_search_ai AFTER INSERT ON app_client BEGIN INSERT INTO app_client_search(rowid, name, email, phone) VALUES (new.id, new.name, new.email, new.phone); END",
+    "CREATE TRIGGER IF NOT EXISTS app_client_search_ad AFTER DELETE ON app_client BEGIN INSERT INTO app_client_search(app_client_search, rowid, name, email, phone) VALUES ('delete', old.id, old.name, old.email, old.phone); END",
+    "CREATE TRIGGER IF NOT EXISTS app_client_search_au AFTER UPDATE OF name, email, phone ON app_client BEGIN INSERT INTO app_client_search(app_client_search, rowid, name, email, phone) VALUES ('delete', old.id, old.name, old.email, old.phone); INSERT INTO app_client_search(rowid, name, email, phone) VALUES (new.id, new.name, new.email, new.phone); END",
+    "CREATE TRIGGER IF NOT EXISTS app_provider_search_ai AFTER INSERT ON app_provider BEGIN INSERT INTO app_provider_search(rowid, name, email, address) VALUES (new.id, new.name, new.email, new.address); END",
+    "CREATE TRIGGER IF NOT EXISTS app_provider_search_ad AFTER DELETE ON app_provider BEGIN INSERT INTO app_provider_search(app_provider_search, rowid, name, email, address) VALUES ('delete', old.id, old.name, old.email, old.address); END",
+    "CREATE TRIGGER IF NOT EXISTS app_provider_search_au AFTER UPDATE OF name, email, address ON app_provider BEGIN INSERT INTO app_provider_search(app_provider_search, rowid, name, email, address) VALUES ('delete', old.id, old.name, old.email, old.address); INSERT INTO app_provider_search(rowid, name, email, address) VALUES (new.id, new.name, new.email, new.address); END",
+    "CREATE TRIGGER IF NOT EXISTS app_medicine_search_ai AFTER INSERT ON app_medicine BEGIN INSERT INTO app_medicine_search(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS app_medicine_search_ad AFTER DELETE ON app_medicine BEGIN INSERT INTO app_medicine_search(app_medicine_search, rowid, name, description) VALUES ('delete', old.id, old.name, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS app_medicine_search_au AFTER UPDATE OF name, description ON app_medicine BEGIN INSERT INTO app_medicine_search(app_medicine_search, rowid, name, description) VALUES ('delete', old.id, old.name, old.description); INSERT INTO app_medicine_search(rowid, name, description) VALUES (new.id, new.name, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS app_product_search_ai AFTER INSERT ON app_product BEGIN INSERT INTO app_product_search(rowid, name, type) VALUES (new.id, new.name, new.type); END",
+    "CREATE TRIGGER IF NOT EXISTS app_product_search_ad AFTER DELETE ON app_product BEGIN INSERT INTO app_product_search(app_product_search, rowid, name, type) VALUES ('delete', old.id, old.name, old.type); END",
+    "CREATE TRIGGER IF NOT EXISTS app_product_search_au AFTER UPDATE OF name, type ON app_product BEGIN INSERT INTO app_product_search(app_product_search, rowid, name, type) VALUES ('delete', old.id, old.name, old.type); INSERT INTO app_product_search(rowid, name, type) VALUES (new.id, new.name, new.type); END",
+    "CREATE TRIGGER IF NOT EXISTS app_pet_search_ai AFTER INSERT ON app_pet BEGIN INSERT INTO app_pet_search(rowid, name, breed) VALUES (new.id, new.name, new.breed); END",
+    "CREATE TRIGGER IF NOT EXISTS app_pet_search_ad AFTER DELETE ON app_pet BEGIN INSERT INTO app_pet_search(app_pet_search, rowid, name, breed) VALUES ('delete', old.id, old.name, old.breed); END",
+    "CREATE TRIGGER IF NOT EXISTS app_pet_search_au AFTER UPDATE OF name, breed ON app_pet BEGIN INSERT INTO app_pet_search(app_pet_search, rowid, name, breed) VALUES ('delete', old.id, old.name, old.breed); INSERT INTO app_pet_search(rowid, name, breed) VALUES (new.id, new.name, new.breed); END",
+    "CREATE TRIGGER IF NOT EXISTS app_vet_search_ai AFTER INSERT ON app_vet BEGIN INSERT INTO app_vet_search(rowid, name, email, phone, speciality) VALUES (new.id, new.name, new.email, new.phone, new.speciality); END",
+    "CREATE TRIGGER IF NOT EXISTS app_vet_search_ad AFTER DELETE ON app_vet BEGIN INSERT INTO app_vet_search(app_vet_search, rowid, name, email, phone, speciality) VALUES ('delete', old.id, old.name, old.email, old.phone, old.speciality); END",
+    "CREATE TRIGGER IF NOT EXISTS app_vet_search_au AFTER UPDATE OF name, email, phone, speciality ON app_vet BEGIN INSERT INTO app_vet_search(app_vet_search, rowid, name, email, phone, speciality) VALUES ('delete', old.id, old.name, old.email, old.phone, old.speciality); INSERT INTO app_vet_search(rowid, name, email, phone, speciality) VALUES (new.id, new.name, new.email, new.phone, new.speciality); END",
+]
+
+
+class SQLiteRunSQL(migrations.RunSQL):
+    """RunSQL que solo se aplica en SQLite (FTS5); en otros motores la búsqueda usa icontains."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "sqlite":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "sqlite":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0011_indexes_and_ordering'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='medicine',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='pet',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='provider',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='vet',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        SQLiteRunSQL(sql=SEARCH_TRIGGERS_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
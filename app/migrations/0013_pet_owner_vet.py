@@ -0,0 +1,24 @@
+# Generated by Django 5.0.4 on 2026-10-17 01:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0012_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pet',
+            name='owner',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pets', to='app.client'),
+        ),
+        migrations.AddField(
+            model_name='pet',
+            name='vet',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pets', to='app.vet'),
+        ),
+    ]
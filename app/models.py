@@ -1,7 +1,12 @@
-import datetime
 from enum import Enum
 
 from django.db import models
+from django.db.models import F
+
+from .page_cache import ainvalidate_model, invalidate_model
+from .validation import compile_schema
+
+VERSION_CONFLICT_ERROR = "El registro fue modificado por otra persona. Recargue la página para ver los cambios"
 
 
 def validate_client(data):
@@ -14,24 +19,7 @@ def validate_client(data):
     Returns:
         dict: Un diccionario que contiene los errores encontrados durante la validación.
     """
-    errors = {}
-
-    name = data.get("name", "")
-    phone = data.get("phone", "")
-    email = data.get("email", "")
-
-    if name == "":
-        errors["name"] = "Por favor ingrese un nombre"
-
-    if phone == "":
-        errors["phone"] = "Por favor ingrese un teléfono"
-
-    if email == "":
-        errors["email"] = "Por favor ingrese un email"
-    elif email.count("@") == 0:
-        errors["email"] = "Por favor ingrese un email valido"
-
-    return errors
+    return client_validator(data)
 
 def validate_provider(data):
     """
@@ -43,24 +31,7 @@ def validate_provider(data):
     Returns:
         dict: Un diccionario que contiene los errores encontrados durante la validación.
     """
-    errors = {}
-    
-    name = data.get("name", "")
-    email = data.get("email", "")
-    address = data.get("address", "")
-
-    if name == "":
-        errors["name"] = "Por favor ingrese un nombre"
-
-    if email == "":
-        errors["email"] = "Por favor ingrese un email"
-    elif email.count("@") == 0:
-        errors["email"] = "Por favor ingrese un email valido"
-
-    if address == "":
-        errors["address"] = "Por favor ingrese una dirección"
-
-    return errors
+    return provider_validator(data)
 
 def validate_medicine(data):
     """
@@ -72,32 +43,8 @@ def validate_medicine(data):
     Returns:
         dict: Un diccionario que contiene los errores encontrados durante la validación.
     """
-    errors = {}
-
-    name = data.get("name", "")
-    description = data.get("description", "")
-    dose = data.get("dose")
-    if dose is not None:
-        try:
-            num = int(dose)
-        except ValueError:
-            num = None     
-
-    if name == "":
-        errors["name"] = "Por favor, ingrese un nombre de la medicina"
-    
-    if description == "":
-        errors["description"] = "Por favor, ingrese una descripcion de la medicina"
-    
-    if dose is None or dose == "":
-        errors["dose"] = "Por favor, ingrese una cantidad de la dosis de la medicina"
-    elif not isinstance(dose, str) or not dose.isdigit():
-        errors["dose"] = "La dosis debe ser un numero entero"
-    elif not (num > 0 and num < 11):
-        errors["dose"] = "La dosis debe estar entre 1 y 10"
-
-    return errors
-    
+    return medicine_validator(data)
+
 def validate_product(data):
     """
     Valida los datos de un producto.
@@ -108,29 +55,7 @@ def validate_product(data):
     Returns:
         dict: Un diccionario que contiene los errores encontrados durante la validación.
     """
-    errors={}
-
-    name = data.get("name","")
-    type = data.get("type","")
-    price = data.get("price","")
-
-    if name == "":
-        errors["name"] = "Por favor ingrese un nombre"
-    
-    if type == "":
-        errors["type"] = "Por favor ingrese un tipo"
-
-    if price == "":
-        errors["price"] = "Por favor ingrese un precio"
-    else:
-        try:
-            price_value = float(price)
-            if price_value <= 0.0:
-                errors["price"] = "Por favor ingrese un precio mayor a cero"
-        except ValueError:
-            errors["price"] = "Por favor ingrese un precio válido"
-
-    return errors
+    return product_validator(data)
 
 
 def validate_pet(data):
@@ -143,24 +68,7 @@ def validate_pet(data):
     Returns:
         dict: Un diccionario que contiene los errores encontrados durante la validación.
     """
-    errors={}
-
-    name = data.get("name","")
-    breed = data.get("breed","")
-    birthday = data.get("birthday","")
-
-    if name == "":
-        errors["name"] = "Por favor ingrese un nombre"
-    
-    if breed == "":
-        errors["breed"] = "Por favor ingrese una raza"
-
-    date_now = datetime.date.today().strftime("%Y-%m-%d")
-
-    if birthday == "" or birthday >= date_now: 
-        errors["birthday"] = "Por favor ingrese una fecha de nacimiento valida y anterior a la de hoy"
-
-    return errors
+    return pet_validator(data)
 
 def validate_vet(data):
     """
@@ -172,30 +80,170 @@ def validate_vet(data):
     Returns:
         dict: Un diccionario que contiene los errores encontrados durante la validación.
     """
-    errors = {}
+    return vet_validator(data)
+
+class VersionedModel(models.Model):
+    """
+    Modelo base con un número de versión para el control de concurrencia optimista.
+
+    Cada actualización incrementa la versión y solo se aplica si la versión guardada
+    sigue siendo la que se leyó, de modo que dos ediciones concurrentes del mismo
+    registro no se pisen en silencio.
+
+    Args:
+        version (int): La versión actual del registro.
+    """
+
+    version = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        abstract = True
+
+    def delete(self, using=None, keep_parents=False):
+        """
+        Elimina el registro e invalida los listados en cache del modelo, ya que no
+        hay receptores de `post_delete` (ver `page_cache.invalidate_on_change`).
+        También la usa `adelete`.
+        """
+        result = super().delete(using=using, keep_parents=keep_parents)
+        invalidate_model(type(self), using=using)
+        return result
+
+    @classmethod
+    def _changes(cls, data, fields):
+        """
+        Toma de los datos los campos presentes. Un valor vacío borra los campos opcionales
+        (None en los que admiten null, p. ej. el dueño de una mascota); los campos
+        obligatorios vacíos y los ausentes conservan su valor actual.
+        """
+        changes = {}
+        for field in fields:
+            if field not in data:
+                continue
+            value = data.get(field)
+            if value == "" or value is None:
+                model_field = cls._meta.get_field(field)
+                if not model_field.blank:
+                    continue
+                value = None if model_field.null else ""
+            changes[field] = value
+        return changes
+
+    @staticmethod
+    def _expected_version(data):
+        """
+        Obtiene la versión que tenía el registro cuando se leyó, si los datos la incluyen.
+        """
+        version = str(data.get("version") or "")
+        return int(version) if version.isdigit() else None
+
+    def save_changes(self, data, fields):
+        """
+        Guarda solo los campos que cambiaron, con un UPDATE condicionado a la versión.
+        Como QuerySet.update no envía `post_save`, invalida explícitamente los listados en cache.
+
+        Args:
+            data (dict): Los datos ya validados del registro.
+            fields (tuple): Los campos que se pueden actualizar.
 
-    name = data.get("name", "")
-    email = data.get("email", "")
-    phone = data.get("phone", "")
-    speciality = data.get("speciality", "")
+        Returns:
+            tuple: Una tupla indicando si se guardaron los cambios y, en caso de conflicto, el mensaje de error.
+        """
+        expected_version = self._expected_version(data)
+        if expected_version is not None and expected_version != self.version:
+            return False, {"version": VERSION_CONFLICT_ERROR}
 
-    if name == "":
-        errors["name"] = "Por favor ingrese un nombre"
+        changes = {}
+        for field, value in self._changes(data, fields).items():
+            value = self._meta.get_field(field).to_python(value)
+            if getattr(self, field) != value:
+                changes[field] = value
 
-    if email == "":
-        errors["email"] = "Por favor ingrese un email"
-    elif email.count("@") == 0:
-        errors["email"] = "Por favor ingrese un email valido"
+        if not changes:
+            return True, None
 
-    if phone == "":
-        errors["phone"] = "Por favor ingrese un teléfono"
+        updated = type(self).objects.filter(pk=self.pk, version=self.version).update(
+            **changes, version=F("version") + 1
+        )
+        if updated == 0:
+            return False, {"version": VERSION_CONFLICT_ERROR}
+        invalidate_model(type(self))
 
-    if speciality == "":
-        errors["speciality"] = "Por favor seleccione una especialidad"
+        for field, value in changes.items():
+            setattr(self, field, value)
+        self.version += 1
+        return True, None
+
+    @classmethod
+    def update_by_id(cls, pk, data, fields):
+        """
+        Actualiza un registro con un único UPDATE, sin leerlo previamente.
 
-    return errors
+        Si los datos incluyen la versión leída, el UPDATE solo se aplica si el registro
+        no fue modificado desde entonces. Invalida los listados en cache del modelo.
+
+        Args:
+            pk (int): El id del registro.
+            data (dict): Los datos ya validados del registro.
+            fields (tuple): Los campos que se pueden actualizar.
+
+        Returns:
+            tuple: Una tupla indicando si se guardaron los cambios y, en caso de conflicto, el mensaje de error.
+
+        Raises:
+            DoesNotExist: Si no existe un registro con ese id.
+        """
+        filters = {"pk": pk}
+        expected_version = cls._expected_version(data)
+        if expected_version is not None:
+            filters["version"] = expected_version
 
-class Client(models.Model):
+        updated = cls.objects.filter(**filters).update(
+            **cls._changes(data, fields), version=F("version") + 1
+        )
+        if updated:
+            invalidate_model(cls)
+            return True, None
+
+        if expected_version is not None and cls.objects.filter(pk=pk).exists():
+            return False, {"version": VERSION_CONFLICT_ERROR}
+
+        raise cls.DoesNotExist(f"No existe un registro con id {pk}")
+
+    @classmethod
+    async def aupdate_by_id(cls, pk, data, fields):
+        """
+        Versión asíncrona de `update_by_id`, con el ORM asíncrono.
+
+        Args:
+            pk (int): El id del registro.
+            data (dict): Los datos ya validados del registro.
+            fields (tuple): Los campos que se pueden actualizar.
+
+        Returns:
+            tuple: Una tupla indicando si se guardaron los cambios y, en caso de conflicto, el mensaje de error.
+
+        Raises:
+            DoesNotExist: Si no existe un registro con ese id.
+        """
+        filters = {"pk": pk}
+        expected_version = cls._expected_version(data)
+        if expected_version is not None:
+            filters["version"] = expected_version
+
+        updated = await cls.objects.filter(**filters).aupdate(
+            **cls._changes(data, fields), version=F("version") + 1
+        )
+        if updated:
+            await ainvalidate_model(cls)
+            return True, None
+
+        if expected_version is not None and await cls.objects.filter(pk=pk).aexists():
+            return False, {"version": VERSION_CONFLICT_ERROR}
+
+        raise cls.DoesNotExist(f"No existe un registro con id {pk}")
+
+class Client(VersionedModel):
     """
     Modelo que representa un cliente.
 
@@ -211,6 +259,26 @@ class Client(models.Model):
     email = models.EmailField()
     address = models.CharField(max_length=100, blank=True)
 
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["name"], name="client_name_idx"),
+            models.Index(fields=["email"], name="client_email_idx"),
+            models.Index(fields=["phone"], name="client_phone_idx"),
+        ]
+
+    UPDATE_FIELDS = ("name", "email", "phone", "address")
+
+    # Mensajes de validación por campo; las reglas se derivan de los campos (ver compile_schema)
+    VALIDATION_SCHEMA = {
+        "name": {"required": "Por favor ingrese un nombre"},
+        "phone": {"required": "Por favor ingrese un teléfono"},
+        "email": {
+            "required": "Por favor ingrese un email",
+            "invalid": "Por favor ingrese un email valido",
+        },
+    }
+
     def __str__(self):
         """
         Retorna una representación en string del cliente, que es su nombre.
@@ -260,16 +328,32 @@ class Client(models.Model):
         if len(errors.keys()) > 0:
             return False, errors
 
-        self.name = client_data.get("name", "") or self.name
-        self.email = client_data.get("email", "") or self.email
-        self.phone = client_data.get("phone", "") or self.phone
-        self.address = client_data.get("address", "") or self.address
+        return self.save_changes(client_data, Client.UPDATE_FIELDS)
 
-        self.save()
-        return True, None
+    @classmethod
+    def update_client_by_id(cls, client_id, client_data):
+        """
+        Actualiza los datos de un cliente existente con un único UPDATE, sin leerlo previamente.
+
+        Args:
+            client_id (int): El id del cliente.
+            client_data (dict): Un diccionario con los datos actualizados del cliente.
 
+        Returns:
+            tuple: Una tupla indicando si se actualizó correctamente el cliente y, en caso de errores, los mensajes de error.
+
+        Raises:
+            DoesNotExist: Si no existe un cliente con ese id.
+        """
+        errors = validate_client(client_data)
+
+        if len(errors.keys()) > 0:
+            return False, errors
+
+        return cls.update_by_id(client_id, client_data, cls.UPDATE_FIELDS)
 
-class Provider (models.Model):
+
+class Provider (VersionedModel):
     """
     Modelo que representa un proveedor.
 
@@ -283,6 +367,23 @@ class Provider (models.Model):
     email = models.EmailField()
     address = models.CharField(max_length=200)
 
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["name"], name="provider_name_idx"),
+        ]
+
+    UPDATE_FIELDS = ("name", "email", "address")
+
+    VALIDATION_SCHEMA = {
+        "name": {"required": "Por favor ingrese un nombre"},
+        "email": {
+            "required": "Por favor ingrese un email",
+            "invalid": "Por favor ingrese un email valido",
+        },
+        "address": {"required": "Por favor ingrese una dirección"},
+    }
+
     def __str__(self):
         """
         Retorna una representación en string del proveedor, que es su nombre.
@@ -330,15 +431,32 @@ class Provider (models.Model):
 
         if len(errors.keys()) > 0:
             return False, errors
-        
-        self.name = provider_data.get("name", "") or self.name
-        self.email = provider_data.get("email", "") or self.email
-        self.address = provider_data.get("address", "") or self.address
 
-        self.save()
-        return True, None
+        return self.save_changes(provider_data, Provider.UPDATE_FIELDS)
 
-class Medicine(models.Model):
+    @classmethod
+    def update_provider_by_id(cls, provider_id, provider_data):
+        """
+        Actualiza los datos de un proveedor existente con un único UPDATE, sin leerlo previamente.
+
+        Args:
+            provider_id (int): El id del proveedor.
+            provider_data (dict): Un diccionario con los datos actualizados del proveedor.
+
+        Returns:
+            tuple: Una tupla indicando si se actualizó correctamente el proveedor y, en caso de errores, los mensajes de error.
+
+        Raises:
+            DoesNotExist: Si no existe un proveedor con ese id.
+        """
+        errors = validate_provider(provider_data)
+
+        if len(errors.keys()) > 0:
+            return False, errors
+
+        return cls.update_by_id(provider_id, provider_data, cls.UPDATE_FIELDS)
+
+class Medicine(VersionedModel):
     """
     Modelo que representa un medicamento.
 
@@ -352,6 +470,25 @@ class Medicine(models.Model):
     description = models.CharField(max_length=255)
     dose = models.IntegerField()
 
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["name"], name="medicine_name_idx"),
+        ]
+
+    UPDATE_FIELDS = ("name", "description", "dose")
+
+    VALIDATION_SCHEMA = {
+        "name": {"required": "Por favor, ingrese un nombre de la medicina"},
+        "description": {"required": "Por favor, ingrese una descripcion de la medicina"},
+        "dose": {
+            "required": "Por favor, ingrese una cantidad de la dosis de la medicina",
+            "invalid": "La dosis debe ser un numero entero",
+            "min_value": (1, "La dosis debe estar entre 1 y 10"),
+            "max_value": (10, "La dosis debe estar entre 1 y 10"),
+        },
+    }
+
     def __str__(self):
         """
         Retorna una representación en string del medicamento, que es su nombre.
@@ -395,15 +532,32 @@ class Medicine(models.Model):
         
         if len(errors.keys()) > 0:
             return False, errors
-        
-        self.name = medicine_data.get("name", "") or self.name
-        self.description = medicine_data.get("description", "") or self.description
-        self.dose = medicine_data.get("dose", None) or self.dose
 
-        self.save()
-        return True, None
+        return self.save_changes(medicine_data, Medicine.UPDATE_FIELDS)
+
+    @classmethod
+    def update_medicine_by_id(cls, medicine_id, medicine_data):
+        """
+        Actualiza los datos de un medicamento existente con un único UPDATE, sin leerlo previamente.
 
-class Product (models.Model):
+        Args:
+            medicine_id (int): El id del medicamento.
+            medicine_data (dict): Un diccionario con los datos actualizados del medicamento.
+
+        Returns:
+            tuple: Una tupla indicando si se actualizó correctamente el medicamento y, en caso de errores, los mensajes de error.
+
+        Raises:
+            DoesNotExist: Si no existe un medicamento con ese id.
+        """
+        errors = validate_medicine(medicine_data)
+
+        if len(errors.keys()) > 0:
+            return False, errors
+
+        return cls.update_by_id(medicine_id, medicine_data, cls.UPDATE_FIELDS)
+
+class Product (VersionedModel):
     """
     Modelo que representa una mascota.
 
@@ -417,6 +571,25 @@ class Product (models.Model):
     type = models.CharField(max_length=100)
     price = models.FloatField()
 
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["name"], name="product_name_idx"),
+            models.Index(fields=["type"], name="product_type_idx"),
+        ]
+
+    UPDATE_FIELDS = ("name", "type", "price")
+
+    VALIDATION_SCHEMA = {
+        "name": {"required": "Por favor ingrese un nombre"},
+        "type": {"required": "Por favor ingrese un tipo"},
+        "price": {
+            "required": "Por favor ingrese un precio",
+            "invalid": "Por favor ingrese un precio válido",
+            "greater_than": (0, "Por favor ingrese un precio mayor a cero"),
+        },
+    }
+
     def __str__(self):
         """
         Retorna una representación en string del producto, que es su nombre.
@@ -461,15 +634,32 @@ class Product (models.Model):
 
         if len(errors.keys()) > 0:
             return False, errors
-    
-        self.name=product_data.get("name", "") or self.name
-        self.type=product_data.get("type", "") or self.type
-        self.price=product_data.get("price","") or self.price
 
-        self.save()
-        return True, None
+        return self.save_changes(product_data, Product.UPDATE_FIELDS)
+
+    @classmethod
+    def update_product_by_id(cls, product_id, product_data):
+        """
+        Actualiza los datos de un producto existente con un único UPDATE, sin leerlo previamente.
+
+        Args:
+            product_id (int): El id del producto.
+            product_data (dict): Un diccionario con los datos actualizados del producto.
+
+        Returns:
+            tuple: Una tupla indicando si se actualizó correctamente el producto y, en caso de errores, los mensajes de error.
+
+        Raises:
+            DoesNotExist: Si no existe un producto con ese id.
+        """
+        errors = validate_product(product_data)
+
+        if len(errors.keys()) > 0:
+            return False, errors
+
+        return cls.update_by_id(product_id, product_data, cls.UPDATE_FIELDS)
         
-class Pet (models.Model):
+class Pet (VersionedModel):
     """
     Modelo que representa una mascota.
 
@@ -477,18 +667,46 @@ class Pet (models.Model):
         name (str): Nombre de la mascota.
         breed (str): Raza de la mascota.
         birthday (date): Fecha de nacimiento de la mascota.
+        owner (Client): El cliente dueño de la mascota. Puede estar vacío.
+        vet (Vet): El veterinario asignado a la mascota. Puede estar vacío.
     """
 
     name = models.CharField(max_length=100)
     breed = models.CharField(max_length=100)
     birthday = models.DateField()
+    owner = models.ForeignKey(
+        Client, on_delete=models.SET_NULL, null=True, blank=True, related_name="pets"
+    )
+    vet = models.ForeignKey(
+        "Vet", on_delete=models.SET_NULL, null=True, blank=True, related_name="pets"
+    )
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["name"], name="pet_name_idx"),
+            models.Index(fields=["birthday"], name="pet_birthday_idx"),
+        ]
+
+    UPDATE_FIELDS = ("name", "breed", "birthday", "owner_id", "vet_id")
+
+    VALIDATION_SCHEMA = {
+        "name": {"required": "Por favor ingrese un nombre"},
+        "breed": {"required": "Por favor ingrese una raza"},
+        "birthday": {
+            "required": "Por favor ingrese una fecha de nacimiento valida y anterior a la de hoy",
+            "before_today": "Por favor ingrese una fecha de nacimiento valida y anterior a la de hoy",
+        },
+        "owner": {"invalid": "Por favor seleccione un dueño válido"},
+        "vet": {"invalid": "Por favor seleccione un veterinario válido"},
+    }
 
     def __str__(self):
         """
         Retorna una representación en string de la mascota, que es su nombre.
         """
         return self.name
-    
+
     @classmethod
     def save_pet(cls, pet_data):
         """
@@ -509,6 +727,8 @@ class Pet (models.Model):
             name=pet_data.get("name"),
             breed=pet_data.get("breed"),
             birthday=pet_data.get("birthday"),
+            owner_id=pet_data.get("owner_id") or None,
+            vet_id=pet_data.get("vet_id") or None,
         )
 
         return True, None
@@ -528,12 +748,29 @@ class Pet (models.Model):
         if len(errors.keys()) > 0:
             return False, errors
 
-        self.name=pet_data.get("name", "") or self.name
-        self.breed=pet_data.get("breed", "") or self.breed
-        self.birthday=pet_data.get("birthday","") or self.birthday
+        return self.save_changes(pet_data, Pet.UPDATE_FIELDS)
 
-        self.save()
-        return True, None
+    @classmethod
+    def update_pet_by_id(cls, pet_id, pet_data):
+        """
+        Actualiza los datos de una mascota existente con un único UPDATE, sin leerla previamente.
+
+        Args:
+            pet_id (int): El id de la mascota.
+            pet_data (dict): Un diccionario con los datos actualizados de la mascota.
+
+        Returns:
+            tuple: Una tupla indicando si se actualizó correctamente la mascota y, en caso de errores, los mensajes de error.
+
+        Raises:
+            DoesNotExist: Si no existe una mascota con ese id.
+        """
+        errors = validate_pet(pet_data)
+
+        if len(errors.keys()) > 0:
+            return False, errors
+
+        return cls.update_by_id(pet_id, pet_data, cls.UPDATE_FIELDS)
 
 class Speciality(Enum):
     """
@@ -558,7 +795,7 @@ class Speciality(Enum):
         """
         return [(key.name, key.value) for key in cls]
 
-class Vet(models.Model):
+class Vet(VersionedModel):
     """
     Modelo que representa a un veterinario.
 
@@ -574,6 +811,25 @@ class Vet(models.Model):
     phone = models.CharField(max_length=15)
     speciality = models.CharField(max_length=100, choices=Speciality.choices(), default=Speciality.Urgencias)
 
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["name"], name="vet_name_idx"),
+            models.Index(fields=["speciality"], name="vet_speciality_idx"),
+        ]
+
+    UPDATE_FIELDS = ("name", "email", "phone", "speciality")
+
+    VALIDATION_SCHEMA = {
+        "name": {"required": "Por favor ingrese un nombre"},
+        "email": {
+            "required": "Por favor ingrese un email",
+            "invalid": "Por favor ingrese un email valido",
+        },
+        "phone": {"required": "Por favor ingrese un teléfono"},
+        "speciality": {"required": "Por favor seleccione una especialidad"},
+    }
+
     def __str__(self):
         """
         Retorna una representación en string del veterinario, que es su nombre.
@@ -619,11 +875,37 @@ class Vet(models.Model):
 
         if len(errors.keys()) > 0:
             return False, errors
-        
-        self.name = vet_data.get("name", "") or self.name
-        self.email = vet_data.get("email", "") or self.email
-        self.phone = vet_data.get("phone", "") or self.phone
-        self.speciality = vet_data.get("speciality", "") or self.speciality
-        self.save()
-        return True, None
-    
\ No newline at end of file
+
+        return self.save_changes(vet_data, Vet.UPDATE_FIELDS)
+
+    @classmethod
+    def update_vet_by_id(cls, vet_id, vet_data):
+        """
+        Actualiza los datos de un veterinario existente con un único UPDATE, sin leerlo previamente.
+
+        Args:
+            vet_id (int): El id del veterinario.
+            vet_data (dict): Un diccionario con los datos actualizados del veterinario.
+
+        Returns:
+            tuple: Una tupla indicando si se actualizó correctamente el veterinario y, en caso de errores, los mensajes de error.
+
+        Raises:
+            DoesNotExist: Si no existe un veterinario con ese id.
+        """
+        errors = validate_vet(vet_data)
+
+        if len(errors.keys()) > 0:
+            return False, errors
+
+        return cls.update_by_id(vet_id, vet_data, cls.UPDATE_FIELDS)
+    
+
+
+# Validadores compilados una sola vez a partir del esquema de cada modelo
+client_validator = compile_schema(Client, exclude=("version",))
+provider_validator = compile_schema(Provider, exclude=("version",))
+medicine_validator = compile_schema(Medicine, exclude=("version",))
+product_validator = compile_schema(Product, exclude=("version",))
+pet_validator = compile_schema(Pet, exclude=("version",))
+vet_validator = compile_schema(Vet, exclude=("version",))
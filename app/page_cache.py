@@ -0,0 +1,275 @@
+import hashlib
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.http import urlencode
+
+KEY_PREFIX = "repository"
+
+# Valor que se renderiza en lugar del token CSRF en las páginas guardadas en cache.
+# Al servirlas se reemplaza por el token de la request.
+CSRF_PLACEHOLDER = "vetsoftcsrftokenplaceholder"
+
+# Listados que muestran datos de cada modelo y que deben invalidarse cuando cambia.
+# El listado de mascotas muestra el nombre del dueño y del veterinario, y el de
+# clientes la cantidad de mascotas de cada uno.
+DEPENDENCIES = {
+    "app.Client": ("clients", "pets"),
+    "app.Provider": ("providers",),
+    "app.Medicine": ("medicine",),
+    "app.Product": ("products",),
+    "app.Pet": ("pets", "clients"),
+    "app.Vet": ("vets", "pets"),
+}
+
+# Aciertos y fallos de la cache de este proceso, para las métricas
+stats = Counter()
+
+
+def _generation_key(key):
+    """
+    Retorna la clave de cache que guarda la generación actual de un listado.
+    """
+    return f"{KEY_PREFIX}:{key}:generation"
+
+
+def get_generation(key):
+    """
+    Obtiene la generación actual de un listado.
+
+    Las páginas se guardan bajo la generación vigente, por lo que cambiarla
+    invalida todas las páginas del listado a la vez, sin tener que recorrerlas.
+    Si la cache descartó la generación se reinicia con la hora actual, para no
+    volver a un valor con páginas viejas guardadas.
+    """
+    return cache.get_or_set(_generation_key(key), time.time_ns, timeout=None)
+
+
+def bump_generation(key):
+    """
+    Cambia la generación de un listado, invalidando todas sus páginas.
+
+    Se guarda un valor nuevo (la hora actual en nanosegundos) en lugar de incrementar
+    el actual: en la cache de archivos `incr` lee y escribe por separado, y dos
+    procesos que invalidaran a la vez podrían escribir el mismo valor.
+    """
+    cache.set(_generation_key(key), _next_generation(cache.get(_generation_key(key))), timeout=None)
+
+
+async def aget_generation(key):
+    """
+    Versión asíncrona de `get_generation`.
+    """
+    return await cache.aget_or_set(_generation_key(key), time.time_ns, timeout=None)
+
+
+async def abump_generation(key):
+    """
+    Versión asíncrona de `bump_generation`.
+    """
+    current = await cache.aget(_generation_key(key))
+    await cache.aset(_generation_key(key), _next_generation(current), timeout=None)
+
+
+def _next_generation(current):
+    """
+    Retorna una generación nueva: la hora actual, o la siguiente a la actual si el
+    reloj no avanzó desde la invalidación anterior.
+    """
+    generation = time.time_ns()
+    if current is not None and generation <= current:
+        generation = current + 1
+    return generation
+
+
+def _page_key(key, generation, query):
+    """
+    Arma la clave de una página a partir de la generación y los parámetros de la URL.
+    """
+    params = urlencode(sorted(query.lists()), doseq=True)
+    digest = hashlib.md5(params.encode(), usedforsecurity=False).hexdigest()
+    return f"{KEY_PREFIX}:{key}:{generation}:{digest}"
+
+
+def page_key(key, query):
+    """
+    Arma la clave de cache de una página a partir de los parámetros de la URL.
+
+    Args:
+        key (str): El identificador del listado (p. ej. "clients").
+        query (QueryDict): Los parámetros de la request (búsqueda, cursores, tamaño).
+
+    Returns:
+        str: La clave de la página en la generación actual del listado.
+    """
+    return _page_key(key, get_generation(key), query)
+
+
+class PendingInvalidation:
+    """
+    Listados a invalidar al confirmarse la transacción actual de una conexión.
+
+    Se registra un solo callback por transacción, al que se agregan los listados de
+    cada modelo modificado, de modo que guardar o eliminar muchos registros cambia
+    la generación de cada listado una sola vez.
+    """
+
+    def __init__(self):
+        self.keys = set()
+        self.done = False
+
+    def __call__(self):
+        """Cambia la generación de cada listado pendiente."""
+        self.done = True
+        for key in sorted(self.keys):
+            bump_generation(key)
+
+
+def invalidate_model(model, using=None):
+    """
+    Invalida los listados que muestran datos del modelo indicado.
+
+    La invalidación se aplica al confirmarse la transacción: si se aplicara antes,
+    otra request podría volver a guardar la página con los datos aún sin confirmar.
+    Dentro de una transacción los listados se agregan al callback ya registrado, si
+    lo hay, por lo que cada listado se invalida una sola vez al confirmarla. Fuera de
+    una transacción se aplica inmediatamente.
+
+    Args:
+        model (Model): El modelo modificado.
+        using (str): El alias de la base de datos.
+    """
+    keys = DEPENDENCIES.get(model._meta.label, ())
+    if not keys:
+        return
+
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        for key in keys:
+            bump_generation(key)
+        return
+
+    # Si la transacción (o el savepoint donde se registró) se revierte, Django descarta
+    # el callback y la próxima invalidación registra uno nuevo
+    pending = next(
+        (
+            func
+            for _, func, _ in connection.run_on_commit
+            if isinstance(func, PendingInvalidation) and not func.done
+        ),
+        None,
+    )
+    if pending is None:
+        pending = PendingInvalidation()
+        transaction.on_commit(pending, using=using)
+    pending.keys.update(keys)
+
+
+async def ainvalidate_model(model):
+    """
+    Versión asíncrona de `invalidate_model`. El ORM asíncrono no usa transacciones,
+    por lo que la invalidación se aplica inmediatamente.
+    """
+    for key in DEPENDENCIES.get(model._meta.label, ()):
+        await abump_generation(key)
+
+
+def invalidate_on_change(sender, using=None, **kwargs):
+    """
+    Receptor de `post_save` que invalida los listados del modelo.
+
+    No se usa `post_delete`: con un receptor conectado Django ya no elimina con una
+    sola consulta, sino que lee cada registro y envía una señal por cada uno. Las
+    eliminaciones invalidan explícitamente (ver `VersionedModel.delete`, la
+    eliminación múltiple y la API).
+    """
+    invalidate_model(sender, using=using)
+
+
+def cached_page(request, key, render_page):
+    """
+    Retorna una página de un listado desde la cache, o la renderiza y la guarda.
+
+    La página se renderiza con un marcador en lugar del token CSRF, que se reemplaza
+    por el de cada request al servirla. No se usa la cache si hay mensajes pendientes
+    de mostrar, ya que forman parte de la página.
+
+    Args:
+        request (HttpRequest): La request actual.
+        key (str): El identificador del listado (p. ej. "clients").
+        render_page (function): Renderiza la página; recibe el token CSRF a usar.
+
+    Returns:
+        HttpResponse: La página del listado.
+    """
+    if not _is_cacheable(request):
+        return render_page(None)
+
+    cache_key = page_key(key, request.GET)
+    content = cache.get(cache_key)
+
+    if content is None:
+        stats["misses"] += 1
+        response = render_page(CSRF_PLACEHOLDER)
+        content = response.content
+        cache.set(cache_key, content, settings.REPOSITORY_CACHE_TIMEOUT)
+    else:
+        stats["hits"] += 1
+        response = HttpResponse()
+
+    return _with_csrf_token(request, response, content)
+
+
+async def acached_page(request, key, render_page):
+    """
+    Versión asíncrona de `cached_page`, para las vistas asíncronas.
+
+    Args:
+        request (HttpRequest): La request actual.
+        key (str): El identificador del listado (p. ej. "clients").
+        render_page (coroutine function): Renderiza la página; recibe el token CSRF a usar.
+
+    Returns:
+        HttpResponse: La página del listado.
+    """
+    if not _is_cacheable(request):
+        return await render_page(None)
+
+    cache_key = _page_key(key, await aget_generation(key), request.GET)
+    content = await cache.aget(cache_key)
+
+    if content is None:
+        stats["misses"] += 1
+        response = await render_page(CSRF_PLACEHOLDER)
+        content = response.content
+        await cache.aset(cache_key, content, settings.REPOSITORY_CACHE_TIMEOUT)
+    else:
+        stats["hits"] += 1
+        response = HttpResponse()
+
+    return _with_csrf_token(request, response, content)
+
+
+def _is_cacheable(request):
+    """
+    Indica si la página de la request se puede servir y guardar en cache.
+    """
+    return (
+        bool(settings.REPOSITORY_CACHE_TIMEOUT)
+        and request.method == "GET"
+        and not len(get_messages(request))
+    )
+
+
+def _with_csrf_token(request, response, content):
+    """
+    Asigna el contenido a la respuesta, reemplazando el marcador por el token CSRF de la request.
+    """
+    response.content = content.replace(CSRF_PLACEHOLDER.encode(), get_token(request).encode())
+    return response
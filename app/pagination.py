@@ -0,0 +1,231 @@
+from django.conf import settings
+
+CURSOR_AFTER = "after"
+CURSOR_BEFORE = "before"
+PAGE_SIZE_PARAM = "page_size"
+
+# Alias por el que se ordenan y filtran las páginas en lugar de id, si el queryset lo
+# define (p. ej. el rowid del índice de búsqueda, que tiene el mismo valor; ver search.py)
+KEYSET_FIELD = "keyset_id"
+
+
+def _parse_int(value):
+    """
+    Convierte un parámetro de la URL a entero positivo.
+
+    Args:
+        value (str): El valor recibido en la query string.
+
+    Returns:
+        int: El valor convertido o None si no es un entero positivo.
+    """
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+
+    return number if number > 0 else None
+
+
+def _row_id(row):
+    """
+    Retorna el id de una fila, ya sea una instancia de modelo, un diccionario o una
+    tupla con nombres (de `values_list(named=True)`).
+    """
+    if isinstance(row, dict):
+        return row["id"]
+    if isinstance(row, tuple):
+        return row.id
+    return row.pk
+
+
+class KeysetPage:
+    """
+    Representa una página obtenida mediante paginación por cursor (keyset).
+
+    Args:
+        object_list (list): Las filas de la página, ordenadas por id ascendente.
+        query (QueryDict): Los parámetros de la request, usados para armar los links.
+        next_cursor (int): El id a partir del cual comienza la página siguiente.
+        previous_cursor (int): El id anterior al cual termina la página previa.
+    """
+
+    def __init__(self, object_list, query, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self._query = query
+
+    def __iter__(self):
+        """Itera sobre las filas de la página."""
+        return iter(self.object_list)
+
+    def __len__(self):
+        """Retorna la cantidad de filas de la página."""
+        return len(self.object_list)
+
+    @property
+    def has_next(self):
+        """Indica si existe una página siguiente."""
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        """Indica si existe una página anterior."""
+        return self.previous_cursor is not None
+
+    def _build_query(self, param, cursor):
+        """
+        Arma la query string de un link conservando el resto de los parámetros.
+        """
+        query = self._query.copy()
+        query.pop(CURSOR_AFTER, None)
+        query.pop(CURSOR_BEFORE, None)
+        query[param] = cursor
+        return "?" + query.urlencode()
+
+    @property
+    def next_query(self):
+        """Query string del link a la página siguiente."""
+        if not self.has_next:
+            return ""
+        return self._build_query(CURSOR_AFTER, self.next_cursor)
+
+    @property
+    def previous_query(self):
+        """Query string del link a la página anterior."""
+        if not self.has_previous:
+            return ""
+        return self._build_query(CURSOR_BEFORE, self.previous_cursor)
+
+
+def get_page_size(request):
+    """
+    Obtiene el tamaño de página pedido, acotado al máximo permitido.
+
+    Args:
+        request (HttpRequest): La request actual.
+
+    Returns:
+        int: La cantidad de filas por página.
+    """
+    page_size = _parse_int(request.GET.get(PAGE_SIZE_PARAM))
+    if page_size is None:
+        return settings.REPOSITORY_PAGE_SIZE
+    return min(page_size, settings.REPOSITORY_MAX_PAGE_SIZE)
+
+
+def _cursors(request, page_size):
+    """
+    Obtiene el tamaño de página y los cursores ?after= / ?before= de la request.
+    """
+    if page_size is None:
+        page_size = get_page_size(request)
+
+    after = _parse_int(request.GET.get(CURSOR_AFTER))
+    before = _parse_int(request.GET.get(CURSOR_BEFORE))
+    return page_size, after, before
+
+
+def _keyset_field(queryset):
+    """
+    Retorna el campo por el que se pagina el queryset: KEYSET_FIELD si lo define, o id.
+    """
+    return KEYSET_FIELD if KEYSET_FIELD in queryset.query.annotations else "id"
+
+
+def _previous_rows(queryset, before, page_size):
+    """
+    Consulta las filas anteriores al cursor `before`, de la más cercana a la más lejana.
+    """
+    field = _keyset_field(queryset)
+    return queryset.filter(**{f"{field}__lt": before}).order_by(f"-{field}")[: page_size + 1]
+
+
+def _next_rows(queryset, after, page_size):
+    """
+    Consulta las filas posteriores al cursor `after` (o las primeras si no hay cursor).
+    """
+    field = _keyset_field(queryset)
+    if after is not None:
+        queryset = queryset.filter(**{f"{field}__gt": after})
+    return queryset.order_by(field)[: page_size + 1]
+
+
+def _previous_page(request, rows, page_size):
+    """
+    Arma la página que termina antes del cursor `before`, o None si no hay filas anteriores.
+    """
+    if not rows:
+        return None
+
+    has_previous = len(rows) > page_size
+    rows = rows[:page_size]
+    rows.reverse()
+    return KeysetPage(
+        rows,
+        request.GET,
+        next_cursor=_row_id(rows[-1]),
+        previous_cursor=_row_id(rows[0]) if has_previous else None,
+    )
+
+
+def _next_page(request, rows, page_size, after):
+    """
+    Arma la página que comienza después del cursor `after`.
+    """
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+
+    previous_cursor = None
+    if after is not None:
+        previous_cursor = _row_id(rows[0]) if rows else after + 1
+
+    return KeysetPage(
+        rows,
+        request.GET,
+        next_cursor=_row_id(rows[-1]) if has_next else None,
+        previous_cursor=previous_cursor,
+    )
+
+
+def keyset_paginate(request, queryset, page_size=None):
+    """
+    Pagina un queryset buscando por id en lugar de usar OFFSET.
+
+    Cada página se obtiene con una única consulta `WHERE id > cursor ORDER BY id
+    LIMIT n`, de modo que su costo no depende de la posición ni del tamaño de la tabla.
+    Los cursores viajan en la URL como `?after=<id>` y `?before=<id>`.
+
+    Args:
+        request (HttpRequest): La request con los cursores en la query string.
+        queryset (QuerySet): El queryset a paginar.
+        page_size (int): La cantidad de filas por página. Por defecto se usa la configurada.
+
+    Returns:
+        KeysetPage: La página pedida.
+    """
+    page_size, after, before = _cursors(request, page_size)
+
+    if before is not None and after is None:
+        page = _previous_page(request, list(_previous_rows(queryset, before, page_size)), page_size)
+        if page is not None:
+            return page
+
+    return _next_page(request, list(_next_rows(queryset, after, page_size)), page_size, after)
+
+
+async def akeyset_paginate(request, queryset, page_size=None):
+    """
+    Versión asíncrona de `keyset_paginate`, que lee las filas con el ORM asíncrono.
+    """
+    page_size, after, before = _cursors(request, page_size)
+
+    if before is not None and after is None:
+        rows = [row async for row in _previous_rows(queryset, before, page_size)]
+        page = _previous_page(request, rows, page_size)
+        if page is not None:
+            return page
+
+    rows = [row async for row in _next_rows(queryset, after, page_size)]
+    return _next_page(request, rows, page_size, after)
@@ -0,0 +1,161 @@
+import re
+
+from django.db import connections, models
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .pagination import KEYSET_FIELD
+
+SEARCH_PARAM = "q"
+
+# Columnas indexadas para la búsqueda de cada tabla
+SEARCH_FIELDS = {
+    "app_client": ("name", "email", "phone"),
+    "app_provider": ("name", "email", "address"),
+    "app_medicine": ("name", "description"),
+    "app_product": ("name", "type"),
+    "app_pet": ("name", "breed"),
+    "app_vet": ("name", "email", "phone", "speciality"),
+}
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def search_table(table):
+    """
+    Retorna el nombre de la tabla virtual FTS5 que indexa a la tabla indicada.
+    """
+    return f"{table}_search"
+
+
+def _trigger_statements(table, fields):
+    """
+    Genera los triggers que mantienen el índice FTS5 sincronizado con la tabla.
+
+    Se usan triggers en lugar de señales de Django para que también se reflejen las
+    escrituras masivas (bulk_create, QuerySet.update y QuerySet.delete). El trigger de
+    actualización solo se dispara si cambia alguna de las columnas indexadas.
+    """
+    index = search_table(table)
+    columns = ", ".join(fields)
+    new_values = ", ".join(f"new.{field}" for field in fields)
+    old_values = ", ".join(f"old.{field}" for field in fields)
+
+    insert = f"INSERT INTO {index}(rowid, {columns}) VALUES (new.id, {new_values});"
+    delete = (
+        f"INSERT INTO {index}({index}, rowid, {columns}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {index}_ai AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {index}_ad AFTER DELETE ON {table} BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {index}_au AFTER UPDATE OF {columns} ON {table} "
+        f"BEGIN {delete} {insert} END",
+    ]
+
+
+def install(connection):
+    """
+    Crea los índices FTS5 y sus triggers. Es idempotente y solo aplica a SQLite.
+
+    Se ejecuta desde la migración y luego de cada `migrate`, ya que SQLite descarta
+    los triggers cuando Django reconstruye una tabla al modificar sus columnas.
+
+    Args:
+        connection: La conexión a la base de datos.
+    """
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        existing = set(connection.introspection.table_names(cursor))
+
+        for table, fields in SEARCH_FIELDS.items():
+            if table not in existing:
+                continue
+
+            index = search_table(table)
+            if index not in existing:
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE {index} USING fts5({', '.join(fields)}, "
+                    f"content='{table}', content_rowid='id', "
+                    "tokenize='unicode61 remove_diacritics 2')"
+                )
+                cursor.execute(f"INSERT INTO {index}({index}) VALUES ('rebuild')")
+
+            for statement in _trigger_statements(table, fields):
+                cursor.execute(statement)
+
+
+def uninstall(connection):
+    """
+    Elimina los índices FTS5 y sus triggers.
+
+    Args:
+        connection: La conexión a la base de datos.
+    """
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        for table in SEARCH_FIELDS:
+            index = search_table(table)
+            for suffix in ("ai", "ad", "au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {index}_{suffix}")
+            cursor.execute(f"DROP TABLE IF EXISTS {index}")
+
+
+def install_after_migrate(sender, using, **kwargs):
+    """
+    Receptor de `post_migrate` que reinstala los índices de búsqueda.
+    """
+    install(connections[using])
+
+
+def get_search_query(request):
+    """
+    Obtiene el texto buscado en la request (`?q=`).
+    """
+    return request.GET.get(SEARCH_PARAM, "").strip()
+
+
+def search(queryset, query):
+    """
+    Filtra un queryset por los términos buscados.
+
+    En SQLite usa el índice FTS5 de la tabla, buscando cada término como prefijo
+    de alguna palabra de las columnas indexadas (p. ej. "brujita" o "221555"). En
+    otros motores recurre a un filtro `icontains` sobre las mismas columnas.
+
+    Args:
+        queryset (QuerySet): El queryset a filtrar.
+        query (str): El texto buscado.
+
+    Returns:
+        QuerySet: El queryset filtrado, o el mismo queryset si no hay términos.
+    """
+    tokens = TOKEN_RE.findall(query)
+    table = queryset.model._meta.db_table
+    fields = SEARCH_FIELDS.get(table)
+
+    if not tokens or fields is None:
+        return queryset
+
+    if connections[queryset.db].vendor == "sqlite":
+        index = search_table(table)
+        match = " ".join(f'"{token}"*' for token in tokens)
+        # Se une la tabla con el índice y se pagina por su rowid (KEYSET_FIELD) en lugar de
+        # filtrar con `id IN (SELECT rowid ...)`: así SQLite recorre las coincidencias en
+        # orden y se detiene al completar la página, sin armar antes todas las coincidencias
+        return queryset.extra(
+            tables=[index], where=[f"{index}.rowid = {table}.id", f"{index} MATCH %s"], params=[match]
+        ).alias(**{KEYSET_FIELD: RawSQL(f"{index}.rowid", (), output_field=models.BigIntegerField())})
+
+    for token in tokens:
+        condition = Q()
+        for field in fields:
+            condition |= Q(**{f"{field}__icontains": token})
+        queryset = queryset.filter(condition)
+
+    return queryset
@@ -0,0 +1,64 @@
+import re
+
+from django.conf import settings
+
+PRAGMA_NAME_RE = re.compile(r"^[a-z_]+$")
+PRAGMA_VALUE_RE = re.compile(r"^-?\w+$")
+
+
+def pragma_statements(pragmas):
+    """
+    Genera las sentencias PRAGMA a partir de un diccionario nombre -> valor.
+
+    Args:
+        pragmas (dict): Los PRAGMAs a aplicar, en orden.
+
+    Returns:
+        list: Las sentencias SQL.
+
+    Raises:
+        ValueError: Si un nombre o valor no es un identificador o número válido.
+    """
+    statements = []
+    for name, value in pragmas.items():
+        if not PRAGMA_NAME_RE.match(name) or not PRAGMA_VALUE_RE.match(str(value)):
+            raise ValueError(f"PRAGMA inválido: {name}={value}")
+        statements.append(f"PRAGMA {name} = {value}")
+    return statements
+
+
+def apply_pragmas(sender, connection, **kwargs):
+    """
+    Receptor de `connection_created` que aplica `settings.SQLITE_PRAGMAS` a cada conexión SQLite.
+
+    `journal_mode` queda guardado en el archivo de la base, pero el resto de los PRAGMAs
+    son por conexión, por lo que se aplican cada vez que se abre una.
+    """
+    if connection.vendor != "sqlite" or not settings.SQLITE_PRAGMAS:
+        return
+
+    with connection.cursor() as cursor:
+        for statement in pragma_statements(settings.SQLITE_PRAGMAS):
+            cursor.execute(statement)
+
+
+def current_pragmas(connection, names):
+    """
+    Lee el valor actual de los PRAGMAs indicados en una conexión SQLite.
+
+    Args:
+        connection: La conexión a la base de datos.
+        names (iterable): Los nombres de los PRAGMAs.
+
+    Returns:
+        dict: El valor de cada PRAGMA, o None si no aplica a la base (p. ej. mmap_size en memoria).
+    """
+    values = {}
+    with connection.cursor() as cursor:
+        for name in names:
+            if not PRAGMA_NAME_RE.match(name):
+                raise ValueError(f"PRAGMA inválido: {name}")
+            cursor.execute(f"PRAGMA {name}")
+            row = cursor.fetchone()
+            values[name] = row[0] if row else None
+    return values
@@ -0,0 +1,116 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.middleware.csrf import get_token
+from django.template import loader
+from django.utils.safestring import mark_safe
+
+STREAM_PARAM = "stream"
+STREAM_MARKER = "<!-- vetsoft:stream-rows -->"
+
+
+def is_stream_request(request):
+    """
+    Indica si la request pide el listado completo en modo streaming (`?stream=1`).
+    """
+    return request.GET.get(STREAM_PARAM) == "1"
+
+
+def stream_repository(request, queryset, template_name, rows_template_name, context_name, context=None, chunk_size=None):
+    """
+    Genera un listado completo de forma incremental con StreamingHttpResponse.
+
+    La página se renderiza una sola vez con un marcador en lugar de las filas y se
+    parte en encabezado y pie. Las filas se leen con `QuerySet.iterator()` y se
+    renderizan de a bloques con el template de filas, por lo que la memoria usada
+    no depende de la cantidad de registros.
+
+    Args:
+        request (HttpRequest): La request actual.
+        queryset (QuerySet): Los registros a listar.
+        template_name (str): El template de la página (p. ej. clients/repository.html).
+        rows_template_name (str): El template que renderiza un bloque de filas.
+        context_name (str): El nombre con el que el template de filas recibe el bloque.
+        context (dict): Variables adicionales para el template de la página.
+        chunk_size (int): La cantidad de filas por bloque. Por defecto se usa la configurada.
+
+    Returns:
+        StreamingHttpResponse: La respuesta que emite la página de a partes.
+    """
+    head, tail, render_rows, chunk_size = _prepare(
+        request, template_name, rows_template_name, context_name, context, chunk_size
+    )
+
+    def generate():
+        """Emite el encabezado, los bloques de filas y el pie de la página."""
+        yield head
+
+        rows = []
+        rendered_any = False
+        for row in queryset.order_by("id").iterator(chunk_size=chunk_size):
+            rows.append(row)
+            if len(rows) >= chunk_size:
+                yield render_rows(rows)
+                rows = []
+                rendered_any = True
+
+        if rows or not rendered_any:
+            yield render_rows(rows)
+
+        yield tail
+
+    return StreamingHttpResponse(generate(), content_type="text/html; charset=utf-8")
+
+
+def astream_repository(request, queryset, template_name, rows_template_name, context_name, context=None, chunk_size=None):
+    """
+    Versión asíncrona de `stream_repository`, que lee las filas con `QuerySet.aiterator()`.
+
+    Mientras se espera a la base o a que el cliente reciba un bloque, el proceso
+    puede atender otras requests.
+    """
+    head, tail, render_rows, chunk_size = _prepare(
+        request, template_name, rows_template_name, context_name, context, chunk_size
+    )
+
+    async def generate():
+        """Emite el encabezado, los bloques de filas y el pie de la página."""
+        yield head
+
+        rows = []
+        rendered_any = False
+        async for row in queryset.order_by("id").aiterator(chunk_size=chunk_size):
+            rows.append(row)
+            if len(rows) >= chunk_size:
+                yield render_rows(rows)
+                rows = []
+                rendered_any = True
+
+        if rows or not rendered_any:
+            yield render_rows(rows)
+
+        yield tail
+
+    return StreamingHttpResponse(generate(), content_type="text/html; charset=utf-8")
+
+
+def _prepare(request, template_name, rows_template_name, context_name, context, chunk_size):
+    """
+    Renderiza la página con el marcador y la parte en encabezado y pie.
+
+    Returns:
+        tuple: El encabezado, el pie, la función que renderiza un bloque de filas y el tamaño de bloque.
+    """
+    if chunk_size is None:
+        chunk_size = settings.REPOSITORY_STREAM_CHUNK_SIZE
+
+    page_context = dict(context or {}, stream_marker=mark_safe(STREAM_MARKER))
+    page = loader.render_to_string(template_name, page_context, request)
+    head, tail = page.split(STREAM_MARKER, 1)
+    rows_template = loader.get_template(rows_template_name)
+    csrf_token = get_token(request)
+
+    def render_rows(rows):
+        """Renderiza un bloque de filas sin volver a ejecutar los context processors."""
+        return rows_template.render({context_name: rows, "csrf_token": csrf_token})
+
+    return head, tail, render_rows, chunk_size
@@ -0,0 +1,121 @@
+import threading
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.template import TemplateDoesNotExist, engines
+from django.template.backends import django as django_backend
+from django.template.loaders import cached
+
+_lock = threading.Lock()
+
+# Tiempo de compilación (ms) de cada template y cantidad y tiempo total (ms) de sus renderizados
+compile_times = {}
+render_times = {}
+
+
+def record_compile(name, elapsed):
+    """
+    Registra el tiempo de compilación de un template, en segundos.
+    """
+    with _lock:
+        compile_times[name] = elapsed * 1000
+
+
+def record_render(name, elapsed):
+    """
+    Registra el tiempo de un renderizado de un template, en segundos.
+    """
+    with _lock:
+        count, total = render_times.get(name, (0, 0.0))
+        render_times[name] = (count + 1, total + elapsed * 1000)
+
+
+def template_metrics():
+    """
+    Reúne los tiempos de compilación y de renderizado de los templates de este proceso.
+
+    Returns:
+        dict: Los templates compilados con su tiempo, el tiempo total de compilación y,
+        por cada template renderizado, la cantidad de renderizados y su tiempo promedio.
+    """
+    with _lock:
+        compiled = dict(compile_times)
+        rendered = dict(render_times)
+
+    return {
+        "compiled": len(compiled),
+        "compile_ms": round(sum(compiled.values()), 3),
+        "compile_ms_by_template": {name: round(ms, 3) for name, ms in sorted(compiled.items())},
+        "renders": {
+            name: {"count": count, "total_ms": round(total, 3), "avg_ms": round(total / count, 3)}
+            for name, (count, total) in sorted(rendered.items())
+        },
+    }
+
+
+class CachedLoader(cached.Loader):
+    """
+    Loader con cache de templates compilados que mide cuánto tarda compilar cada uno.
+
+    Solo se compila la primera vez que se pide un template; las siguientes se sirven
+    desde la memoria del proceso.
+    """
+
+    def get_template(self, template_name, skip=None):
+        """Obtiene un template compilado, registrando el tiempo si no estaba en la cache."""
+        key = self.cache_key(template_name, skip)
+        if key in self.get_template_cache:
+            return super().get_template(template_name, skip)
+
+        start = time.perf_counter()
+        template = super().get_template(template_name, skip)
+        record_compile(template_name, time.perf_counter() - start)
+        return template
+
+
+class Template(django_backend.Template):
+    """
+    Template del backend de Django que mide el tiempo de cada renderizado.
+    """
+
+    def render(self, context=None, request=None):
+        """Renderiza el template y registra cuánto tardó."""
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            record_render(self.origin.template_name, time.perf_counter() - start)
+
+
+class DjangoTemplates(django_backend.DjangoTemplates):
+    """
+    Backend de templates de Django que registra el tiempo de renderizado de cada template.
+    """
+
+    def get_template(self, template_name):
+        """Obtiene un template envuelto para medir sus renderizados."""
+        try:
+            return Template(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            django_backend.reraise(exc, self)
+
+
+def warm_up():
+    """
+    Compila todos los templates de app/templates para que ninguna request pague su compilación.
+
+    Con `preload_app` de gunicorn se ejecuta una sola vez antes de crear los procesos,
+    que comparten los templates ya compilados.
+
+    Returns:
+        int: La cantidad de templates compilados.
+    """
+    directory = Path(apps.get_app_config("app").path) / "templates"
+    engine = engines["django"]
+    names = sorted(path.relative_to(directory).as_posix() for path in directory.rglob("*.html"))
+
+    for name in names:
+        engine.get_template(name)
+
+    return len(names)
@@ -1,9 +1,28 @@
 import datetime
-
+import gzip
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+import brotli
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.cache.utils import make_template_fragment_key
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.http import Http404
 from django.shortcuts import reverse
-from django.test import TestCase
+from django.templatetags.static import static
+from django.test import AsyncRequestFactory, RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from whitenoise.middleware import WhiteNoiseMiddleware
 
+from app import async_views
+from app.compression import CompressionMiddleware
 from app.models import Client, Medicine, Pet, Product, Provider, Speciality, Vet
+from app.page_cache import CSRF_PLACEHOLDER
 
 
 class HomePageTest(TestCase):
@@ -789,4 +808,1214 @@ class MedicinesTest(TestCase):
         editedMedicine = Medicine.objects.get(pk=medicine.id)
         self.assertEqual(editedMedicine.name, medicine.name)
         self.assertEqual(editedMedicine.description, medicine.description)
-        self.assertEqual(editedMedicine.dose, 3)
\ No newline at end of file
+        self.assertEqual(editedMedicine.dose, 3)
+
+
+@override_settings(REPOSITORY_PAGE_SIZE=2)
+class RepositoryPaginationTest(TestCase):
+    """
+    Pruebas para la paginación por cursor de los listados.
+    """
+
+    def test_repo_shows_one_page_and_next_link(self):
+        """Prueba que el listado muestre solo una página y el link a la siguiente."""
+        pets = [
+            Pet.objects.create(name=name, breed="Labrador", birthday="2020-01-01")
+            for name in ("Firulais", "Michi", "Manchas")
+        ]
+
+        response = self.client.get(reverse("pets_repo"))
+
+        self.assertContains(response, "Firulais")
+        self.assertContains(response, "Michi")
+        self.assertNotContains(response, "Manchas")
+        self.assertContains(response, f"?after={pets[1].id}")
+
+    def test_repo_next_page_uses_cursor(self):
+        """Prueba que el cursor de la URL muestre la página siguiente."""
+        pets = [
+            Pet.objects.create(name=name, breed="Labrador", birthday="2020-01-01")
+            for name in ("Firulais", "Michi", "Manchas")
+        ]
+
+        response = self.client.get(reverse("pets_repo"), {"after": pets[1].id})
+
+        self.assertNotContains(response, "Firulais")
+        self.assertContains(response, "Manchas")
+        self.assertContains(response, f"?before={pets[2].id}")
+
+    def test_repo_page_runs_a_single_query(self):
+        """Prueba que el costo de la página sea una única consulta."""
+        for number in range(5):
+            Vet.objects.create(
+                name=f"Vet {number}",
+                email="vet@hotmail.com",
+                phone="221555232",
+                speciality=Speciality.Urgencias.value,
+            )
+
+        with self.assertNumQueries(1):
+            self.client.get(reverse("vets_repo"), {"after": 1})
+
+
+@override_settings(REPOSITORY_STREAM_CHUNK_SIZE=2)
+class RepositoryStreamingTest(TestCase):
+    """
+    Pruebas para el listado completo en modo streaming.
+    """
+
+    def test_stream_renders_every_row_in_chunks(self):
+        """Prueba que el modo streaming emita todas las filas, sin paginar."""
+        for number in range(5):
+            Product.objects.create(name=f"Producto {number}", type="Alimento", price=10)
+
+        response = self.client.get(reverse("products_repo"), {"stream": "1"})
+
+        self.assertTrue(response.streaming)
+        chunks = [chunk.decode() for chunk in response.streaming_content]
+        content = "".join(chunks)
+
+        for number in range(5):
+            self.assertIn(f"Producto {number}", content)
+        self.assertIn("</html>", content)
+        self.assertNotIn("pagination-next", content)
+        # encabezado, tres bloques de filas y pie
+        self.assertEqual(len(chunks), 5)
+
+    def test_stream_shows_empty_message(self):
+        """Prueba que el modo streaming muestre el mensaje de listado vacío."""
+        response = self.client.get(reverse("clients_repo"), {"stream": "1"})
+
+        content = b"".join(response.streaming_content).decode()
+
+        self.assertIn("No existen clientes", content)
+
+    def test_stream_rows_include_csrf_token(self):
+        """Prueba que los formularios de eliminación del modo streaming lleven el token CSRF."""
+        Vet.objects.create(
+            name="Vet",
+            email="vet@hotmail.com",
+            phone="221555232",
+            speciality=Speciality.Urgencias.value,
+        )
+
+        response = self.client.get(reverse("vets_repo"), {"stream": "1"})
+
+        content = b"".join(response.streaming_content).decode()
+
+        self.assertIn('name="csrfmiddlewaretoken"', content)
+
+
+class RepositorySearchTest(TestCase):
+    """
+    Pruebas para la búsqueda en los listados.
+    """
+
+    def test_repo_filters_by_search_query(self):
+        """Prueba que el listado muestre solo los registros que coinciden con la búsqueda."""
+        Provider.objects.create(name="Distribuidora Norte", email="norte@mail.com", address="7 y 50")
+        Provider.objects.create(name="Laboratorio Sur", email="sur@mail.com", address="1 y 60")
+
+        response = self.client.get(reverse("providers_repo"), {"q": "norte"})
+
+        self.assertContains(response, "Distribuidora Norte")
+        self.assertNotContains(response, "Laboratorio Sur")
+        self.assertContains(response, 'value="norte"')
+
+    def test_repo_search_keeps_query_in_pagination_links(self):
+        """Prueba que los links de paginación conserven la búsqueda."""
+        for number in range(3):
+            Medicine.objects.create(name=f"Meloxicam {number}", description="Analgesico", dose=2)
+
+        with self.settings(REPOSITORY_PAGE_SIZE=2):
+            response = self.client.get(reverse("medicine_repo"), {"q": "melox"})
+
+        self.assertContains(response, "q=melox")
+        self.assertContains(response, "after=")
+
+
+class ImportRecordsCommandTest(TestCase):
+    """
+    Pruebas para el comando de importación masiva de registros.
+    """
+
+    def write_file(self, name, content):
+        """Escribe un archivo temporal con el contenido indicado y retorna su ruta."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_import_clients_from_csv(self):
+        """Prueba que se importen los clientes válidos de un CSV y se informen los inválidos."""
+        path = self.write_file(
+            "clientes.csv",
+            "name,phone,email,address\n"
+            "Juan Sebastian Veron,221555232,brujita75@hotmail.com,13 y 44\n"
+            "Guido Carrillo,221232555,goleador,1 y 57\n"
+            "Martin Palermo,221444111,titan@gmail.com,\n",
+        )
+        stdout, stderr = StringIO(), StringIO()
+
+        call_command("import_records", "clients", path, batch_size=2, stdout=stdout, stderr=stderr)
+
+        self.assertEqual(
+            list(Client.objects.values_list("name", flat=True)),
+            ["Juan Sebastian Veron", "Martin Palermo"],
+        )
+        self.assertEqual(Client.objects.get(name="Martin Palermo").address, "")
+        self.assertIn("Fila 3: email: Por favor ingrese un email valido", stderr.getvalue())
+        self.assertIn("Se importaron 2 clientes (1 filas con errores)", stdout.getvalue())
+
+    def test_import_products_from_jsonl(self):
+        """Prueba que se importen productos desde un archivo JSONL con valores numéricos."""
+        path = self.write_file(
+            "productos.jsonl",
+            '{"name": "Collar", "type": "Accesorio", "price": 150.5}\n'
+            "\n"
+            '{"name": "Alimento", "type": "Comida", "price": 0}\n',
+        )
+        stderr = StringIO()
+
+        call_command("import_records", "products", path, stdout=StringIO(), stderr=stderr)
+
+        product = Product.objects.get()
+        self.assertEqual(product.name, "Collar")
+        self.assertEqual(product.price, 150.5)
+        self.assertIn("Fila 3: price: Por favor ingrese un precio mayor a cero", stderr.getvalue())
+
+    def test_import_skips_malformed_jsonl_lines(self):
+        """Prueba que las líneas JSONL mal formadas o que no son objetos se informen y se omitan."""
+        path = self.write_file(
+            "productos.jsonl",
+            '{"name": "Collar", "type": "Accesorio", "price": 150.5}\n'
+            '{"name": "Correa", "type": \n'
+            "[1, 2]\n"
+            "42\n"
+            '{"name": "Alimento", "type": "Comida", "price": 10}\n',
+        )
+        stdout, stderr = StringIO(), StringIO()
+
+        call_command("import_records", "products", path, batch_size=2, stdout=stdout, stderr=stderr)
+
+        self.assertEqual(list(Product.objects.order_by("id").values_list("name", flat=True)), ["Collar", "Alimento"])
+        self.assertIn("Fila 2: JSON inválido", stderr.getvalue())
+        self.assertIn("Fila 3: El registro debe ser un objeto", stderr.getvalue())
+        self.assertIn("Fila 4: El registro debe ser un objeto", stderr.getvalue())
+        self.assertIn("Se importaron 2 productos (3 filas con errores)", stdout.getvalue())
+
+    def test_import_csv_rows_are_numbered_by_line(self):
+        """Prueba que las filas de un CSV se numeren por su línea, también con valores de varias líneas."""
+        path = self.write_file(
+            "clientes.csv",
+            "name,phone,email,address\n"
+            'Juan Sebastian Veron,221555232,brujita75@hotmail.com,"13 y 44\nLa Plata"\n'
+            "Guido Carrillo,221232555,goleador,1 y 57\n",
+        )
+        stderr = StringIO()
+
+        call_command("import_records", "clients", path, stdout=StringIO(), stderr=stderr)
+
+        self.assertIn("Fila 4: email: Por favor ingrese un email valido", stderr.getvalue())
+
+    def test_import_pets_from_json(self):
+        """Prueba que se importen mascotas desde un archivo JSON con formato explícito."""
+        path = self.write_file(
+            "mascotas.txt",
+            '[{"name": "Firulais", "breed": "Labrador", "birthday": "2020-01-01"}]',
+        )
+
+        call_command("import_records", "pets", path, format="json", stdout=StringIO())
+
+        self.assertEqual(Pet.objects.get().birthday, datetime.date(2020, 1, 1))
+
+    def test_import_rejects_unknown_format(self):
+        """Prueba que se rechace un archivo con un formato desconocido."""
+        path = self.write_file("mascotas.txt", "")
+
+        with self.assertRaises(CommandError):
+            call_command("import_records", "pets", path)
+
+
+class ExportRecordsTest(TestCase):
+    """
+    Pruebas para la exportación de registros en CSV y JSONL.
+    """
+
+    def setUp(self):
+        """Crea dos medicinas para exportar."""
+        self.meloxicam = Medicine.objects.create(name="Meloxicam", description="Antiinflamatorio, analgesico", dose=2)
+        self.rostrum = Medicine.objects.create(name="Rostrum", description="Antibacteriano", dose=8)
+
+    def test_export_csv_endpoint(self):
+        """Prueba que el endpoint de exportación emita un CSV con todas las filas."""
+        response = self.client.get(reverse("medicine_export"))
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn('filename="medicine.csv"', response["Content-Disposition"])
+        content = b"".join(response.streaming_content).decode()
+        self.assertEqual(
+            content.splitlines(),
+            [
+                "id,name,description,dose",
+                f'{self.meloxicam.id},Meloxicam,"Antiinflamatorio, analgesico",2',
+                f"{self.rostrum.id},Rostrum,Antibacteriano,8",
+            ],
+        )
+
+    def test_export_jsonl_gzip_endpoint(self):
+        """Prueba que el endpoint de exportación emita JSONL comprimido con gzip."""
+        response = self.client.get(reverse("medicine_export"), {"format": "jsonl", "gzip": "1", "q": "rostrum"})
+
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        content = gzip.decompress(b"".join(response.streaming_content)).decode()
+        self.assertEqual(
+            [json.loads(line) for line in content.splitlines()],
+            [{"id": self.rostrum.id, "name": "Rostrum", "description": "Antibacteriano", "dose": 8}],
+        )
+
+    def test_export_rejects_unknown_format(self):
+        """Prueba que el endpoint de exportación rechace un formato desconocido."""
+        response = self.client.get(reverse("medicine_export"), {"format": "xml"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_command_writes_jsonl_to_stdout(self):
+        """Prueba que el comando de exportación escriba JSONL en la salida estándar."""
+        Pet.objects.create(name="Firulais", breed="Labrador", birthday="2020-01-01")
+        stdout = StringIO()
+
+        call_command("export_records", "pets", format="jsonl", stdout=stdout)
+
+        record = json.loads(stdout.getvalue())
+        self.assertEqual(record["birthday"], "2020-01-01")
+
+    def test_export_command_writes_gzip_file(self):
+        """Prueba que el comando de exportación escriba un archivo CSV comprimido."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        output = Path(directory.name) / "medicine.csv.gz"
+
+        call_command("export_records", "medicine", output=output, gzip=True)
+
+        with gzip.open(output, "rt") as file:
+            self.assertEqual(len(file.read().splitlines()), 3)
+
+    def test_export_command_requires_output_for_gzip(self):
+        """Prueba que el comando exija un archivo de salida al comprimir."""
+        with self.assertRaises(CommandError):
+            call_command("export_records", "medicine", gzip=True)
+
+
+class RecordsApiTest(TestCase):
+    """
+    Pruebas para la API JSON con operaciones por lotes.
+    """
+
+    def request(self, method, entity, data):
+        """Envía una request JSON a la API de la entidad indicada."""
+        return getattr(self.client, method)(
+            reverse("api_records", kwargs={"entity": entity}),
+            data=json.dumps(data),
+            content_type="application/json",
+        )
+
+    def test_create_batch_in_one_request(self):
+        """Prueba que se cree un lote de clientes en una sola request."""
+        response = self.request(
+            "post",
+            "clients",
+            [
+                {"name": "Juan Sebastian Veron", "phone": "221555232", "email": "brujita75@hotmail.com"},
+                {"name": "Guido Carrillo", "phone": 221232555, "email": "goleador@gmail.com", "address": "1 y 57"},
+            ],
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["created"], 2)
+        self.assertEqual(
+            list(Client.objects.values_list("id", flat=True)), response.json()["ids"]
+        )
+        self.assertEqual(Client.objects.get(name="Guido Carrillo").phone, "221232555")
+
+    def test_create_batch_is_atomic(self):
+        """Prueba que si un registro es inválido no se guarde ninguno."""
+        response = self.request(
+            "post",
+            "pets",
+            [
+                {"name": "Firulais", "breed": "Labrador", "birthday": "2020-01-01"},
+                {"name": "", "breed": "Labrador", "birthday": "2020-01-01"},
+            ],
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"errors": {"1": {"name": "Por favor ingrese un nombre"}}})
+        self.assertEqual(Pet.objects.count(), 0)
+
+    def test_update_batch_keeps_missing_fields(self):
+        """Prueba que se actualice un lote y los campos no enviados conserven su valor."""
+        collar = Product.objects.create(name="Collar", type="Accesorio", price=10)
+        alimento = Product.objects.create(name="Alimento", type="Comida", price=20)
+
+        response = self.request(
+            "patch",
+            "products",
+            [{"id": collar.id, "price": 15.5}, {"id": alimento.id, "name": "Alimento balanceado"}],
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"updated": 2})
+        collar.refresh_from_db()
+        alimento.refresh_from_db()
+        self.assertEqual((collar.name, collar.price), ("Collar", 15.5))
+        self.assertEqual((alimento.name, alimento.price), ("Alimento balanceado", 20))
+
+    def test_update_batch_reports_missing_ids(self):
+        """Prueba que actualizar un id inexistente no guarde ningún cambio."""
+        collar = Product.objects.create(name="Collar", type="Accesorio", price=10)
+
+        response = self.request(
+            "patch", "products", [{"id": collar.id, "price": 99}, {"id": 1000, "price": 1}]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("id", response.json()["errors"]["1"])
+        collar.refresh_from_db()
+        self.assertEqual(collar.price, 10)
+
+    def test_delete_batch(self):
+        """Prueba que se elimine un lote de registros a partir de sus ids."""
+        providers = [
+            Provider.objects.create(name=f"Proveedor {number}", email="p@mail.com", address="7 y 50")
+            for number in range(3)
+        ]
+
+        response = self.request("delete", "providers", [providers[0].id, providers[2].id])
+
+        self.assertEqual(response.json(), {"deleted": 2})
+        self.assertEqual(list(Provider.objects.all()), [providers[1]])
+
+    def test_list_records(self):
+        """Prueba que se listen los registros paginados y filtrados."""
+        Vet.objects.create(name="Ana", email="ana@mail.com", phone="221555232", speciality="Radiologia")
+        Vet.objects.create(name="Bruno", email="bruno@mail.com", phone="221555233", speciality="Urgencias")
+
+        response = self.client.get(reverse("api_records", kwargs={"entity": "vets"}), {"q": "bruno"})
+
+        self.assertEqual(
+            [vet["name"] for vet in response.json()["results"]], ["Bruno"]
+        )
+        self.assertIsNone(response.json()["next"])
+
+    def test_rejects_non_json_body(self):
+        """Prueba que se rechacen escrituras que no sean JSON."""
+        response = self.client.post(
+            reverse("api_records", kwargs={"entity": "clients"}), data={"name": "Juan"}
+        )
+
+        self.assertEqual(response.status_code, 415)
+
+    def test_rejects_non_list_body(self):
+        """Prueba que se rechace un cuerpo que no sea una lista."""
+        response = self.request("post", "clients", {"name": "Juan"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_entity_returns_404(self):
+        """Prueba que una entidad inexistente responda 404."""
+        response = self.client.get(reverse("api_records", kwargs={"entity": "turnos"}))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_unsupported_method_returns_405(self):
+        """Prueba que un método no soportado responda 405."""
+        response = self.request("put", "clients", [])
+
+        self.assertEqual(response.status_code, 405)
+
+
+@override_settings(BULK_DELETE_BATCH_SIZE=2)
+class BulkDeleteTest(TestCase):
+    """
+    Pruebas para la eliminación de los registros seleccionados en un listado.
+    """
+
+    def test_bulk_delete_removes_selected_records_in_batches(self):
+        """Prueba que se eliminen los registros seleccionados con una consulta por lote."""
+        clients = [
+            Client.objects.create(name=f"Cliente {number}", phone="221555232", email="c@mail.com")
+            for number in range(5)
+        ]
+        selected = [str(client.id) for client in clients[:4]]
+
+        # un SELECT (para buscar sus mascotas), un UPDATE (que deja sin dueño a sus mascotas) y un
+        # DELETE por cada lote de dos ids, dentro de un savepoint
+        with self.assertNumQueries(8):
+            response = self.client.post(reverse("clients_bulk_delete"), {"ids": selected})
+
+        self.assertRedirects(response, reverse("clients_repo"))
+        self.assertEqual(list(Client.objects.all()), clients[4:])
+
+    @override_settings(BULK_DELETE_BATCH_SIZE=500)
+    def test_bulk_delete_runs_one_delete_per_batch_and_invalidates_once(self):
+        """Prueba que los registros sin relaciones se eliminen sin leerlos y que el listado se invalide una vez."""
+        Product.objects.bulk_create(
+            Product(name=f"Producto {number}", type="Alimento", price=10) for number in range(900)
+        )
+        selected = [str(pk) for pk in Product.objects.values_list("pk", flat=True)]
+
+        with patch("app.page_cache.bump_generation") as bump_generation:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                # un DELETE por cada lote de 500 ids, dentro de un savepoint
+                with self.assertNumQueries(4):
+                    self.client.post(reverse("products_bulk_delete"), {"ids": selected})
+
+        self.assertFalse(Product.objects.exists())
+        self.assertEqual(len(callbacks), 1)
+        bump_generation.assert_called_once_with("products")
+
+    def test_bulk_delete_accepts_more_ids_than_the_field_limit_in_one_field(self):
+        """Prueba que se puedan eliminar más de DATA_UPLOAD_MAX_NUMBER_FIELDS registros, con los ids separados por comas."""
+        Product.objects.bulk_create(
+            Product(name=f"Producto {number}", type="Alimento", price=10) for number in range(1200)
+        )
+        selected = ",".join(str(pk) for pk in Product.objects.values_list("pk", flat=True))
+
+        response = self.client.post(reverse("products_bulk_delete"), {"ids": selected}, follow=True)
+
+        self.assertContains(response, "Se eliminaron 1200 productos")
+        self.assertFalse(Product.objects.exists())
+
+    def test_repo_submits_selected_ids_in_one_field(self):
+        """Prueba que el listado incluya el script que envía los ids seleccionados en un solo campo."""
+        response = self.client.get(reverse("products_repo"))
+
+        self.assertContains(response, 'event.formData.set("ids", event.formData.getAll("ids").join(","))')
+
+    def test_bulk_delete_shows_count_summary(self):
+        """Prueba que se informe la cantidad de registros eliminados."""
+        pets = [
+            Pet.objects.create(name=name, breed="Labrador", birthday="2020-01-01")
+            for name in ("Firulais", "Michi")
+        ]
+
+        response = self.client.post(
+            reverse("pets_bulk_delete"), {"ids": [pet.id for pet in pets] + [1000]}, follow=True
+        )
+
+        self.assertContains(response, "Se eliminaron 2 mascotas")
+        self.assertEqual(Pet.objects.count(), 0)
+
+    def test_bulk_delete_without_selection_warns(self):
+        """Prueba que se avise cuando no se seleccionó ningún registro."""
+        response = self.client.post(reverse("vets_bulk_delete"), {}, follow=True)
+
+        self.assertContains(response, "No se seleccionaron veterinarios para eliminar")
+
+    def test_bulk_delete_requires_post(self):
+        """Prueba que la eliminación masiva no se pueda hacer con GET."""
+        response = self.client.get(reverse("products_bulk_delete"))
+
+        self.assertEqual(response.status_code, 405)
+
+    def test_repo_renders_selection_checkboxes(self):
+        """Prueba que el listado muestre una casilla de selección por registro."""
+        medicine = Medicine.objects.create(name="Meloxicam", description="Analgesico", dose=2)
+
+        response = self.client.get(reverse("medicine_repo"))
+
+        self.assertContains(response, f'name="ids"\n                value="{medicine.id}"')
+        self.assertContains(response, reverse("medicine_bulk_delete"))
+
+
+class ConcurrentEditTest(TestCase):
+    """
+    Pruebas para la edición concurrente de registros desde los formularios.
+    """
+
+    def test_form_includes_version(self):
+        """Prueba que el formulario de edición incluya la versión del registro."""
+        client = Client.objects.create(name="Juan", phone="221555232", email="juan@mail.com")
+
+        response = self.client.get(reverse("clients_edit", kwargs={"id": client.id}))
+
+        self.assertContains(response, 'value="1" name="version"')
+
+    def test_stale_form_shows_conflict(self):
+        """Prueba que guardar un formulario desactualizado muestre el conflicto y no pise los cambios."""
+        client = Client.objects.create(name="Juan", phone="221555232", email="juan@mail.com")
+        Client.objects.filter(pk=client.pk).update(name="Juan Carlos", version=2)
+
+        response = self.client.post(
+            reverse("clients_form"),
+            data={"id": client.id, "version": "1", "name": "Juan Pablo", "phone": "221555232", "email": "juan@mail.com"},
+        )
+
+        self.assertContains(response, "El registro fue modificado por otra persona")
+        self.assertEqual(Client.objects.get(pk=client.pk).name, "Juan Carlos")
+
+    def test_edit_missing_record_returns_404(self):
+        """Prueba que editar un registro inexistente responda 404."""
+        response = self.client.post(
+            reverse("products_form"),
+            data={"id": 1000, "name": "Collar", "type": "Accesorio", "price": "10"},
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_api_update_checks_version(self):
+        """Prueba que la API rechace actualizar un registro con una versión desactualizada."""
+        product = Product.objects.create(name="Collar", type="Accesorio", price=10, version=3)
+
+        response = self.client.patch(
+            reverse("api_records", kwargs={"entity": "products"}),
+            data=json.dumps([{"id": product.id, "version": 2, "price": 20}]),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("version", response.json()["errors"]["0"])
+
+
+class MetricsTest(TestCase):
+    """
+    Pruebas para el endpoint de métricas.
+    """
+
+    def setUp(self):
+        """Inicia sesión con un usuario staff, que puede ver las métricas."""
+        self.client.force_login(User.objects.create_user("admin", is_staff=True))
+
+    def test_metrics_hidden_from_anonymous_and_non_staff_users(self):
+        """Prueba que las métricas no existan para los usuarios anónimos ni para los que no son staff."""
+        self.client.logout()
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 404)
+
+        self.client.force_login(User.objects.create_user("recepcion"))
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 404)
+
+    @override_settings(METRICS_PUBLIC=True)
+    def test_metrics_can_be_public(self):
+        """Prueba que con METRICS_PUBLIC las métricas se vean sin autenticación."""
+        self.client.logout()
+
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 200)
+
+    def test_metrics_reports_database_connections(self):
+        """Prueba que las métricas informen la configuración y el estado de la conexión."""
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        database = response.json()["database"]["default"]
+        self.assertEqual(database["vendor"], "sqlite")
+        self.assertEqual(database["conn_max_age"], 0)
+        self.assertTrue(database["connected"])
+        self.assertEqual(database["pragmas"]["busy_timeout"], 5000)
+        self.assertNotIn("pool", database)
+
+    def test_metrics_reports_template_render_times(self):
+        """Prueba que las métricas informen los renderizados de cada template."""
+        self.client.get(reverse("home"))
+
+        templates = self.client.get(reverse("metrics")).json()["templates"]
+
+        self.assertGreaterEqual(templates["renders"]["home.html"]["count"], 1)
+        self.assertIn("avg_ms", templates["renders"]["home.html"])
+
+
+@override_settings(REPOSITORY_CACHE_TIMEOUT=60)
+class RepositoryCacheTest(TestCase):
+    """
+    Pruebas para la cache de las páginas de los listados.
+    """
+
+    def setUp(self):
+        """Vacía la cache para que cada prueba comience sin páginas guardadas."""
+        cache.clear()
+
+    def test_repeated_page_is_served_from_cache(self):
+        """Prueba que una página ya visitada se sirva sin consultar la base."""
+        Client.objects.create(name="Juan Sebastian Veron", phone="221555232", email="brujita75@hotmail.com")
+        url = reverse("clients_repo")
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+
+        self.assertContains(response, "Juan Sebastian Veron")
+
+    def test_query_params_are_part_of_the_key(self):
+        """Prueba que cada búsqueda se guarde por separado."""
+        Client.objects.create(name="Juan", phone="221555232", email="juan@mail.com")
+        Client.objects.create(name="Pedro", phone="221555233", email="pedro@mail.com")
+        self.client.get(reverse("clients_repo"), {"q": "juan"})
+
+        response = self.client.get(reverse("clients_repo"), {"q": "pedro"})
+
+        self.assertContains(response, "Pedro")
+        self.assertNotContains(response, "juan@mail.com")
+
+    def test_save_and_delete_invalidate_the_entity(self):
+        """Prueba que guardar o eliminar un registro invalide solo los listados de su modelo."""
+        with self.captureOnCommitCallbacks(execute=True):
+            client = Client.objects.create(name="Juan", phone="221555232", email="juan@mail.com")
+        self.client.get(reverse("clients_repo"))
+        self.client.get(reverse("vets_repo"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Client.objects.create(name="Pedro", phone="221555233", email="pedro@mail.com")
+        self.assertContains(self.client.get(reverse("clients_repo")), "Pedro")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            client.delete()
+        self.assertNotContains(self.client.get(reverse("clients_repo")), "juan@mail.com")
+
+        with self.assertNumQueries(0):
+            self.client.get(reverse("vets_repo"))
+
+    def test_changes_in_a_transaction_invalidate_each_listing_once(self):
+        """Prueba que guardar y eliminar varios registros en una transacción invalide cada listado una sola vez."""
+        with patch("app.page_cache.bump_generation") as bump_generation:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                clients = [
+                    Client.objects.create(name=f"Cliente {number}", phone="221555232", email="c@mail.com")
+                    for number in range(3)
+                ]
+                Vet.objects.create(name="Carlos Bilardo", email="carlos@mail.com", phone="221555233", speciality="Urgencias")
+                clients[0].delete()
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(sorted(call.args[0] for call in bump_generation.call_args_list), ["clients", "pets", "vets"])
+
+    def test_update_without_signals_invalidates(self):
+        """Prueba que las actualizaciones con un UPDATE directo también invaliden la página."""
+        with self.captureOnCommitCallbacks(execute=True):
+            client = Client.objects.create(name="Juan", phone="221555232", email="juan@mail.com")
+        self.client.get(reverse("clients_repo"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Client.update_client_by_id(
+                client.id, {"name": "Juan Carlos", "phone": "221555232", "email": "juan@mail.com"}
+            )
+
+        self.assertContains(self.client.get(reverse("clients_repo")), "Juan Carlos")
+
+    def test_cached_page_uses_request_csrf_token(self):
+        """Prueba que la página en cache lleve el token CSRF de cada request."""
+        Client.objects.create(name="Juan", phone="221555232", email="juan@mail.com")
+        self.client.get(reverse("clients_repo"))
+
+        response = self.client.get(reverse("clients_repo"))
+
+        self.assertNotContains(response, CSRF_PLACEHOLDER)
+        self.assertContains(response, 'name="csrfmiddlewaretoken"')
+        self.assertIn("csrftoken", response.cookies)
+
+    def test_messages_bypass_cache(self):
+        """Prueba que una página con mensajes pendientes no se sirva ni se guarde en cache."""
+        clients = [
+            Client.objects.create(name=f"Cliente {number}", phone="221555232", email="c@mail.com")
+            for number in range(2)
+        ]
+        self.client.get(reverse("clients_repo"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("clients_bulk_delete"), {"ids": [str(clients[0].id)]}, follow=True
+            )
+
+        self.assertContains(response, "Se eliminaron 1 clientes")
+        self.assertNotContains(self.client.get(reverse("clients_repo")), "Se eliminaron")
+
+
+class FragmentCacheTest(TestCase):
+    """
+    Pruebas para los fragmentos de templates guardados en cache.
+    """
+
+    def setUp(self):
+        """Vacía la cache de fragmentos."""
+        caches["fragments"].clear()
+
+    def test_navbar_is_cached_per_section(self):
+        """Prueba que la navbar se guarde por sección y marque la sección activa de cada página."""
+        self.client.get(reverse("clients_repo"))
+        response = self.client.get(reverse("clients_form"))
+
+        self.assertIsNotNone(caches["fragments"].get(make_template_fragment_key("navbar", ["/clientes/"])))
+        self.assertContains(response, 'class="nav-link active"\n                   aria-current="page"\n                   href="/clientes/"')
+
+        response = self.client.get(reverse("vets_repo"))
+
+        self.assertContains(response, 'class="nav-link active"\n                   aria-current="page"\n                   href="/vets/"')
+        self.assertNotContains(response, 'class="nav-link active"\n                   aria-current="page"\n                   href="/clientes/"')
+
+    def test_home_cards_are_cached(self):
+        """Prueba que las cards del inicio se rendericen una vez y luego se sirvan desde la cache."""
+        self.client.get(reverse("home"))
+
+        self.assertIsNotNone(caches["fragments"].get(make_template_fragment_key("home_cards")))
+        self.assertContains(self.client.get(reverse("home")), 'data-testid="home-Clientes"')
+
+
+@override_settings(REPOSITORY_PAGE_SIZE=2)
+class AsyncViewsTest(TestCase):
+    """
+    Pruebas para las variantes asíncronas de las vistas de listados y formularios.
+    """
+
+    def setUp(self):
+        """Prepara la factory de requests asíncronas."""
+        self.factory = AsyncRequestFactory()
+
+    async def test_repository_paginates_with_async_orm(self):
+        """Prueba que el listado asíncrono muestre la primera página y el link a la siguiente."""
+        for number in range(3):
+            await Client.objects.acreate(name=f"Cliente {number}", phone="221555232", email="c@mail.com")
+
+        response = await async_views.clients_repository(self.factory.get(reverse("clients_repo")))
+
+        self.assertContains(response, "Cliente 1")
+        self.assertNotContains(response, "Cliente 2")
+        self.assertContains(response, 'data-testid="pagination-next"')
+
+    async def test_repository_streams_with_async_iteration(self):
+        """Prueba que el listado completo se emita con iteración asíncrona."""
+        for number in range(3):
+            await Vet.objects.acreate(name=f"Vet {number}", email="v@mail.com", phone="221555232", speciality="Urgencias")
+
+        response = await async_views.vets_repository(self.factory.get(reverse("vets_repo"), {"stream": "1"}))
+        content = b"".join([chunk async for chunk in response.streaming_content]).decode()
+
+        for number in range(3):
+            self.assertIn(f"Vet {number}", content)
+
+    async def test_form_creates_and_updates(self):
+        """Prueba que el formulario asíncrono cree y actualice registros."""
+        data = {"id": "", "name": "Collar", "type": "Accesorio", "price": "10"}
+
+        response = await async_views.products_form(self.factory.post(reverse("products_form"), data))
+
+        self.assertEqual(response.status_code, 302)
+        product = await Product.objects.aget(name="Collar")
+
+        data.update({"id": product.id, "version": "1", "price": "15"})
+        await async_views.products_form(self.factory.post(reverse("products_form"), data))
+
+        await product.arefresh_from_db()
+        self.assertEqual(product.price, 15)
+        self.assertEqual(product.version, 2)
+
+    async def test_form_creates_and_updates_pet_with_owner_and_vet(self):
+        """Prueba que el formulario asíncrono verifique el dueño y el veterinario con el ORM asíncrono."""
+        owner = await Client.objects.acreate(name="Juan Sebastian Veron", phone="221555232", email="juan@mail.com")
+        vet = await Vet.objects.acreate(name="Carlos Bilardo", email="carlos@mail.com", phone="221555233", speciality="Urgencias")
+        other = await Client.objects.acreate(name="Martin Palermo", phone="221555234", email="martin@mail.com")
+        data = {
+            "id": "", "name": "Firulais", "breed": "Mestizo", "birthday": "2020-01-01",
+            "owner_id": str(owner.id), "vet_id": str(vet.id),
+        }
+
+        response = await async_views.pets_form(self.factory.post(reverse("pets_form"), data))
+
+        self.assertEqual(response.status_code, 302)
+        pet = await Pet.objects.aget(name="Firulais")
+        self.assertEqual((pet.owner_id, pet.vet_id), (owner.id, vet.id))
+
+        data.update({"id": pet.id, "version": "1", "owner_id": str(other.id)})
+        response = await async_views.pets_form(self.factory.post(reverse("pets_form"), data))
+
+        self.assertEqual(response.status_code, 302)
+        await pet.arefresh_from_db()
+        self.assertEqual((pet.owner_id, pet.vet_id, pet.version), (other.id, vet.id, 2))
+
+        data.update({"version": "2", "vet_id": "1000"})
+        invalid = await async_views.pets_form(self.factory.post(reverse("pets_form"), data))
+
+        self.assertContains(invalid, "Por favor seleccione un veterinario válido")
+
+    async def test_form_shows_errors_and_conflicts(self):
+        """Prueba que el formulario asíncrono muestre los errores y los conflictos de versión."""
+        pet = await Pet.objects.acreate(name="Firulais", breed="Mestizo", birthday="2020-01-01", version=2)
+
+        invalid = await async_views.pets_form(self.factory.post(reverse("pets_form"), {"id": ""}))
+        stale = await async_views.pets_form(
+            self.factory.post(
+                reverse("pets_form"),
+                {"id": pet.id, "version": "1", "name": "Toby", "breed": "Mestizo", "birthday": "2020-01-01"},
+            )
+        )
+
+        self.assertContains(invalid, "Por favor ingrese un nombre")
+        self.assertContains(stale, "El registro fue modificado por otra persona")
+
+    async def test_form_edit_missing_record_returns_404(self):
+        """Prueba que editar un registro inexistente responda 404."""
+        with self.assertRaises(Http404):
+            await async_views.clients_form(self.factory.get("/"), id=1000)
+
+    async def test_delete(self):
+        """Prueba que la vista asíncrona elimine el registro indicado."""
+        provider = await Provider.objects.acreate(name="Pedigree", email="p@mail.com", address="Calle 1")
+
+        response = await async_views.providers_delete(
+            self.factory.post(reverse("providers_delete"), {"provider_id": provider.id})
+        )
+
+        self.assertRedirects(response, reverse("providers_repo"), fetch_redirect_response=False)
+        self.assertFalse(await Provider.objects.filter(pk=provider.pk).aexists())
+
+
+class PetOwnershipTest(TestCase):
+    """
+    Pruebas para el dueño y el veterinario de las mascotas y sus listados.
+    """
+
+    def setUp(self):
+        """Crea un cliente y un veterinario."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.owner = Client.objects.create(name="Juan Sebastian Veron", phone="221555232", email="juan@mail.com")
+            self.vet = Vet.objects.create(
+                name="Carlos Bilardo", email="carlos@mail.com", phone="221555233", speciality="Urgencias"
+            )
+
+    def create_pets(self, count):
+        """Crea mascotas con dueño y veterinario."""
+        Pet.objects.bulk_create(
+            Pet(name=f"Mascota {n}", breed="Labrador", birthday="2020-01-01", owner=self.owner, vet=self.vet)
+            for n in range(count)
+        )
+
+    def count_queries(self, url, params=None):
+        """Retorna la cantidad de consultas de una request al listado."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_pets_repository_shows_owner_and_vet_without_extra_queries(self):
+        """Prueba que el listado de mascotas muestre dueño y veterinario con las mismas consultas sin importar el tamaño de la página."""
+        self.create_pets(3)
+        few = self.count_queries(reverse("pets_repo"))
+        self.create_pets(40)
+        many = self.count_queries(reverse("pets_repo"), {"page_size": 50})
+
+        self.assertEqual(few, many)
+        response = self.client.get(reverse("pets_repo"))
+        self.assertContains(response, "Juan Sebastian Veron")
+        self.assertContains(response, "Carlos Bilardo")
+
+    def test_clients_repository_shows_pet_count_without_extra_queries(self):
+        """Prueba que el listado de clientes muestre la cantidad de mascotas con las mismas consultas sin importar cuántas tengan."""
+        few = self.count_queries(reverse("clients_repo"))
+        self.create_pets(5)
+        Client.objects.bulk_create(
+            Client(name=f"Cliente {n}", phone="221555232", email=f"cliente{n}@mail.com") for n in range(20)
+        )
+        many = self.count_queries(reverse("clients_repo"))
+
+        self.assertEqual(few, many)
+        response = self.client.get(reverse("clients_repo"))
+        self.assertEqual(response.context["clients"][0].pet_count, 5)
+        self.assertContains(response, "<td>5</td>", html=True)
+
+    def test_form_assigns_owner_and_vet(self):
+        """Prueba que el formulario asigne el dueño y el veterinario de una mascota."""
+        response = self.client.post(
+            reverse("pets_form"),
+            data={
+                "name": "Firulais",
+                "breed": "Caniche",
+                "birthday": "2020-01-01",
+                "owner_id": str(self.owner.id),
+                "vet_id": str(self.vet.id),
+            },
+        )
+
+        self.assertRedirects(response, reverse("pets_repo"))
+        pet = Pet.objects.get()
+        self.assertEqual(pet.owner, self.owner)
+        self.assertEqual(pet.vet, self.vet)
+
+    def test_form_without_owner(self):
+        """Prueba que el dueño y el veterinario sean opcionales y que sus ids deban ser válidos."""
+        data = {"name": "Firulais", "breed": "Caniche", "birthday": "2020-01-01", "owner_id": "", "vet_id": ""}
+        self.client.post(reverse("pets_form"), data=data)
+        self.assertIsNone(Pet.objects.get().owner)
+
+        response = self.client.post(reverse("pets_form"), data={**data, "owner_id": "abc"})
+        self.assertContains(response, "Por favor seleccione un dueño válido")
+
+    def test_form_clears_owner_and_vet(self):
+        """Prueba que editar una mascota con el dueño y el veterinario vacíos los quite."""
+        self.create_pets(1)
+        pet = Pet.objects.get()
+
+        response = self.client.post(
+            reverse("pets_edit", kwargs={"id": pet.id}),
+            data={
+                "id": str(pet.id),
+                "name": pet.name,
+                "breed": pet.breed,
+                "birthday": "2020-01-01",
+                "owner_id": "",
+                "vet_id": "",
+            },
+        )
+
+        self.assertRedirects(response, reverse("pets_repo"))
+        pet.refresh_from_db()
+        self.assertIsNone(pet.owner_id)
+        self.assertIsNone(pet.vet_id)
+        self.assertEqual(pet.name, "Mascota 0")
+
+    def test_update_pet_clears_owner_and_keeps_missing_fields(self):
+        """Prueba que update_pet quite el dueño vacío y conserve los campos ausentes."""
+        self.create_pets(1)
+        pet = Pet.objects.get()
+
+        saved, _ = pet.update_pet({"name": "Firulais", "breed": "Caniche", "birthday": "2020-01-01", "owner_id": ""})
+
+        self.assertTrue(saved)
+        pet.refresh_from_db()
+        self.assertIsNone(pet.owner_id)
+        self.assertEqual(pet.vet_id, self.vet.id)
+
+    def test_form_rejects_missing_owner_and_vet(self):
+        """Prueba que el formulario rechace un dueño o un veterinario que no existen."""
+        data = {"name": "Firulais", "breed": "Caniche", "birthday": "2020-01-01"}
+
+        response = self.client.post(reverse("pets_form"), data={**data, "owner_id": "999", "vet_id": "998"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Por favor seleccione un dueño válido")
+        self.assertContains(response, "Por favor seleccione un veterinario válido")
+        self.assertFalse(Pet.objects.exists())
+
+    def test_api_rejects_missing_owner(self):
+        """Prueba que la API rechace el lote si un registro apunta a un dueño que no existe."""
+        response = self.client.post(
+            reverse("api_records", kwargs={"entity": "pets"}),
+            data=json.dumps([
+                {"name": "Firulais", "breed": "Labrador", "birthday": "2020-01-01", "owner_id": self.owner.id},
+                {"name": "Rex", "breed": "Labrador", "birthday": "2020-01-01", "owner_id": 999},
+            ]),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["errors"], {"1": {"owner_id": "Por favor seleccione un dueño válido"}})
+        self.assertFalse(Pet.objects.exists())
+
+    def test_import_skips_missing_vet(self):
+        """Prueba que la importación informe las filas con un veterinario inexistente y siga con las demás."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "mascotas.csv"
+        path.write_text(
+            "name,breed,birthday,vet_id\n"
+            f"Firulais,Labrador,2020-01-01,{self.vet.id}\n"
+            "Rex,Labrador,2020-01-01,999\n"
+            "Toby,Caniche,2020-01-01,\n",
+            encoding="utf-8",
+        )
+        stderr = StringIO()
+
+        call_command("import_records", "pets", path, stdout=StringIO(), stderr=stderr)
+
+        self.assertEqual(list(Pet.objects.order_by("id").values_list("name", flat=True)), ["Firulais", "Toby"])
+        self.assertIn("vet_id: Por favor seleccione un veterinario válido", stderr.getvalue())
+
+    def test_form_lists_owner_and_vet_choices(self):
+        """Prueba que el formulario ofrezca los clientes y veterinarios como opciones."""
+        response = self.client.get(reverse("pets_form"))
+
+        self.assertContains(response, f'<option value="{self.owner.id}"')
+        self.assertContains(response, "Carlos Bilardo")
+
+    def test_deleting_owner_keeps_pet(self):
+        """Prueba que eliminar al dueño deje a la mascota sin dueño en lugar de eliminarla."""
+        self.create_pets(1)
+
+        self.owner.delete()
+
+        self.assertIsNone(Pet.objects.get().owner)
+
+    @override_settings(REPOSITORY_CACHE_TIMEOUT=60)
+    def test_owner_change_invalidates_pets_repository(self):
+        """Prueba que modificar un cliente invalide el listado de mascotas, que muestra su nombre."""
+        cache.clear()
+        self.create_pets(1)
+        self.client.get(reverse("pets_repo"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Client.update_client_by_id(
+                self.owner.id, {"name": "Martin Palermo", "phone": "221555232", "email": "juan@mail.com"}
+            )
+
+        self.assertContains(self.client.get(reverse("pets_repo")), "Martin Palermo")
+
+
+class RepositoryMarkupTest(TestCase):
+    """
+    Pruebas para el formulario de eliminación compartido por las filas de los listados.
+    """
+
+    def test_single_delete_form_per_page(self):
+        """Prueba que la página tenga un solo formulario de eliminación sin importar la cantidad de filas."""
+        for number in range(5):
+            Client.objects.create(name=f"Cliente {number}", phone="221555232", email="c@mail.com")
+
+        response = self.client.get(reverse("clients_repo"))
+        content = response.content.decode()
+
+        # un token para la eliminación masiva y otro para el formulario compartido
+        self.assertEqual(content.count('name="csrfmiddlewaretoken"'), 2)
+        self.assertEqual(content.count('id="delete-form"'), 1)
+        self.assertEqual(content.count('form="delete-form"'), 5)
+
+    def test_delete_button_submits_shared_form(self):
+        """Prueba que el botón de una fila elimine su registro a través del formulario compartido."""
+        client = Client.objects.create(name="Juan", phone="221555232", email="juan@mail.com")
+
+        response = self.client.post(reverse("clients_delete"), {"client_id": str(client.id)})
+
+        self.assertRedirects(response, reverse("clients_repo"))
+        self.assertFalse(Client.objects.exists())
+
+
+class StaticAssetsTest(TestCase):
+    """
+    Pruebas para los archivos estáticos servidos desde la app, sin CDN.
+    """
+
+    def test_pages_use_local_assets(self):
+        """Prueba que las páginas no dependan de una CDN."""
+        response = self.client.get(reverse("home"))
+
+        self.assertNotContains(response, "cdn.jsdelivr.net")
+        self.assertContains(response, "/static/vendor/bootstrap/css/bootstrap.min.css")
+        self.assertContains(response, "/static/vendor/bootstrap-icons/bootstrap-icons.css")
+        self.assertContains(response, "/static/vendor/bootstrap/js/bootstrap.bundle.min.js")
+
+    def test_assets_are_served_by_the_app(self):
+        """Prueba que la app sirva los archivos estáticos sin collectstatic en desarrollo."""
+        response = self.client.get("/static/vendor/bootstrap/css/bootstrap.min.css")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"Bootstrap  v5.3.3", b"".join(response.streaming_content))
+
+    def test_collected_assets_are_hashed_compressed_and_immutable(self):
+        """Prueba que collectstatic genere archivos con hash y comprimidos, servidos como inmutables."""
+        storages = {
+            "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+            "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+        }
+
+        with tempfile.TemporaryDirectory() as static_root, override_settings(
+            STATIC_ROOT=static_root,
+            STORAGES=storages,
+            WHITENOISE_USE_FINDERS=False,
+            WHITENOISE_AUTOREFRESH=False,
+        ):
+            call_command("collectstatic", interactive=False, verbosity=0)
+            url = static("vendor/bootstrap/css/bootstrap.min.css")
+            middleware = WhiteNoiseMiddleware(lambda request: None)
+
+            request = RequestFactory().get(url, HTTP_ACCEPT_ENCODING="gzip, br")
+            response = middleware(request)
+
+            self.assertRegex(url, r"bootstrap\.min\.[0-9a-f]{12}\.css$")
+            self.assertTrue(Path(static_root, "vendor/bootstrap/css/bootstrap.min.css.gz").exists())
+            self.assertEqual(response["Content-Encoding"], "br")
+            self.assertIn("immutable", response["Cache-Control"])
+
+
+class CompressionTest(TestCase):
+    """
+    Pruebas para la compresión de las respuestas con brotli y gzip.
+    """
+
+    def setUp(self):
+        """Crea suficientes clientes para que el listado supere el tamaño mínimo."""
+        Client.objects.bulk_create(
+            Client(name=f"Cliente {number}", phone="221555232", email="c@mail.com") for number in range(30)
+        )
+
+    def test_repository_with_brotli(self):
+        """Prueba que el listado se comprima con brotli y se descomprima al mismo HTML."""
+        plain = self.client.get(reverse("clients_repo"))
+        response = self.client.get(reverse("clients_repo"), HTTP_ACCEPT_ENCODING="gzip, br")
+
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(int(response["Content-Length"]), len(response.content))
+        self.assertLess(len(response.content), len(plain.content))
+        self.assertIn(b"Cliente 1", brotli.decompress(response.content))
+
+    def test_repository_with_gzip(self):
+        """Prueba que si el cliente solo acepta gzip se comprima con gzip."""
+        response = self.client.get(reverse("clients_repo"), HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn(b"Cliente 1", gzip.decompress(response.content))
+
+    def test_without_accept_encoding(self):
+        """Prueba que sin Accept-Encoding la respuesta no se comprima pero varíe por ese header."""
+        response = self.client.get(reverse("clients_repo"))
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    @override_settings(COMPRESSION_MIN_SIZE=1_000_000)
+    def test_small_responses_are_not_compressed(self):
+        """Prueba que las respuestas más chicas que el mínimo no se compriman."""
+        response = self.client.get(reverse("clients_repo"), HTTP_ACCEPT_ENCODING="br")
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_api_json_is_compressed(self):
+        """Prueba que las respuestas JSON de la API se compriman."""
+        response = self.client.get(reverse("api_records", kwargs={"entity": "clients"}), HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(response.content))["results"][0]["name"], "Cliente 0")
+
+    def test_streaming_repository(self):
+        """Prueba que el listado completo se comprima bloque a bloque, sin Content-Length."""
+        with self.settings(REPOSITORY_STREAM_CHUNK_SIZE=5):
+            response = self.client.get(reverse("clients_repo"), {"stream": "1"}, HTTP_ACCEPT_ENCODING="gzip")
+            chunks = list(response.streaming_content)
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertFalse(response.has_header("Content-Length"))
+        self.assertGreater(len(chunks), 2)
+        content = gzip.decompress(b"".join(chunks)).decode()
+        self.assertIn("Cliente 29", content)
+        self.assertIn("</html>", content)
+
+    def test_export_is_compressed(self):
+        """Prueba que la exportación CSV se comprima y que la exportada con gzip no se comprima otra vez."""
+        url = reverse("clients_export")
+
+        csv = self.client.get(url, HTTP_ACCEPT_ENCODING="br")
+        gzipped = self.client.get(url, {"gzip": "1"}, HTTP_ACCEPT_ENCODING="br")
+
+        self.assertEqual(csv["Content-Encoding"], "br")
+        self.assertIn(b"Cliente 29", brotli.decompress(b"".join(csv.streaming_content)))
+        self.assertFalse(gzipped.has_header("Content-Encoding"))
+        self.assertIn("Cliente 29", gzip.decompress(b"".join(gzipped.streaming_content)).decode())
+
+    async def test_async_streaming_repository(self):
+        """Prueba que el listado completo de las vistas asíncronas se comprima con iteración asíncrona."""
+        request = AsyncRequestFactory().get(reverse("clients_repo"), {"stream": "1"}, headers={"accept-encoding": "br"})
+        response = await async_views.clients_repository(request)
+
+        response = CompressionMiddleware(lambda request: response).process_response(request, response)
+        content = b"".join([chunk async for chunk in response.streaming_content])
+
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertIn(b"Cliente 29", brotli.decompress(content))
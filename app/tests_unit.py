@@ -1,7 +1,26 @@
 import datetime
-
-from django.test import TestCase
-
+import runpy
+import tempfile
+import timeit
+from unittest import mock
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.template import engines
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils.module_loading import import_string
+
+from app import page_cache
+from app.compression import (
+    BrotliCompressor,
+    GzipCompressor,
+    accepted_encodings,
+    get_compressor,
+)
+from app.context_processors import active_section, links, navbar
+from app.entities import get_entity
 from app.models import (
     Client,
     Medicine,
@@ -10,12 +29,20 @@ from app.models import (
     Provider,
     Speciality,
     Vet,
+    pet_validator,
     validate_medicine,
     validate_pet,
     validate_product,
     validate_provider,
     validate_vet,
 )
+from app.pagination import KEYSET_FIELD, keyset_paginate
+from app.search import search
+from app.sqlite import current_pragmas, pragma_statements
+from app.template_backend import compile_times, warm_up
+from app.templatetags.url_prefix import resolve_prefix, url_prefix
+from app.validation import ValidationContext, compile_schema
+from vetsoft.settings import env_bool, env_conn_max_age
 
 
 class ClientModelTest(TestCase):
@@ -630,4 +657,685 @@ class MedicineModelTest(TestCase):
             }
         
         result = validate_medicine(data)
-        self.assertIn("La dosis debe ser un numero entero", result.values())
\ No newline at end of file
+        self.assertIn("La dosis debe ser un numero entero", result.values())
+
+
+class KeysetPaginationTest(TestCase):
+    """
+    Pruebas para la paginación por cursor de los listados.
+    """
+
+    def setUp(self):
+        """Crea siete clientes para paginar de a tres."""
+        self.factory = RequestFactory()
+        self.clients = [
+            Client.objects.create(
+                name=f"Cliente {number}",
+                phone="221555232",
+                email=f"cliente{number}@hotmail.com",
+            )
+            for number in range(7)
+        ]
+
+    def paginate(self, query=None):
+        """Pagina los clientes con la query string indicada."""
+        request = self.factory.get("/clientes/", query or {})
+        return keyset_paginate(request, Client.objects.all(), page_size=3)
+
+    def test_first_page_has_only_next_cursor(self):
+        """Prueba que la primera página tenga cursor siguiente pero no anterior."""
+        page = self.paginate()
+
+        self.assertEqual(list(page), self.clients[:3])
+        self.assertFalse(page.has_previous)
+        self.assertEqual(page.next_cursor, self.clients[2].id)
+        self.assertEqual(page.next_query, f"?after={self.clients[2].id}")
+
+    def test_after_cursor_seeks_next_page(self):
+        """Prueba que el cursor 'after' devuelva las filas siguientes."""
+        page = self.paginate({"after": self.clients[2].id})
+
+        self.assertEqual(list(page), self.clients[3:6])
+        self.assertEqual(page.previous_cursor, self.clients[3].id)
+        self.assertEqual(page.next_cursor, self.clients[5].id)
+
+    def test_last_page_has_no_next_cursor(self):
+        """Prueba que la última página no tenga cursor siguiente."""
+        page = self.paginate({"after": self.clients[5].id})
+
+        self.assertEqual(list(page), self.clients[6:])
+        self.assertFalse(page.has_next)
+        self.assertTrue(page.has_previous)
+
+    def test_before_cursor_seeks_previous_page(self):
+        """Prueba que el cursor 'before' devuelva las filas anteriores en orden ascendente."""
+        page = self.paginate({"before": self.clients[3].id})
+
+        self.assertEqual(list(page), self.clients[:3])
+        self.assertFalse(page.has_previous)
+        self.assertEqual(page.next_cursor, self.clients[2].id)
+
+    def test_links_keep_other_query_params(self):
+        """Prueba que los links de la página conserven el resto de los parámetros."""
+        page = self.paginate({"page_size": "3", "after": self.clients[0].id})
+
+        self.assertIn("page_size=3", page.next_query)
+        self.assertIn(f"before={self.clients[1].id}", page.previous_query)
+        self.assertNotIn("after", page.previous_query)
+
+    def test_invalid_cursor_returns_first_page(self):
+        """Prueba que un cursor inválido se ignore y devuelva la primera página."""
+        page = self.paginate({"after": "abc"})
+
+        self.assertEqual(list(page), self.clients[:3])
+
+    @override_settings(REPOSITORY_PAGE_SIZE=2, REPOSITORY_MAX_PAGE_SIZE=4)
+    def test_page_size_is_capped(self):
+        """Prueba que el tamaño de página pedido no supere el máximo configurado."""
+        request = self.factory.get("/clientes/", {"page_size": "100"})
+        page = keyset_paginate(request, Client.objects.all())
+
+        self.assertEqual(len(page), 4)
+
+
+class SearchTest(TestCase):
+    """
+    Pruebas para la búsqueda indexada de registros.
+    """
+
+    def setUp(self):
+        """Crea dos clientes para buscar."""
+        self.veron = Client.objects.create(
+            name="Juan Sebastián Veron",
+            phone="221555232",
+            email="brujita75@hotmail.com",
+        )
+        self.carrillo = Client.objects.create(
+            name="Guido Carrillo",
+            phone="221232555",
+            email="goleador@gmail.com",
+        )
+
+    def test_search_by_name_prefix(self):
+        """Prueba que se encuentre un cliente por el prefijo de su nombre."""
+        self.assertEqual(list(search(Client.objects.all(), "Carr")), [self.carrillo])
+
+    def test_search_by_phone_prefix(self):
+        """Prueba que se encuentre un cliente por el prefijo de su teléfono."""
+        self.assertEqual(list(search(Client.objects.all(), "221555")), [self.veron])
+
+    def test_search_ignores_accents_and_case(self):
+        """Prueba que la búsqueda ignore tildes y mayúsculas."""
+        self.assertEqual(list(search(Client.objects.all(), "SEBASTIAN")), [self.veron])
+
+    def test_search_requires_every_term(self):
+        """Prueba que todos los términos buscados deban coincidir."""
+        self.assertEqual(list(search(Client.objects.all(), "guido brujita")), [])
+
+    def test_empty_search_returns_queryset(self):
+        """Prueba que una búsqueda vacía no filtre el queryset."""
+        self.assertEqual(search(Client.objects.all(), "  ").count(), 2)
+
+    def test_search_results_are_paginated_by_cursor(self):
+        """Prueba que los resultados de una búsqueda se paginen con los cursores ?after= y ?before=."""
+        clients = [
+            Client.objects.create(name=f"Cliente {number}", phone="221555232", email="c@mail.com")
+            for number in range(5)
+        ]
+        queryset = search(get_entity("clients").rows(), "cliente")
+        factory = RequestFactory()
+
+        first = keyset_paginate(factory.get("/"), queryset, page_size=2)
+        second = keyset_paginate(factory.get("/", {"after": first.next_cursor}), queryset, page_size=2)
+        previous = keyset_paginate(factory.get("/", {"before": second.previous_cursor}), queryset, page_size=2)
+
+        self.assertEqual([row.id for row in first], [client.id for client in clients[:2]])
+        self.assertEqual([row.id for row in second], [client.id for client in clients[2:4]])
+        self.assertEqual([row.id for row in previous], [row.id for row in first])
+
+    def test_search_page_is_read_in_index_order(self):
+        """Prueba que la página de una búsqueda se lea en el orden del índice, sin ordenar todas las coincidencias."""
+        queryset = search(get_entity("clients").rows(), "gmail").filter(**{f"{KEYSET_FIELD}__gt": 0})
+
+        plan = queryset.order_by(KEYSET_FIELD)[:21].explain()
+
+        self.assertIn("app_client_search", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+        self.assertEqual([row.id for row in queryset], [self.carrillo.id])
+
+    def test_index_follows_bulk_updates_and_deletes(self):
+        """Prueba que el índice refleje actualizaciones y eliminaciones masivas."""
+        Client.objects.filter(pk=self.carrillo.pk).update(name="Martin Palermo")
+        Client.objects.filter(pk=self.veron.pk).delete()
+
+        self.assertEqual(list(search(Client.objects.all(), "Carrillo")), [])
+        self.assertEqual(list(search(Client.objects.all(), "Palermo")), [self.carrillo])
+        self.assertEqual(list(search(Client.objects.all(), "Veron")), [])
+
+
+class ModelIndexesTest(TestCase):
+    """
+    Pruebas para los índices y el orden por defecto de los modelos.
+    """
+
+    def test_filter_by_email_uses_index(self):
+        """Prueba que filtrar clientes por email utilice el índice."""
+        plan = Client.objects.filter(email="brujita75@hotmail.com").explain()
+        self.assertIn("client_email_idx", plan)
+
+    def test_filter_by_speciality_uses_index(self):
+        """Prueba que filtrar veterinarios por especialidad utilice el índice."""
+        plan = Vet.objects.filter(speciality=Speciality.Radiologia.value).explain()
+        self.assertIn("vet_speciality_idx", plan)
+
+    def test_default_ordering_is_by_id(self):
+        """Prueba que los registros se listen ordenados por id por defecto."""
+        collar = Product.objects.create(name="Collar", type="Accesorio", price=10)
+        alimento = Product.objects.create(name="Alimento", type="Alimento", price=20)
+
+        self.assertEqual(list(Product.objects.all()), [collar, alimento])
+        self.assertEqual(Pet._meta.ordering, ["id"])
+
+
+class VersionedUpdateTest(TestCase):
+    """
+    Pruebas para las actualizaciones parciales con control de concurrencia optimista.
+    """
+
+    def setUp(self):
+        """Crea un veterinario para actualizar."""
+        self.vet = Vet.objects.create(
+            name="Ana",
+            email="ana@mail.com",
+            phone="221555232",
+            speciality=Speciality.Radiologia.value,
+        )
+        self.data = {
+            "name": "Ana",
+            "email": "ana@mail.com",
+            "phone": "221555232",
+            "speciality": Speciality.Radiologia.value,
+        }
+
+    def test_update_writes_only_changed_fields(self):
+        """Prueba que la actualización escriba solo los campos modificados e incremente la versión."""
+        with self.assertNumQueries(1) as context:
+            saved, errors = self.vet.update_vet({**self.data, "phone": "221000000"})
+
+        self.assertTrue(saved)
+        self.assertIsNone(errors)
+        sql = context.captured_queries[0]["sql"]
+        self.assertIn('"phone"', sql)
+        self.assertNotIn('"email"', sql)
+        self.assertEqual(self.vet.version, 2)
+        self.assertEqual(Vet.objects.get(pk=self.vet.pk).phone, "221000000")
+
+    def test_update_without_changes_skips_query(self):
+        """Prueba que una actualización sin cambios no ejecute consultas."""
+        with self.assertNumQueries(0):
+            saved, _ = self.vet.update_vet(self.data)
+
+        self.assertTrue(saved)
+        self.assertEqual(self.vet.version, 1)
+
+    def test_update_detects_concurrent_edit(self):
+        """Prueba que no se pise una edición concurrente del mismo registro."""
+        other_desk = Vet.objects.get(pk=self.vet.pk)
+        other_desk.update_vet({**self.data, "name": "Ana María"})
+
+        saved, errors = self.vet.update_vet({**self.data, "phone": "221000000"})
+
+        self.assertFalse(saved)
+        self.assertIn("version", errors)
+        self.assertEqual(Vet.objects.get(pk=self.vet.pk).phone, "221555232")
+
+    def test_update_by_id_runs_a_single_query(self):
+        """Prueba que la actualización por id no lea el registro previamente."""
+        with self.assertNumQueries(1):
+            saved, _ = Vet.update_vet_by_id(self.vet.pk, {**self.data, "version": "1", "name": "Ana María"})
+
+        self.assertTrue(saved)
+        vet = Vet.objects.get(pk=self.vet.pk)
+        self.assertEqual((vet.name, vet.version), ("Ana María", 2))
+
+    def test_update_by_id_with_stale_version(self):
+        """Prueba que la actualización por id rechace una versión desactualizada."""
+        Vet.update_vet_by_id(self.vet.pk, {**self.data, "name": "Ana María"})
+
+        saved, errors = Vet.update_vet_by_id(self.vet.pk, {**self.data, "version": "1", "name": "Anita"})
+
+        self.assertFalse(saved)
+        self.assertIn("version", errors)
+        self.assertEqual(Vet.objects.get(pk=self.vet.pk).name, "Ana María")
+
+    def test_update_by_id_missing_record(self):
+        """Prueba que la actualización por id de un registro inexistente lance DoesNotExist."""
+        with self.assertRaises(Vet.DoesNotExist):
+            Vet.update_vet_by_id(1000, self.data)
+
+
+class DatabaseSettingsTest(TestCase):
+    """
+    Pruebas para la lectura de la configuración de conexiones desde el entorno.
+    """
+
+    def test_env_bool(self):
+        """Prueba que las variables booleanas acepten los valores habituales."""
+        with mock.patch.dict("os.environ", {"FLAG_ON": "True", "FLAG_OFF": "0", "FLAG_EMPTY": ""}):
+            self.assertTrue(env_bool("FLAG_ON"))
+            self.assertFalse(env_bool("FLAG_OFF", default=True))
+            self.assertTrue(env_bool("FLAG_EMPTY", default=True))
+            self.assertFalse(env_bool("FLAG_MISSING"))
+
+    def test_env_conn_max_age(self):
+        """Prueba que la duración de las conexiones acepte segundos o None para no limitarla."""
+        with mock.patch.dict("os.environ", {"AGE_SECONDS": "60", "AGE_UNLIMITED": "None"}):
+            self.assertEqual(env_conn_max_age("AGE_SECONDS"), 60)
+            self.assertIsNone(env_conn_max_age("AGE_UNLIMITED"))
+            self.assertEqual(env_conn_max_age("AGE_MISSING"), 0)
+
+
+class SQLitePragmasTest(TestCase):
+    """
+    Pruebas para los PRAGMAs aplicados a las conexiones SQLite.
+    """
+
+    def test_pragmas_are_applied_to_connection(self):
+        """Prueba que la conexión de las pruebas tenga aplicados los PRAGMAs configurados."""
+        pragmas = current_pragmas(connection, ["busy_timeout", "synchronous", "temp_store"])
+
+        self.assertEqual(pragmas["busy_timeout"], 5000)
+        self.assertEqual(pragmas["synchronous"], 1)  # NORMAL
+        self.assertEqual(pragmas["temp_store"], 2)  # MEMORY
+
+    def test_pragma_statements(self):
+        """Prueba que se generen las sentencias en orden y se rechacen valores inválidos."""
+        self.assertEqual(
+            pragma_statements({"busy_timeout": 1000, "cache_size": -2000}),
+            ["PRAGMA busy_timeout = 1000", "PRAGMA cache_size = -2000"],
+        )
+        with self.assertRaises(ValueError):
+            pragma_statements({"journal_mode": "WAL; DROP TABLE app_client"})
+
+
+class TemplateBackendTest(TestCase):
+    """
+    Pruebas para la compilación anticipada y las métricas de los templates.
+    """
+
+    def test_templates_use_cached_loader(self):
+        """Prueba que los templates se carguen con el loader con cache."""
+        loaders = engines["django"].engine.template_loaders
+
+        self.assertEqual([type(loader).__name__ for loader in loaders], ["CachedLoader"])
+
+    def test_warm_up_compiles_every_template(self):
+        """Prueba que al iniciar se compilen todos los templates de la aplicación."""
+        compiled = warm_up()
+
+        self.assertGreaterEqual(compiled, 26)
+        self.assertIn("base.html", compile_times)
+        self.assertIn("partials/navbar.html", compile_times)
+
+
+class NavbarTest(TestCase):
+    """
+    Pruebas para los links de la navbar precalculados por sección.
+    """
+
+    def active_labels(self, path):
+        """Retorna las etiquetas de los links activos para la ruta indicada."""
+        request = RequestFactory().get(path)
+        return [link["label"] for link in navbar(request)["links"] if link["active"]]
+
+    def test_active_link_by_path(self):
+        """Prueba que se marque como activo el link de la sección de la ruta."""
+        self.assertEqual(self.active_labels("/"), ["Home"])
+        self.assertEqual(self.active_labels("/clientes/"), ["Clientes"])
+        self.assertEqual(self.active_labels("/clientes/editar/3/"), ["Clientes"])
+        self.assertEqual(self.active_labels("/vets/nuevo/"), ["Veterinarios"])
+        self.assertEqual(self.active_labels("/metrics/"), [])
+
+    def test_links_are_immutable_and_shared(self):
+        """Prueba que los links sean inmutables y se reutilicen entre requests de la misma sección."""
+        first = navbar(RequestFactory().get("/clientes/"))["links"]
+        second = navbar(RequestFactory().get("/clientes/nuevo/"))["links"]
+
+        self.assertIs(first, second)
+        self.assertEqual(len(first), len(links))
+        with self.assertRaises(TypeError):
+            first[0]["active"] = True
+
+    def test_active_section_is_memoised(self):
+        """Prueba que la sección de cada ruta se calcule una sola vez."""
+        active_section.cache_clear()
+        active_section("/productos/")
+        active_section("/productos/")
+
+        self.assertEqual(active_section.cache_info().hits, 1)
+
+    def test_navbar_benchmark(self):
+        """Micro-benchmark: 10.000 llamadas a navbar() deben tardar bastante menos de un segundo."""
+        request = RequestFactory().get("/mascotas/editar/7/")
+
+        elapsed = min(timeit.repeat(lambda: navbar(request), number=10_000, repeat=3))
+
+        self.assertLess(elapsed, 0.25)
+
+
+class BatchValidationTest(TestCase):
+    """
+    Pruebas para la validación por lote de registros y columnas.
+    """
+
+    def setUp(self):
+        """Arma un lote de mascotas con dos registros inválidos."""
+        self.context = ValidationContext(today="2024-05-01")
+        self.records = [
+            {"name": "Firulais", "breed": "Caniche", "birthday": "2020-01-01"},
+            {"name": "", "breed": "", "birthday": "2020-01-01"},
+            {"name": "Michi", "breed": "Siames", "birthday": "2019-03-04"},
+            {"name": "Rex", "breed": "Boxer", "birthday": "2025-01-01"},
+        ]
+
+    def test_validate_records_matches_single_validation(self):
+        """Prueba que el lote informe los mismos errores que validar cada registro."""
+        errors = pet_validator.validate_records(self.records, self.context)
+
+        expected = {
+            index: pet_validator(record, self.context)
+            for index, record in enumerate(self.records)
+            if pet_validator(record, self.context)
+        }
+        self.assertEqual(errors.as_dict(), expected)
+        self.assertEqual(list(errors.as_dict()[1]), ["name", "breed"])
+
+    def test_compact_indexes(self):
+        """Prueba que los errores se guarden como posiciones por campo y mensaje."""
+        errors = pet_validator.validate_records(self.records, self.context)
+
+        self.assertTrue(errors)
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(errors.invalid_indexes(), [1, 3])
+        self.assertEqual(errors.valid_indexes(), [0, 2])
+        self.assertEqual(list(errors.by_field["name"]["Por favor ingrese un nombre"]), [1])
+
+    def test_validate_columns(self):
+        """Prueba que validar por columnas dé el mismo resultado que por registros."""
+        columns = {field: [record[field] for record in self.records] for field in self.records[0]}
+
+        errors = pet_validator.validate_columns(columns, self.context)
+
+        self.assertEqual(
+            errors.as_dict(), pet_validator.validate_records(self.records, self.context).as_dict()
+        )
+
+    def test_validate_columns_missing_and_uneven(self):
+        """Prueba que las columnas ausentes se consideren vacías y que los largos distintos fallen."""
+        errors = pet_validator.validate_columns({"name": ["Firulais"], "breed": ["Caniche"]})
+        self.assertEqual(list(errors.as_dict()[0]), ["birthday"])
+
+        with self.assertRaises(ValueError):
+            pet_validator.validate_columns({"name": ["Firulais"], "breed": []})
+
+    def test_valid_batch_has_no_errors(self):
+        """Prueba que un lote válido no tenga errores."""
+        errors = pet_validator.validate_records([self.records[0], self.records[2]], self.context)
+
+        self.assertFalse(errors)
+        self.assertEqual(errors.as_dict(), {})
+        self.assertEqual(errors.valid_indexes(), [0, 1])
+
+    def test_foreign_keys_are_checked_with_one_query(self):
+        """Prueba que los ids de las claves foráneas de un lote se verifiquen en una sola consulta por modelo."""
+        owner = Client.objects.create(name="Juan", phone="221555232", email="juan@mail.com")
+        records = [
+            {"name": f"Mascota {n}", "breed": "Caniche", "birthday": "2020-01-01", "owner_id": str(owner.id if n % 2 else 999)}
+            for n in range(50)
+        ]
+
+        with self.assertNumQueries(1):
+            errors = pet_validator.validate_records(records)
+
+        self.assertEqual(errors.invalid_indexes(), list(range(0, 50, 2)))
+
+
+class ValidationSchemaTest(TestCase):
+    """
+    Pruebas para los validadores compilados a partir del esquema de cada modelo.
+    """
+
+    def test_rules_derived_from_fields(self):
+        """Prueba que las reglas salgan de los campos: obligatorios, email y campos opcionales."""
+        validator = compile_schema(Client, exclude=("version",))
+
+        self.assertEqual(validator.fields, ("name", "phone", "email", "address"))
+        self.assertEqual(
+            validator({"name": "Juan", "phone": "221555", "email": "juan"}),
+            {"email": "Por favor ingrese un email valido"},
+        )
+        self.assertEqual(validator({"name": "Juan", "phone": "221555", "email": "juan@mail.com"}), {})
+
+    def test_default_messages(self):
+        """Prueba que los campos sin mensajes en el esquema usen los mensajes por defecto."""
+        with mock.patch.object(Product, "VALIDATION_SCHEMA", {}):
+            validator = compile_schema(Product, exclude=("version",))
+
+        errors = validator({"name": "", "type": "Alimento", "price": "caro"})
+
+        self.assertEqual(
+            errors,
+            {"name": "Por favor complete este campo", "price": "Por favor ingrese un número válido"},
+        )
+
+    def test_numeric_bounds(self):
+        """Prueba que los límites declarados se verifiquen sobre el valor convertido una sola vez."""
+        validator = compile_schema(Medicine, exclude=("version",))
+        data = {"name": "Ibuprofeno", "description": "Antiinflamatorio"}
+
+        self.assertEqual(validator({**data, "dose": "1.5"}), {"dose": "La dosis debe ser un numero entero"})
+        self.assertEqual(validator({**data, "dose": "0"}), {"dose": "La dosis debe estar entre 1 y 10"})
+        self.assertEqual(validator({**data, "dose": "11"}), {"dose": "La dosis debe estar entre 1 y 10"})
+        self.assertEqual(validator({**data, "dose": "10"}), {})
+
+    def test_inconsistent_schema(self):
+        """Prueba que un esquema que no coincide con los campos del modelo falle al compilarse."""
+        schemas = [
+            {"nickname": {"required": "Por favor ingrese un apodo"}},
+            {"name": {"mandatory": "Por favor ingrese un nombre"}},
+            {"address": {"required": "Por favor ingrese una dirección"}},
+            {"name": {"min_value": (1, "Muy corto")}},
+            {"phone": {"before_today": "Por favor ingrese una fecha pasada"}},
+        ]
+
+        for schema in schemas:
+            with self.subTest(schema=schema), mock.patch.object(Client, "VALIDATION_SCHEMA", schema):
+                with self.assertRaises(ImproperlyConfigured):
+                    compile_schema(Client, exclude=("version",))
+
+
+class RepositoryRowsTest(TestCase):
+    """
+    Pruebas para las filas livianas de los listados.
+    """
+
+    def test_rows_only_have_displayed_columns(self):
+        """Prueba que las filas traigan solo el id y las columnas que muestra el listado."""
+        client = Client.objects.create(name="Juan", phone="221555232", email="juan@mail.com")
+        Pet.objects.create(name="Firulais", breed="Caniche", birthday="2020-01-01", owner=client)
+
+        pet = get_entity("pets").rows().get()
+
+        self.assertEqual(
+            pet._fields, ("id", "name", "breed", "birthday", "owner_name", "vet_name")
+        )
+        self.assertEqual(pet.owner_name, "Juan")
+        self.assertIsNone(pet.vet_name)
+
+    def test_rows_include_counts(self):
+        """Prueba que las filas de clientes incluyan la cantidad de mascotas, en una sola consulta."""
+        client = Client.objects.create(name="Juan", phone="221555232", email="juan@mail.com")
+        Pet.objects.create(name="Firulais", breed="Caniche", birthday="2020-01-01", owner=client)
+
+        with self.assertNumQueries(1):
+            row = get_entity("clients").rows().get()
+
+        self.assertEqual(row.pet_count, 1)
+        self.assertNotIn("version", row._fields)
+
+    def test_keyset_pagination_of_rows(self):
+        """Prueba que la paginación por cursor funcione con las filas livianas."""
+        for number in range(3):
+            Client.objects.create(name=f"Cliente {number}", phone="221555232", email="c@mail.com")
+        request = RequestFactory().get("/clientes/", {"page_size": 2})
+
+        page = keyset_paginate(request, get_entity("clients").rows())
+
+        self.assertEqual(len(page.object_list), 2)
+        self.assertTrue(page.has_next)
+
+
+class UrlPrefixTest(TestCase):
+    """
+    Pruebas para las URLs de las filas armadas a partir de un prefijo resuelto una vez.
+    """
+
+    def test_prefix_matches_reverse(self):
+        """Prueba que el prefijo más el id sea la misma URL que invertirla."""
+        for name in ("clients_edit", "providers_edit", "medicine_edit", "products_edit", "pets_edit", "vets_edit"):
+            with self.subTest(name=name):
+                self.assertEqual(f"{url_prefix(name)}7/", reverse(name, kwargs={"id": 7}))
+
+    def test_prefix_is_memoised(self):
+        """Prueba que cada prefijo se resuelva una sola vez."""
+        resolve_prefix.cache_clear()
+        url_prefix("clients_edit")
+        url_prefix("clients_edit")
+
+        self.assertEqual(resolve_prefix.cache_info().hits, 1)
+
+    def test_rows_render_edit_url(self):
+        """Prueba que las filas rendericen la URL de edición de cada registro."""
+        client = Client.objects.create(name="Juan", phone="221555232", email="juan@mail.com")
+
+        html = engines["django"].get_template("clients/rows.html").render(
+            {"clients": get_entity("clients").rows()}
+        )
+
+        self.assertIn(f'href="{reverse("clients_edit", kwargs={"id": client.id})}"', html)
+
+
+class CompressionNegotiationTest(TestCase):
+    """
+    Pruebas para la elección de la codificación según Accept-Encoding.
+    """
+
+    def test_accepted_encodings_skip_q_zero(self):
+        """Prueba que se ignoren las codificaciones con q=0."""
+        self.assertEqual(accepted_encodings("gzip;q=1.0, br;q=0, deflate"), {"gzip", "deflate"})
+
+    def test_prefers_brotli(self):
+        """Prueba que se prefiera brotli cuando el cliente acepta ambas."""
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip, deflate, br")
+
+        self.assertIsInstance(get_compressor(request), BrotliCompressor)
+
+    @override_settings(COMPRESSION_BROTLI=False)
+    def test_brotli_can_be_disabled(self):
+        """Prueba que con COMPRESSION_BROTLI desactivado se use gzip."""
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip, br")
+
+        self.assertIsInstance(get_compressor(request), GzipCompressor)
+
+    def test_no_accepted_encoding(self):
+        """Prueba que no se comprima si el cliente no acepta gzip ni brotli."""
+        for header in ("", "identity", "deflate", "gzip;q=0"):
+            with self.subTest(header=header):
+                request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=header)
+                self.assertIsNone(get_compressor(request))
+
+
+class GunicornConfigTest(TestCase):
+    """
+    Pruebas para la configuración de gunicorn.
+    """
+
+    def load_config(self, **env):
+        """Ejecuta gunicorn.conf.py con las variables de entorno indicadas y retorna sus valores."""
+        with mock.patch.dict("os.environ", env):
+            return runpy.run_path(str(settings.BASE_DIR / "gunicorn.conf.py"))
+
+    def test_rejects_locmem_cache_with_several_workers(self):
+        """Prueba que no se pueda usar la cache en memoria de cada proceso con varios procesos."""
+        with self.assertRaises(ValueError):
+            self.load_config(CACHE_BACKEND="locmem", WEB_CONCURRENCY="3")
+
+    def test_allows_locmem_cache_with_one_worker_or_without_page_cache(self):
+        """Prueba que locmem se acepte con un solo proceso o con la cache de listados desactivada."""
+        self.assertEqual(self.load_config(CACHE_BACKEND="locmem", WEB_CONCURRENCY="1")["workers"], 1)
+        config = self.load_config(CACHE_BACKEND="locmem", WEB_CONCURRENCY="3", REPOSITORY_CACHE_TIMEOUT="0")
+        self.assertEqual(config["workers"], 3)
+
+    def test_workers_follow_available_cpus(self):
+        """Prueba que la cantidad de procesos dependa de las CPUs asignadas al proceso y no de las del equipo."""
+        with mock.patch("os.sched_getaffinity", return_value={0, 1}, create=True), mock.patch(
+            "os.cpu_count", return_value=64
+        ), mock.patch("builtins.open", side_effect=OSError):
+            config = self.load_config(GUNICORN_WORKER_CLASS="gthread")
+
+        self.assertEqual(config["cpus"], 2)
+        self.assertEqual(config["workers"], 3)
+
+    def test_available_cpus_respects_cgroup_quota(self):
+        """Prueba que se respete la cuota de CPU del contenedor (docker run --cpus 1.5)."""
+        available_cpus = self.load_config()["available_cpus"]
+
+        with mock.patch("os.sched_getaffinity", return_value=set(range(8)), create=True), mock.patch(
+            "builtins.open", mock.mock_open(read_data="150000 100000\n")
+        ):
+            self.assertEqual(available_cpus(), 2)
+
+        with mock.patch("os.sched_getaffinity", return_value=set(range(8)), create=True), mock.patch(
+            "builtins.open", mock.mock_open(read_data="max 100000\n")
+        ):
+            self.assertEqual(available_cpus(), 8)
+
+    def test_uvicorn_worker_class_is_importable(self):
+        """Prueba que la clase de worker de uvicorn exista."""
+        config = self.load_config(GUNICORN_WORKER_CLASS="uvicorn")
+
+        self.assertEqual(config["wsgi_app"], "vetsoft.asgi:application")
+        self.assertTrue(callable(import_string(config["worker_class"])))
+
+
+class PageCacheGenerationTest(TestCase):
+    """
+    Pruebas para la invalidación de los listados en una cache compartida por los procesos.
+    """
+
+    def setUp(self):
+        """Usa una cache de archivos en un directorio temporal, como la de producción."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        override = override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": directory.name,
+                },
+            }
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_bump_changes_generation_even_if_clock_does_not_advance(self):
+        """Prueba que cada invalidación cambie la generación aunque el reloj no avance."""
+        generation = page_cache.get_generation("clients")
+
+        with mock.patch("app.page_cache.time.time_ns", return_value=generation):
+            page_cache.bump_generation("clients")
+            first = page_cache.get_generation("clients")
+            page_cache.bump_generation("clients")
+            second = page_cache.get_generation("clients")
+
+        self.assertEqual(len({generation, first, second}), 3)
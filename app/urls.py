@@ -1,31 +1,49 @@
+from django.conf import settings
 from django.urls import path
 
-from . import views
+from . import api, async_views, metrics, views
+
+# Vistas de las páginas: las asíncronas si se sirve con ASGI (uvicorn), si no las sincrónicas
+page_views = async_views if settings.ASYNC_VIEWS else views
 
 urlpatterns = [
-    path("", view=views.home, name="home"),
-    path("clientes/", view=views.clients_repository, name="clients_repo"),
-    path("clientes/nuevo/", view=views.clients_form, name="clients_form"),
-    path("clientes/editar/<int:id>/", view=views.clients_form, name="clients_edit"),
-    path("clientes/eliminar/", view=views.clients_delete, name="clients_delete"),
-    path("proveedores/", view=views.providers_repository, name="providers_repo"),
-    path("proveedores/nuevo/", view=views.providers_form, name="providers_form"),
-    path("proveedores/editar/<int:id>/", view=views.providers_form, name="providers_edit"),
-    path("proveedores/eliminar/", view=views.providers_delete, name="providers_delete"),
-    path("medicine/new/", view=views.medicine_form, name="medicine_form"),
-    path("medicine/", view=views.medicine_repository, name="medicine_repo"),
-    path("medicine/editar/<int:id>/", view=views.medicine_form, name="medicine_edit"),
-    path("medicine/delete/", view=views.medicine_delete, name="medicine_delete"),
-    path("productos/", view=views.products_repository, name="products_repo"),
-    path("productos/nuevo", view=views.products_form, name="products_form"),
-    path("productos/editar/<int:id>/", view=views.products_form, name="products_edit"),
-    path("productos/eliminar/", view=views.products_delete, name="products_delete"),
-    path("mascotas/", view=views.pets_repository, name="pets_repo"),
-    path("mascotas/nuevo/", view=views.pets_form, name="pets_form"),
-    path("mascotas/editar/<int:id>/", view=views.pets_form, name="pets_edit"),
-    path("mascotas/eliminar/", view=views.pets_delete, name="pets_delete"),
-    path("vets/", view=views.vets_repository, name="vets_repo"),
-    path("vets/nuevo/", view=views.vets_form, name="vets_form"),
-    path("vet/editar/<int:id>/", view=views.vets_form, name="vets_edit"),
-    path("vets/eliminar/", view=views.vets_delete, name="vets_delete"),
+    path("", view=page_views.home, name="home"),
+    path("api/<str:entity>/", view=api.records_api, name="api_records"),
+    path("metrics/", view=metrics.metrics, name="metrics"),
+    path("clientes/", view=page_views.clients_repository, name="clients_repo"),
+    path("clientes/exportar/", view=views.records_export, kwargs={"entity": "clients"}, name="clients_export"),
+    path("clientes/nuevo/", view=page_views.clients_form, name="clients_form"),
+    path("clientes/editar/<int:id>/", view=page_views.clients_form, name="clients_edit"),
+    path("clientes/eliminar/", view=page_views.clients_delete, name="clients_delete"),
+    path("clientes/eliminar-seleccionados/", view=views.records_bulk_delete, kwargs={"entity": "clients"}, name="clients_bulk_delete"),
+    path("proveedores/", view=page_views.providers_repository, name="providers_repo"),
+    path("proveedores/exportar/", view=views.records_export, kwargs={"entity": "providers"}, name="providers_export"),
+    path("proveedores/nuevo/", view=page_views.providers_form, name="providers_form"),
+    path("proveedores/editar/<int:id>/", view=page_views.providers_form, name="providers_edit"),
+    path("proveedores/eliminar/", view=page_views.providers_delete, name="providers_delete"),
+    path("proveedores/eliminar-seleccionados/", view=views.records_bulk_delete, kwargs={"entity": "providers"}, name="providers_bulk_delete"),
+    path("medicine/new/", view=page_views.medicine_form, name="medicine_form"),
+    path("medicine/", view=page_views.medicine_repository, name="medicine_repo"),
+    path("medicine/exportar/", view=views.records_export, kwargs={"entity": "medicine"}, name="medicine_export"),
+    path("medicine/editar/<int:id>/", view=page_views.medicine_form, name="medicine_edit"),
+    path("medicine/delete/", view=page_views.medicine_delete, name="medicine_delete"),
+    path("medicine/eliminar-seleccionados/", view=views.records_bulk_delete, kwargs={"entity": "medicine"}, name="medicine_bulk_delete"),
+    path("productos/", view=page_views.products_repository, name="products_repo"),
+    path("productos/exportar/", view=views.records_export, kwargs={"entity": "products"}, name="products_export"),
+    path("productos/nuevo", view=page_views.products_form, name="products_form"),
+    path("productos/editar/<int:id>/", view=page_views.products_form, name="products_edit"),
+    path("productos/eliminar/", view=page_views.products_delete, name="products_delete"),
+    path("productos/eliminar-seleccionados/", view=views.records_bulk_delete, kwargs={"entity": "products"}, name="products_bulk_delete"),
+    path("mascotas/", view=page_views.pets_repository, name="pets_repo"),
+    path("mascotas/exportar/", view=views.records_export, kwargs={"entity": "pets"}, name="pets_export"),
+    path("mascotas/nuevo/", view=page_views.pets_form, name="pets_form"),
+    path("mascotas/editar/<int:id>/", view=page_views.pets_form, name="pets_edit"),
+    path("mascotas/eliminar/", view=page_views.pets_delete, name="pets_delete"),
+    path("mascotas/eliminar-seleccionados/", view=views.records_bulk_delete, kwargs={"entity": "pets"}, name="pets_bulk_delete"),
+    path("vets/", view=page_views.vets_repository, name="vets_repo"),
+    path("vets/exportar/", view=views.records_export, kwargs={"entity": "vets"}, name="vets_export"),
+    path("vets/nuevo/", view=page_views.vets_form, name="vets_form"),
+    path("vet/editar/<int:id>/", view=page_views.vets_form, name="vets_edit"),
+    path("vets/eliminar/", view=page_views.vets_delete, name="vets_delete"),
+    path("vets/eliminar-seleccionados/", view=views.records_bulk_delete, kwargs={"entity": "vets"}, name="vets_bulk_delete"),
 ]
@@ -0,0 +1,473 @@
+import datetime
+import operator
+from array import array
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+
+# Cantidad máxima de ids por consulta al verificar las claves foráneas (por debajo
+# del límite de parámetros de SQLite)
+ID_QUERY_BATCH_SIZE = 900
+
+
+class ValidationContext:
+    """
+    Estado compartido por todas las validaciones de una llamada, calculado una sola vez.
+
+    Args:
+        today (str): La fecha actual en formato ISO (YYYY-MM-DD).
+    """
+
+    def __init__(self, today=None):
+        self.today = today or datetime.date.today().isoformat()
+        self.existing_ids = {}
+        self._checked_ids = {}
+
+    def load_ids(self, model, values):
+        """
+        Consulta cuáles de los ids indicados existen en el modelo y los agrega a
+        `existing_ids[model]`, en una consulta por cada ID_QUERY_BATCH_SIZE ids. Los
+        valores que no son un id se ignoran y los ids ya consultados no se repiten.
+
+        Args:
+            model (Model): El modelo al que apuntan los ids.
+            values (iterable): Los valores de la clave foránea (p. ej. "3").
+        """
+        existing = self.existing_ids.setdefault(model, set())
+        checked = self._checked_ids.setdefault(model, set())
+
+        ids = sorted({int(value) for value in values if isinstance(value, str) and value.isdigit()} - checked)
+        checked.update(ids)
+        for start in range(0, len(ids), ID_QUERY_BATCH_SIZE):
+            chunk = ids[start:start + ID_QUERY_BATCH_SIZE]
+            existing.update(model.objects.filter(pk__in=chunk).values_list("pk", flat=True))
+
+    async def aload_ids(self, model, values):
+        """
+        Versión asíncrona de `load_ids`, con el ORM asíncrono.
+        """
+        existing = self.existing_ids.setdefault(model, set())
+        checked = self._checked_ids.setdefault(model, set())
+
+        ids = sorted({int(value) for value in values if isinstance(value, str) and value.isdigit()} - checked)
+        checked.update(ids)
+        for start in range(0, len(ids), ID_QUERY_BATCH_SIZE):
+            chunk = ids[start:start + ID_QUERY_BATCH_SIZE]
+            existing.update([pk async for pk in model.objects.filter(pk__in=chunk).values_list("pk", flat=True)])
+
+
+def required(message):
+    """
+    Crea una regla que exige un valor no vacío.
+    """
+
+    def check(value, context):
+        """Falla si el valor está vacío."""
+        return message if value is None or value == "" else None
+
+    return check
+
+
+def contains(text, message):
+    """
+    Crea una regla que exige que el valor contenga el texto indicado (p. ej. "@").
+    """
+
+    def check(value, context):
+        """Falla si el valor no contiene el texto."""
+        return message if text not in str(value) else None
+
+    return check
+
+
+def date_before_today(message):
+    """
+    Crea una regla que exige una fecha ISO anterior a la fecha del contexto.
+    """
+
+    def check(value, context):
+        """Falla si la fecha no es anterior a hoy."""
+        return message if str(value) >= context.today else None
+
+    return check
+
+
+def exists(field, message):
+    """
+    Crea una regla que exige que el id (ya convertido a entero por una regla anterior)
+    exista en el modelo al que apunta la clave foránea. Los ids se consultan de
+    antemano con `ValidationContext.load_ids`.
+    """
+
+    def check(value, context):
+        """Falla si no existe un registro con ese id."""
+        return message if int(value) not in context.existing_ids.get(field.related_model, ()) else None
+
+    return check
+
+
+def optional(check):
+    """
+    Crea una regla que aplica check solo si el valor no está vacío, para los campos opcionales.
+    """
+
+    def optional_check(value, context):
+        """Acepta los valores vacíos y delega el resto en check."""
+        if value is None or value == "":
+            return None
+        return check(value, context)
+
+    return optional_check
+
+
+def _integer(value):
+    """
+    Convierte un entero escrito solo con dígitos; cualquier otro valor es inválido.
+    """
+    if not isinstance(value, str) or not value.isdigit():
+        raise ValueError(value)
+    return int(value)
+
+
+def converted(convert, message, bounds=()):
+    """
+    Crea una regla que convierte el valor una sola vez y luego verifica sus límites en orden.
+
+    Args:
+        convert (function): Convierte el valor; falla con TypeError o ValueError si es inválido.
+        message (str): El mensaje si el valor no se puede convertir.
+        bounds (tuple): Tuplas (comparación, límite, mensaje) que el valor convertido debe cumplir.
+    """
+
+    def check(value, context):
+        """Falla si el valor no se puede convertir o no cumple algún límite."""
+        try:
+            number = convert(value)
+        except (TypeError, ValueError):
+            return message
+        for compare, limit, bound_message in bounds:
+            if not compare(number, limit):
+                return bound_message
+        return None
+
+    return check
+
+
+class BatchErrors:
+    """
+    Errores de la validación de un lote, agrupados por campo y mensaje.
+
+    En lugar de un diccionario por registro se guarda, para cada campo y mensaje,
+    un arreglo compacto con las posiciones de los registros que fallaron, de modo
+    que validar un millón de registros válidos no crea un objeto por registro.
+
+    Args:
+        size (int): La cantidad de registros validados.
+        fields (tuple): Los campos validados, en el orden en que se informan sus errores.
+    """
+
+    def __init__(self, size, fields=()):
+        self.size = size
+        self.fields = fields
+        self.by_field = {}
+
+    def add(self, field, message, index):
+        """Registra que el registro en la posición index no cumple con una regla del campo."""
+        messages = self.by_field.setdefault(field, {})
+        indexes = messages.get(message)
+        if indexes is None:
+            indexes = messages[message] = array("L")
+        indexes.append(index)
+
+    def invalid_indexes(self):
+        """Retorna las posiciones de los registros con errores, ordenadas."""
+        invalid = set()
+        for messages in self.by_field.values():
+            for indexes in messages.values():
+                invalid.update(indexes)
+        return sorted(invalid)
+
+    def valid_indexes(self):
+        """Retorna las posiciones de los registros sin errores, ordenadas."""
+        invalid = set(self.invalid_indexes())
+        return [index for index in range(self.size) if index not in invalid]
+
+    def as_dict(self):
+        """Retorna los errores de cada registro inválido: {posición: {campo: mensaje}}."""
+        errors = {}
+        fields = [field for field in self.fields if field in self.by_field]
+        fields += [field for field in self.by_field if field not in fields]
+        for field in fields:
+            for message, indexes in self.by_field[field].items():
+                for index in indexes:
+                    errors.setdefault(index, {})[field] = message
+        return dict(sorted(errors.items()))
+
+    def __bool__(self):
+        """Indica si algún registro tiene errores."""
+        return bool(self.by_field)
+
+    def __len__(self):
+        """Retorna la cantidad de registros con errores."""
+        return len(self.invalid_indexes())
+
+
+class Validator:
+    """
+    Valida registros aplicando, para cada campo, sus reglas en orden hasta la primera que falla.
+
+    Se puede usar para un registro (como las funciones validate_*), para una secuencia
+    de registros o para columnas (un arreglo de valores por campo). En los lotes el
+    estado compartido (la fecha actual) se calcula una sola vez.
+
+    Las claves foráneas (`relations`) se verifican contra la base: antes de validar
+    se consultan juntos los ids de todos los registros, en lugar de uno por registro.
+
+    Args:
+        rules (dict): Las reglas de cada campo, en orden.
+        relations (dict): El campo del modelo de cada clave foránea (p. ej. Pet.owner).
+    """
+
+    def __init__(self, rules, relations=None):
+        self.rules = tuple((field, tuple(checks)) for field, checks in rules.items())
+        self.relations = dict(relations or {})
+
+    @property
+    def fields(self):
+        """Los campos que valida."""
+        return tuple(field for field, _ in self.rules)
+
+    def __call__(self, data, context=None):
+        """
+        Valida un registro.
+
+        Args:
+            data (dict): Los datos del registro.
+            context (ValidationContext): El estado compartido; por defecto se calcula.
+
+        Returns:
+            dict: Los errores encontrados, por campo.
+        """
+        if context is None:
+            context = ValidationContext()
+        self._load_relations(context, lambda field: (data.get(field, ""),))
+
+        errors = {}
+        for field, checks in self.rules:
+            value = data.get(field, "")
+            for check in checks:
+                message = check(value, context)
+                if message is not None:
+                    errors[field] = message
+                    break
+        return errors
+
+    async def avalidate(self, data, context=None):
+        """
+        Versión asíncrona de la validación de un registro, para las vistas asíncronas:
+        los ids de las claves foráneas se consultan con el ORM asíncrono.
+
+        Args:
+            data (dict): Los datos del registro.
+            context (ValidationContext): El estado compartido; por defecto se calcula.
+
+        Returns:
+            dict: Los errores encontrados, por campo.
+        """
+        if context is None:
+            context = ValidationContext()
+        for name, field in self.relations.items():
+            await context.aload_ids(field.related_model, (data.get(name, ""),))
+        # Los ids ya consultados no se vuelven a consultar
+        return self(data, context)
+
+    def validate_records(self, records, context=None):
+        """
+        Valida una secuencia de registros en una sola pasada.
+
+        Args:
+            records (Sequence): Los registros (diccionarios).
+            context (ValidationContext): El estado compartido; por defecto se calcula una vez.
+
+        Returns:
+            BatchErrors: Los errores, con la posición de cada registro en la secuencia.
+        """
+        if context is None:
+            context = ValidationContext()
+        self._load_relations(context, lambda field: (data.get(field, "") for data in records))
+
+        errors = BatchErrors(len(records), self.fields)
+        for index, data in enumerate(records):
+            for field, checks in self.rules:
+                value = data.get(field, "")
+                for check in checks:
+                    message = check(value, context)
+                    if message is not None:
+                        errors.add(field, message, index)
+                        break
+        return errors
+
+    def validate_columns(self, columns, context=None):
+        """
+        Valida registros en formato de columnas: {campo: [valor del registro 0, ...]}.
+
+        Cada campo se recorre de punta a punta, sin armar un diccionario por registro.
+        Los campos ausentes se consideran vacíos.
+
+        Args:
+            columns (dict): Los valores de cada campo, todos del mismo largo.
+            context (ValidationContext): El estado compartido; por defecto se calcula una vez.
+
+        Returns:
+            BatchErrors: Los errores, con la posición de cada registro en las columnas.
+
+        Raises:
+            ValueError: Si las columnas no tienen todas el mismo largo.
+        """
+        if context is None:
+            context = ValidationContext()
+
+        sizes = {len(values) for values in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError("Todas las columnas deben tener la misma cantidad de valores")
+        size = sizes.pop() if sizes else 0
+        self._load_relations(context, lambda field: columns.get(field, ()))
+
+        errors = BatchErrors(size, self.fields)
+        for field, checks in self.rules:
+            values = columns.get(field)
+            if values is None:
+                values = [""] * size
+            for index, value in enumerate(values):
+                for check in checks:
+                    message = check(value, context)
+                    if message is not None:
+                        errors.add(field, message, index)
+                        break
+        return errors
+
+
+    def _load_relations(self, context, values):
+        """
+        Consulta los ids de las claves foráneas; values(field) retorna los valores del campo.
+        """
+        for name, field in self.relations.items():
+            context.load_ids(field.related_model, values(name))
+
+
+# Conversión de los valores de texto de cada tipo de campo numérico
+CONVERTERS = {
+    "IntegerField": _integer,
+    "PositiveIntegerField": _integer,
+    "PositiveSmallIntegerField": _integer,
+    "FloatField": float,
+    "DecimalField": float,
+    "ForeignKey": _integer,
+}
+
+# Límites que se pueden declarar para los campos numéricos
+BOUNDS = {
+    "min_value": operator.ge,
+    "max_value": operator.le,
+    "greater_than": operator.gt,
+}
+
+SCHEMA_KEYS = {"required", "invalid", "before_today", *BOUNDS}
+
+DEFAULT_MESSAGES = {
+    "required": "Por favor complete este campo",
+    "email": "Por favor ingrese un email valido",
+    "number": "Por favor ingrese un número válido",
+    "choice": "Por favor seleccione una opción válida",
+}
+
+
+def compile_schema(model, exclude=()):
+    """
+    Compila el esquema de validación de un modelo en un Validator.
+
+    Las reglas se derivan de los campos del modelo, en su orden: los campos sin
+    `blank=True` son obligatorios, los EmailField deben contener "@", los campos
+    numéricos deben poder convertirse a número y las claves foráneas deben ser el
+    id de un registro existente; en los campos opcionales estas reglas solo se aplican si hay un valor. Las
+    claves foráneas se validan por su columna (p. ej. "owner_id"). `model.VALIDATION_SCHEMA` solo
+    declara, por campo, los mensajes ("required", "invalid") y las restricciones
+    que el tipo no expresa: "min_value", "max_value" y "greater_than" como tuplas
+    (límite, mensaje) y "before_today" para las fechas. Se compila una sola vez, al
+    importar los modelos.
+
+    Args:
+        model (Model): El modelo, con un atributo VALIDATION_SCHEMA.
+        exclude (tuple): Los campos que no se validan (p. ej. la versión).
+
+    Returns:
+        Validator: El validador del modelo.
+
+    Raises:
+        ImproperlyConfigured: Si el esquema no es consistente con los campos del modelo.
+    """
+    schema = model.VALIDATION_SCHEMA
+    fields = [
+        field
+        for field in model._meta.concrete_fields
+        if not field.primary_key and field.editable and field.name not in exclude
+    ]
+
+    unknown = set(schema) - {field.name for field in fields}
+    if unknown:
+        raise ImproperlyConfigured(
+            f"{model.__name__}.VALIDATION_SCHEMA declara campos inexistentes: {sorted(unknown)}"
+        )
+
+    rules = {}
+    relations = {}
+    for field in fields:
+        spec = schema.get(field.name, {})
+        if set(spec) - SCHEMA_KEYS:
+            raise ImproperlyConfigured(
+                f"{model.__name__}.{field.name}: claves de validación desconocidas {sorted(set(spec) - SCHEMA_KEYS)}"
+            )
+        rules[field.attname] = _field_rules(model, field, spec)
+        if field.is_relation:
+            relations[field.attname] = field
+
+    return Validator(rules, relations)
+
+
+def _field_rules(model, field, spec):
+    """
+    Arma las reglas de un campo a partir de su tipo y de su entrada en el esquema.
+    """
+    name = f"{model.__name__}.{field.name}"
+    internal_type = field.get_internal_type()
+    checks = []
+
+    if field.blank and "required" in spec:
+        raise ImproperlyConfigured(f"{name} tiene blank=True pero el esquema lo declara obligatorio")
+    if not field.blank:
+        checks.append(required(spec.get("required", DEFAULT_MESSAGES["required"])))
+
+    value_checks = []
+    if isinstance(field, models.EmailField):
+        value_checks.append(contains("@", spec.get("invalid", DEFAULT_MESSAGES["email"])))
+
+    bounds = tuple(
+        (compare, *spec[key]) for key, compare in BOUNDS.items() if key in spec
+    )
+    convert = CONVERTERS.get(internal_type)
+    if convert is not None:
+        default = DEFAULT_MESSAGES["choice" if field.is_relation else "number"]
+        value_checks.append(converted(convert, spec.get("invalid", default), bounds))
+        if field.is_relation:
+            value_checks.append(exists(field, spec.get("invalid", default)))
+    elif bounds:
+        raise ImproperlyConfigured(f"{name} no es numérico y no admite límites")
+
+    if "before_today" in spec:
+        if internal_type != "DateField":
+            raise ImproperlyConfigured(f"{name} no es una fecha y no admite before_today")
+        value_checks.append(date_before_today(spec["before_today"]))
+
+    if field.blank:
+        value_checks = [optional(check) for check in value_checks]
+    return checks + value_checks
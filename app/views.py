@@ -1,6 +1,17 @@
+from django.conf import settings
+from django.contrib import messages
+from django.db import transaction
+from django.http import Http404, HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render, reverse
+from django.views.decorators.http import require_POST
 
+from .entities import get_entity
+from .exports import EXPORT_FORMATS, encode_chunks, export_lines
 from .models import Client, Medicine, Pet, Product, Provider, Vet
+from .page_cache import cached_page, invalidate_model
+from .pagination import keyset_paginate
+from .search import get_search_query, search
+from .streaming import is_stream_request, stream_repository
 
 
 def home(request):
@@ -11,14 +22,99 @@ def home(request):
     
     return render(request, "home.html")
 
+def render_repository(request, queryset, template_dir, context_name):
+    
+    """
+    Renderiza el listado de template_dir/repository.html. Comparte la lógica de búsqueda (?q=) y de paginación por cursor entre todos los repositorios.
+    Con ?stream=1 emite el listado completo de forma incremental en lugar de paginarlo. Las páginas se guardan en cache hasta que se modifica un registro de la entidad
+    """
+    
+    template_name = f"{template_dir}/repository.html"
+    search_query = get_search_query(request)
+    queryset = search(queryset, search_query)
+    context = {"search_query": search_query}
+
+    if is_stream_request(request):
+        return stream_repository(
+            request, queryset, template_name, f"{template_dir}/rows.html", context_name, context
+        )
+
+    def render_page(csrf_token):
+        """Renderiza la página pedida; con csrf_token se usa ese valor en lugar del de la request."""
+        page = keyset_paginate(request, queryset)
+        context.update({context_name: page.object_list, "page": page})
+        if csrf_token is not None:
+            context["csrf_token"] = csrf_token
+        return render(request, template_name, context)
+
+    return cached_page(request, template_dir, render_page)
+
+def records_export(request, entity):
+    
+    """
+    Descarga todos los registros de una entidad (respetando la búsqueda ?q=) en CSV o JSONL, opcionalmente comprimidos con gzip (?gzip=1).
+    Las filas se emiten de forma incremental, sin instanciar modelos
+    """
+    
+    entity = get_entity(entity)
+    format = request.GET.get("format", "csv")
+    compress = request.GET.get("gzip") == "1"
+
+    if format not in EXPORT_FORMATS:
+        return HttpResponseBadRequest(f"Formato no soportado: {format}")
+
+    queryset = search(entity.model.objects.all(), get_search_query(request))
+    chunks = encode_chunks(export_lines(entity, queryset, format), compress=compress)
+
+    filename = f"{entity.key}.{format}"
+    content_type = EXPORT_FORMATS[format]
+    if compress:
+        filename += ".gz"
+        content_type = "application/gzip"
+
+    response = StreamingHttpResponse(chunks, content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+@require_POST
+def records_bulk_delete(request, entity):
+    
+    """
+    Elimina todos los registros seleccionados en el listado (ids) con una consulta por lote en lugar de una request por registro.
+    Los ids llegan en un solo campo separados por comas (ver partials/select_all.html), o en un campo por registro si el navegador no ejecuta el script.
+    Informa la cantidad eliminada con un mensaje
+    """
+    
+    entity = get_entity(entity)
+    ids = sorted({
+        int(record_id)
+        for value in request.POST.getlist("ids")
+        for record_id in value.split(",")
+        if record_id.isdigit()
+    })
+
+    if not ids:
+        messages.warning(request, f"No se seleccionaron {entity.label} para eliminar")
+        return redirect(reverse(f"{entity.key}_repo"))
+
+    deleted = 0
+    batch_size = settings.BULK_DELETE_BATCH_SIZE
+    with transaction.atomic():
+        for start in range(0, len(ids), batch_size):
+            _, per_model = entity.model.objects.filter(pk__in=ids[start:start + batch_size]).delete()
+            deleted += per_model.get(entity.model._meta.label, 0)
+        invalidate_model(entity.model)
+
+    messages.success(request, f"Se eliminaron {deleted} {entity.label}")
+    return redirect(reverse(f"{entity.key}_repo"))
+
 def clients_repository(request):
     
     """
     Renderiza el template clients/repository.html. Este es el listado de clientes
     """
     
-    clients = Client.objects.all()
-    return render(request, "clients/repository.html", {"clients": clients})
+    return render_repository(request, get_entity("clients").rows(), "clients", "clients")
 
 def clients_form(request, id=None):
     
@@ -35,8 +131,10 @@ def clients_form(request, id=None):
         if client_id == "":
             saved, errors = Client.save_client(request.POST)
         else:
-            client = get_object_or_404(Client, pk=client_id)
-            saved, errors = client.update_client(request.POST) 
+            try:
+                saved, errors = Client.update_client_by_id(client_id, request.POST)
+            except Client.DoesNotExist:
+                raise Http404
 
         if saved:
             return redirect(reverse("clients_repo"))
@@ -69,8 +167,7 @@ def providers_repository(request):
     Renderiza el template providers/repository.html. Este es el listado de proveedores
     """
     
-    providers = Provider.objects.all()
-    return render(request, "providers/repository.html", {"providers": providers})
+    return render_repository(request, get_entity("providers").rows(), "providers", "providers")
 
 def providers_form(request, id=None):
     
@@ -87,8 +184,10 @@ def providers_form(request, id=None):
         if provider_id == "":
             saved, errors = Provider.save_provider(request.POST)
         else:
-            provider = get_object_or_404(Provider, pk=provider_id)
-            saved, errors = provider.update_provider(request.POST)
+            try:
+                saved, errors = Provider.update_provider_by_id(provider_id, request.POST)
+            except Provider.DoesNotExist:
+                raise Http404
 
         if saved:
             return redirect(reverse("providers_repo"))
@@ -121,8 +220,7 @@ def medicine_repository(request):
     Renderiza el template medicine/repository.html. Este es el listado de medicamentos
     """
     
-    medicines = Medicine.objects.all()
-    return render(request, "medicine/repository.html", {"medicines": medicines})
+    return render_repository(request, get_entity("medicine").rows(), "medicine", "medicines")
 
 def medicine_form(request, id=None):
     
@@ -140,8 +238,10 @@ def medicine_form(request, id=None):
         if medicine_id == "":
             saved, errors = Medicine.save_medicine(request.POST)
         else:
-            medicine = get_object_or_404(Medicine, pk=medicine_id)
-            saved, errors = medicine.update_medicine(request.POST)
+            try:
+                saved, errors = Medicine.update_medicine_by_id(medicine_id, request.POST)
+            except Medicine.DoesNotExist:
+                raise Http404
             
 
         if saved:
@@ -175,8 +275,7 @@ def products_repository(request):
     Renderiza el template products/repository.html. Este es el listado de productos
     """
     
-    products = Product.objects.all()
-    return render(request, "products/repository.html", {"products": products})
+    return render_repository(request, get_entity("products").rows(), "products", "products")
 
 def products_form(request, id=None):
     
@@ -193,8 +292,10 @@ def products_form(request, id=None):
         if product_id == "":
             saved, errors = Product.save_product(request.POST)
         else:
-            product = get_object_or_404(Product, pk=product_id)
-            saved, errors = product.update_product(request.POST)
+            try:
+                saved, errors = Product.update_product_by_id(product_id, request.POST)
+            except Product.DoesNotExist:
+                raise Http404
 
         if saved:
             return redirect(reverse("products_repo"))
@@ -224,11 +325,10 @@ def products_delete(request):
 def pets_repository(request):
     
     """
-    Renderiza el template pets/repository.html. Este es el listado de mascotas
+    Renderiza el template pets/repository.html. Este es el listado de mascotas, con su dueño y su veterinario
     """
     
-    pets = Pet.objects.all()
-    return render(request, "pets/repository.html", {"pets": pets})
+    return render_repository(request, get_entity("pets").rows(), "pets", "pets")
 
 def pets_form(request, id=None):
     
@@ -245,21 +345,25 @@ def pets_form(request, id=None):
         if pet_id == "":
             saved, errors = Pet.save_pet(request.POST)
         else:
-            pet = get_object_or_404(Pet, pk=pet_id)
-            saved, errors = pet.update_pet(request.POST)
+            try:
+                saved, errors = Pet.update_pet_by_id(pet_id, request.POST)
+            except Pet.DoesNotExist:
+                raise Http404
 
         if saved:
             return redirect(reverse("pets_repo"))
 
         return render(
-            request, "pets/form.html", {"errors": errors, "pet": request.POST}
+            request,
+            "pets/form.html",
+            {"errors": errors, "pet": request.POST, **get_entity("pets").form_choices()},
         )
     
     pet = None
     if id is not None:
         pet = get_object_or_404(Pet, pk=id)
 
-    return render(request, "pets/form.html", {"pet": pet})
+    return render(request, "pets/form.html", {"pet": pet, **get_entity("pets").form_choices()})
 
 def pets_delete(request):
     
@@ -279,8 +383,7 @@ def vets_repository(request):
     Renderiza el template vets/repository.html. Este es el listado de veterinarios
     """
     
-    vets = Vet.objects.all()
-    return render(request, "vets/repository.html", {"vets": vets})
+    return render_repository(request, get_entity("vets").rows(), "vets", "vets")
 
 def vets_form(request, id=None):
     
@@ -297,8 +400,10 @@ def vets_form(request, id=None):
         if vet_id == "":
             saved, errors = Vet.save_vet(request.POST)
         else:
-            vet = get_object_or_404(Vet, pk=vet_id)
-            saved, errors = vet.update_vet(request.POST)
+            try:
+                saved, errors = Vet.update_vet_by_id(vet_id, request.POST)
+            except Vet.DoesNotExist:
+                raise Http404
 
         if saved:
             return redirect(reverse("vets_repo"))
@@ -0,0 +1,122 @@
+"""
+Compara el tamaño transferido y el costo de CPU de comprimir las respuestas de la
+app sin comprimir, con gzip y con brotli en distintos niveles.
+
+Las respuestas son las filas del listado de clientes (HTML), la misma cantidad de
+registros en JSON (como la API) y en CSV (como la exportación). Para el nivel
+configurado también se mide la compresión por bloques de las respuestas streaming.
+El tiempo de transferencia se estima para un enlace de 10 Mbit/s.
+
+No usa la base de datos: las filas se arman en memoria.
+
+Uso:
+    python -m benchmarks.compression [filas]
+"""
+
+import csv
+import io
+import json
+import sys
+import time
+
+from benchmarks.row_urls import build_rows
+from benchmarks.utils import print_table, setup_django
+
+setup_django()
+
+from django.conf import settings  # noqa: E402
+from django.middleware.csrf import _get_new_csrf_string  # noqa: E402
+from django.template import engines  # noqa: E402
+
+from app.compression import BrotliCompressor, GzipCompressor  # noqa: E402
+from app.entities import ENTITIES  # noqa: E402
+
+# Velocidad del enlace con la que se estima el tiempo de transferencia, en bits por segundo
+LINK_SPEED = 10_000_000
+
+CODECS = [
+    ("gzip 1", lambda: GzipCompressor(1)),
+    ("gzip 6", lambda: GzipCompressor(6)),
+    ("gzip 9", lambda: GzipCompressor(9)),
+    ("brotli 1", lambda: BrotliCompressor(1)),
+    ("brotli 4", lambda: BrotliCompressor(4)),
+    ("brotli 6", lambda: BrotliCompressor(6)),
+    ("brotli 11", lambda: BrotliCompressor(11)),
+]
+
+
+def build_payloads(count):
+    """Arma las respuestas HTML, JSON y CSV con `count` clientes."""
+    entity = ENTITIES["clients"]
+    rows = build_rows(entity, count)
+
+    html = engines["django"].get_template("clients/rows.html").render(
+        {entity.context_name: rows, "csrf_token": _get_new_csrf_string()}
+    )
+
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=rows[0])
+    writer.writeheader()
+    writer.writerows(rows)
+
+    return {
+        "HTML": html.encode(),
+        "JSON": json.dumps({"results": rows}, ensure_ascii=False).encode(),
+        "CSV": output.getvalue().encode(),
+    }
+
+
+def compress(make_compressor, chunks):
+    """Comprime los bloques con un compresor nuevo; retorna el tamaño y el tiempo en segundos."""
+    start = time.perf_counter()
+    compressor = make_compressor()
+    size = sum(len(compressor.compress(chunk)) for chunk in chunks) + len(compressor.finish())
+    return size, time.perf_counter() - start
+
+
+def split(data, parts):
+    """Parte el contenido en `parts` bloques, como los de una respuesta streaming."""
+    size = -(-len(data) // parts)
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+
+def transfer(size):
+    """Retorna el tiempo de transferencia estimado, en milisegundos."""
+    return size * 8 / LINK_SPEED * 1000
+
+
+def main():
+    """Comprime cada respuesta con cada codificación."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    payloads = build_payloads(count)
+    stream_parts = max(1, count // settings.REPOSITORY_STREAM_CHUNK_SIZE)
+
+    table = []
+    for name, data in payloads.items():
+        table.append([name, "sin comprimir", f"{len(data) / 1024:,.0f} KB", "1.0x", "-", "-", f"{transfer(len(data)):,.0f} ms"])
+        codecs = CODECS + [
+            (f"gzip {settings.COMPRESSION_GZIP_LEVEL} streaming", lambda: GzipCompressor(settings.COMPRESSION_GZIP_LEVEL)),
+            (f"brotli {settings.COMPRESSION_BROTLI_QUALITY} streaming", lambda: BrotliCompressor(settings.COMPRESSION_BROTLI_QUALITY)),
+        ]
+        for label, make_compressor in codecs:
+            chunks = split(data, stream_parts) if label.endswith("streaming") else [data]
+            size, elapsed = compress(make_compressor, chunks)
+            table.append([
+                name,
+                label,
+                f"{size / 1024:,.0f} KB",
+                f"{len(data) / size:.1f}x",
+                f"{elapsed * 1000:,.1f} ms",
+                f"{len(data) / elapsed / 1024 / 1024:,.1f} MB/s",
+                f"{transfer(size):,.0f} ms",
+            ])
+
+    print(f"{count:,} clientes, bloques streaming de {settings.REPOSITORY_STREAM_CHUNK_SIZE:,} filas\n")
+    print_table(
+        ["Respuesta", "Codificación", "Tamaño", "Reducción", "CPU", "Velocidad", "Transferencia (10 Mbit/s)"],
+        table,
+    )
+
+
+if __name__ == "__main__":
+    main()
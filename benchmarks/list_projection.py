@@ -0,0 +1,120 @@
+"""
+Compara los listados armados con instancias del modelo (todas las columnas, un
+__init__ por fila, con sus relaciones por select_related, como antes) contra las
+filas livianas de Entity.rows(), tuplas con nombres con solo las columnas que
+muestra cada template.
+
+Para cada forma se mide el tiempo de la consulta, la memoria reservada por fila
+(pico de tracemalloc durante la consulta, en una segunda pasada) y el tiempo de renderizar las filas con su template.
+
+Uso:
+    python -m benchmarks.list_projection [filas]
+"""
+
+import datetime
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.utils import BASE_DIR, create_database, print_table, setup_django
+
+setup_django()
+
+from django.db.models import Count  # noqa: E402
+from django.template import engines  # noqa: E402
+
+from app.entities import get_entity  # noqa: E402
+from app.models import Client, Pet, Vet  # noqa: E402
+
+
+def seed(rows):
+    """Carga `rows` clientes y `rows` mascotas, cada una con dueño y veterinario."""
+    Client.objects.bulk_create(
+        Client(name=f"Cliente {n}", phone=f"221{5000000 + n}", email=f"cliente{n}@mail.com")
+        for n in range(rows)
+    )
+    vet = Vet.objects.create(name="Vet", email="vet@mail.com", phone="221555232", speciality="Urgencias")
+    first_id = Client.objects.order_by("id").values_list("id", flat=True).first()
+    Pet.objects.bulk_create(
+        Pet(
+            name=f"Mascota {n}",
+            breed="Mestizo",
+            birthday=datetime.date(2020, 1, 1),
+            owner_id=first_id + n % rows,
+            vet=vet,
+        )
+        for n in range(rows)
+    )
+
+
+def instance_queryset(entity):
+    """
+    Retorna los registros del listado como instancias del modelo, con sus relaciones
+    en la misma consulta y sus conteos anotados, como se listaban antes de rows().
+    """
+    queryset = entity.model.objects.all()
+    if entity.counts:
+        queryset = queryset.annotate(**{name: Count(relation) for name, relation in entity.counts.items()})
+    relations = sorted({lookup.split("__")[0] for lookup in entity.related.values()})
+    if relations:
+        queryset = queryset.select_related(*relations)
+    return queryset
+
+
+def instance_template(entity):
+    """
+    Retorna el template de filas leyendo las relaciones desde las instancias
+    (p. ej. `pet.owner.name` en lugar de la columna `pet.owner_name`).
+    """
+    source = Path(BASE_DIR, "app", "templates", entity.key, "rows.html").read_text()
+    for name, lookup in entity.related.items():
+        source = source.replace(
+            f"{entity.instance_name}.{name}", f"{entity.instance_name}.{lookup.replace('__', '.')}"
+        )
+    return engines["django"].from_string(source)
+
+
+def measure(entity, queryset, template):
+    """Retorna el tiempo de la consulta, los bytes reservados por fila y el tiempo de renderizado."""
+    start = time.perf_counter()
+    rows = list(queryset.all())
+    fetch = time.perf_counter() - start
+
+    tracemalloc.start()
+    rows = list(queryset.all())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    template.render({entity.context_name: rows, "csrf_token": "token"})
+    render = time.perf_counter() - start
+
+    return fetch, peak / len(rows), render
+
+
+def main():
+    """Ejecuta el benchmark sobre los listados de clientes y mascotas."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    create_database()
+    seed(size)
+
+    table = []
+    for key in ("clients", "pets"):
+        entity = get_entity(key)
+        variants = (
+            ("instancias", instance_queryset(entity), instance_template(entity)),
+            ("filas (rows)", entity.rows(), engines["django"].get_template(f"{entity.key}/rows.html")),
+        )
+        for label, queryset, template in variants:
+            fetch, per_row, render = measure(entity, queryset, template)
+            table.append(
+                [entity.key, label, f"{fetch:.2f} s", f"{per_row:,.0f} B", f"{render:.2f} s"]
+            )
+
+    print(f"{size:,} filas por listado\n")
+    print_table(["Listado", "Forma", "Consulta", "Memoria por fila", "Renderizado"], table)
+
+
+if __name__ == "__main__":
+    main()
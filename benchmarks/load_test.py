@@ -0,0 +1,83 @@
+"""
+Prueba de carga simple: mide requests por segundo y latencias de una URL con varias
+conexiones concurrentes que reutilizan la conexión (keep-alive).
+
+Uso:
+    python -m benchmarks.load_test http://127.0.0.1:8000/clientes/ [--concurrency 16] [--duration 15]
+"""
+
+import argparse
+import http.client
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def worker(url, deadline, latencies, errors, lock):
+    """Envía requests a la URL hasta la fecha límite, reutilizando la conexión."""
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+    local_latencies = []
+    local_errors = 0
+
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            connection.request("GET", path)
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 400:
+                local_errors += 1
+            if response.getheader("Connection", "").lower() == "close":
+                connection.close()
+        except (OSError, http.client.HTTPException):
+            local_errors += 1
+            connection.close()
+            connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+            continue
+        local_latencies.append(time.perf_counter() - start)
+
+    connection.close()
+    with lock:
+        latencies.extend(local_latencies)
+        errors.append(local_errors)
+
+
+def main():
+    """Ejecuta la prueba de carga e imprime el resultado."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("url")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=15)
+    options = parser.parse_args()
+
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + options.duration
+    threads = [
+        threading.Thread(target=worker, args=(options.url, deadline, latencies, errors, lock))
+        for _ in range(options.concurrency)
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"URL:          {options.url}")
+    print(f"Concurrencia: {options.concurrency}")
+    print(f"Requests:     {len(latencies)} ({sum(errors)} errores)")
+    print(f"Req/s:        {len(latencies) / elapsed:.1f}")
+    if latencies:
+        print(f"Latencia p50: {statistics.median(latencies) * 1000:.1f} ms")
+        print(f"Latencia p95: {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Compara los planes de consulta y tiempos de los filtros de los listados antes y
+después de los índices declarados en Meta.indexes (migración 0011).
+
+Los datos se cargan y se consultan con los modelos históricos de la migración 0010
+(el estado de la base antes de los índices), ya que los modelos actuales tienen
+columnas que se agregaron después (p. ej. la versión).
+
+Uso:
+    python -m benchmarks.query_plans [cantidad_de_filas]
+"""
+
+import datetime
+import sys
+
+from benchmarks.utils import create_database, print_table, setup_django, timer
+
+setup_django()
+
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.db.migrations.executor import MigrationExecutor  # noqa: E402
+
+# La última migración antes de los índices
+BEFORE_INDEXES = ("app", "0010_search_index")
+
+QUERIES = {
+    "Client.email": lambda apps: apps.get_model("app", "Client").objects.filter(email="cliente500@mail.com"),
+    "Client.phone": lambda apps: apps.get_model("app", "Client").objects.filter(phone="2215000500"),
+    "Client.name": lambda apps: apps.get_model("app", "Client").objects.filter(name="Cliente 500"),
+    "Vet.speciality": lambda apps: apps.get_model("app", "Vet").objects.filter(speciality="Radiologia")[:50],
+    "Product.type": lambda apps: apps.get_model("app", "Product").objects.filter(type="Tipo 7")[:50],
+    "Pet.birthday": lambda apps: apps.get_model("app", "Pet").objects.filter(
+        birthday__range=("2020-01-01", "2020-01-07")
+    )[:50],
+    "Client ORDER BY name": lambda apps: apps.get_model("app", "Client").objects.order_by("name")[:50],
+}
+
+
+def historical_apps(migration):
+    """Retorna el registro de modelos tal como estaban en la migración indicada."""
+    return MigrationExecutor(connection).loader.project_state(migration).apps
+
+
+def seed(apps, rows):
+    """Carga `rows` registros en cada tabla consultada, con los modelos históricos."""
+    Client = apps.get_model("app", "Client")
+    Vet = apps.get_model("app", "Vet")
+    Product = apps.get_model("app", "Product")
+    Pet = apps.get_model("app", "Pet")
+    first_birthday = datetime.date(2010, 1, 1)
+    specialities = ["Oftalmologia", "Radiologia", "Urgencias", "Traumatologia"]
+
+    Client.objects.bulk_create(
+        Client(
+            name=f"Cliente {n}",
+            phone=f"221{5000000 + n}",
+            email=f"cliente{n}@mail.com",
+        )
+        for n in range(rows)
+    )
+    Vet.objects.bulk_create(
+        Vet(
+            name=f"Vet {n}",
+            email=f"vet{n}@mail.com",
+            phone="221555232",
+            speciality=specialities[n % len(specialities)],
+        )
+        for n in range(rows)
+    )
+    Product.objects.bulk_create(
+        Product(name=f"Producto {n}", type=f"Tipo {n % 500}", price=10)
+        for n in range(rows)
+    )
+    Pet.objects.bulk_create(
+        Pet(
+            name=f"Mascota {n}",
+            breed="Mestizo",
+            birthday=first_birthday + datetime.timedelta(days=n % 5000),
+        )
+        for n in range(rows)
+    )
+
+
+def measure(apps, repeat=20):
+    """Retorna el plan y el tiempo promedio (ms) de cada consulta."""
+    results = {}
+    for label, build in QUERIES.items():
+        queryset = build(apps)
+        plan = queryset.explain().replace("\n", " | ")
+        timings = {}
+        with timer(timings, label):
+            for _ in range(repeat):
+                list(build(apps))
+        results[label] = (plan, timings[label] / repeat * 1000)
+    return results
+
+
+def main():
+    """Ejecuta el benchmark sin índices y con índices."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    create_database()
+
+    call_command("migrate", *BEFORE_INDEXES, verbosity=0)
+    apps = historical_apps(BEFORE_INDEXES)
+    seed(apps, rows)
+    before = measure(apps)
+
+    # Las mismas consultas (con las columnas de 0010) sobre la base con los índices
+    call_command("migrate", "app", verbosity=0)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    after = measure(apps)
+
+    print(f"Filas por tabla: {rows}\n")
+    print_table(
+        ["Consulta", "Sin índices (ms)", "Con índices (ms)"],
+        [
+            (label, f"{before[label][1]:.2f}", f"{after[label][1]:.2f}")
+            for label in QUERIES
+        ],
+    )
+    print("\nPlanes de consulta:")
+    for label in QUERIES:
+        print(f"\n{label}\n  antes:   {before[label][0]}\n  despues: {after[label][0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compara el tamaño y el tiempo de renderizado de las filas de los listados con un
+formulario de eliminación (con su token CSRF) por fila, como antes, contra los
+botones que envían el formulario compartido de la página.
+
+No usa la base de datos: las filas se arman en memoria con las columnas de cada
+listado.
+
+Uso:
+    python -m benchmarks.row_markup [filas]
+"""
+
+import re
+import sys
+from pathlib import Path
+
+from benchmarks.row_urls import build_rows, render_time
+from benchmarks.utils import BASE_DIR, print_table, setup_django
+
+setup_django()
+
+from django.middleware.csrf import _get_new_csrf_string  # noqa: E402
+from django.template import engines  # noqa: E402
+
+from app.entities import ENTITIES  # noqa: E402
+
+BUTTON_RE = re.compile(
+    r'<button class="btn btn-outline-danger"\s+form="delete-form"\s+'
+    r'name="(\w+)"\s+value="\{\{ (\w+)\.id \}\}">Eliminar</button>'
+)
+
+
+def per_row_form_source(entity, source):
+    """Reconstruye el template de filas con un formulario de eliminación por fila, como era antes."""
+
+    def form(match):
+        """Arma el formulario de la fila para el botón encontrado."""
+        field, instance = match.groups()
+        return (
+            f'<form method="POST"\n'
+            f'                action="{{{{ delete_url }}}}"\n'
+            f'                aria-label="Formulario de eliminación">\n'
+            f"                {{% csrf_token %}}\n\n"
+            f'                <input type="hidden" name="{field}" value="{{{{ {instance}.id }}}}" />\n'
+            f'                <button class="btn btn-outline-danger">Eliminar</button>\n'
+            f"            </form>"
+        )
+
+    rebuilt, replaced = BUTTON_RE.subn(form, source)
+    assert replaced == 1
+    return f"{{% url '{entity.key}_delete' as delete_url %}}\n{rebuilt}"
+
+
+def main():
+    """Renderiza las filas de cada listado con ambas variantes."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    engine = engines["django"]
+
+    table = []
+    for entity in ENTITIES.values():
+        source = Path(BASE_DIR, "app", "templates", entity.key, "rows.html").read_text()
+        context = {entity.context_name: build_rows(entity, count), "csrf_token": _get_new_csrf_string()}
+
+        before_template = engine.from_string(per_row_form_source(entity, source))
+        after_template = engine.from_string(source)
+        before_size = len(before_template.render(context).encode())
+        after_size = len(after_template.render(context).encode())
+        before = render_time(before_template, context)
+        after = render_time(after_template, context)
+
+        table.append([
+            entity.key,
+            f"{before_size / 1024:,.0f} KB",
+            f"{after_size / 1024:,.0f} KB",
+            f"{(before_size - after_size) / count:.0f} B",
+            f"{before * 1000:.0f} ms",
+            f"{after * 1000:.0f} ms",
+        ])
+
+    print(f"{count:,} filas por listado\n")
+    print_table(
+        ["Listado", "HTML antes", "HTML ahora", "Ahorro por fila", "Render antes", "Render ahora"],
+        table,
+    )
+
+
+if __name__ == "__main__":
+    main()
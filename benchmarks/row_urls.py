@@ -0,0 +1,87 @@
+"""
+Compara el renderizado de las filas de los listados invirtiendo la URL de edición
+en cada fila (`{% url %}`, como antes) contra resolverla una vez por renderizado
+con `{% url_prefix %}`.
+
+No usa la base de datos: las filas se arman en memoria con las columnas de cada
+listado.
+
+Uso:
+    python -m benchmarks.row_urls [filas]
+"""
+
+import datetime
+import re
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.utils import BASE_DIR, print_table, setup_django
+
+setup_django()
+
+from django.template import engines  # noqa: E402
+
+from app.entities import ENTITIES  # noqa: E402
+
+SAMPLE_VALUES = {
+    "birthday": datetime.date(2020, 1, 1),
+    "dose": 5,
+    "price": 10.5,
+    "pet_count": 2,
+}
+
+
+def per_row_source(entity, source):
+    """Reconstruye el template de filas con un `{% url %}` por fila, como era antes."""
+    source = re.sub(r"\{% load url_prefix %\}\n\{% url_prefix .*? %\}\n", "", source)
+    source = source.replace(
+        f"{{{{ edit_url }}}}{{{{ {entity.instance_name}.id }}}}/",
+        f"{{% url '{entity.key}_edit' id={entity.instance_name}.id %}}",
+    )
+    assert "url_prefix" not in source and "edit_url" not in source
+    return source
+
+
+def build_rows(entity, count):
+    """Arma `count` filas con el id y las columnas del listado."""
+    columns = ("id", *entity.columns, *entity.counts, *entity.related)
+    return [
+        {column: n if column == "id" else SAMPLE_VALUES.get(column, f"{column} {n}") for column in columns}
+        for n in range(1, count + 1)
+    ]
+
+
+def render_time(template, context, repeat=3):
+    """Retorna el mejor tiempo de varios renderizados, en segundos."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        template.render(context)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    """Renderiza las filas de cada listado con ambas variantes."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    engine = engines["django"]
+
+    table = []
+    for entity in ENTITIES.values():
+        source = Path(BASE_DIR, "app", "templates", entity.key, "rows.html").read_text()
+        context = {entity.context_name: build_rows(entity, count), "csrf_token": "token"}
+
+        before = render_time(engine.from_string(per_row_source(entity, source)), context)
+        after = render_time(engine.from_string(source), context)
+        table.append(
+            [entity.key, f"{before * 1000:.0f} ms", f"{after * 1000:.0f} ms", f"{before / after:.2f}x"]
+        )
+
+    print(f"{count:,} filas por listado ({count:,} URLs invertidas antes)\n")
+    print_table(["Listado", "{% url %} por fila", "url_prefix", "Mejora"], table)
+
+
+if __name__ == "__main__":
+    main()
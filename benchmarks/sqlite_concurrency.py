@@ -0,0 +1,128 @@
+"""
+Compara la concurrencia de SQLite con los PRAGMAs por defecto y con los de
+SQLITE_PRAGMAS (WAL, synchronous=NORMAL, mmap, cache y busy_timeout).
+
+Varios procesos, como los workers de gunicorn, leen una página del listado de
+clientes y crean un cliente de forma intercalada sobre el mismo archivo. Se
+mide el throughput y la cantidad de errores "database is locked".
+
+Uso:
+    python -m benchmarks.sqlite_concurrency [procesos] [operaciones_por_proceso]
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.utils import print_table, setup_django
+
+MODES = {
+    "por defecto": "false",
+    "SQLITE_PRAGMAS": "true",
+}
+
+# Cada cuántas operaciones se realiza una escritura
+WRITE_EVERY = 4
+
+
+def configure(database, tuning):
+    """Configura Django en el proceso actual para usar el archivo indicado."""
+    os.environ["DB_ENGINE"] = "django.db.backends.sqlite3"
+    os.environ["DB_NAME"] = str(database)
+    os.environ["SQLITE_TUNING"] = tuning
+    setup_django()
+
+
+def prepare(database, tuning, rows=5000):
+    """Crea la base con las migraciones aplicadas y `rows` clientes."""
+    configure(database, tuning)
+
+    from django.core.management import call_command
+
+    from app.models import Client
+
+    call_command("migrate", verbosity=0)
+    Client.objects.bulk_create(
+        Client(name=f"Cliente {n}", phone=f"221{5000000 + n}", email=f"cliente{n}@mail.com")
+        for n in range(rows)
+    )
+
+
+def worker(database, tuning, operations, worker_id, start, results):
+    """Alterna lecturas de una página y escrituras, y reporta tiempos y errores."""
+    configure(database, tuning)
+
+    from django.db import OperationalError, close_old_connections
+
+    from app.models import Client
+
+    Client.objects.exists()
+    start.wait()
+    began = time.perf_counter()
+    done = locked = 0
+
+    for n in range(operations):
+        try:
+            if n % WRITE_EVERY == 0:
+                Client.objects.create(
+                    name=f"Nuevo {worker_id}-{n}",
+                    phone="221555232",
+                    email=f"nuevo{worker_id}-{n}@mail.com",
+                )
+            else:
+                list(Client.objects.filter(id__gt=n * 10).order_by("id")[:50])
+            done += 1
+        except OperationalError:
+            locked += 1
+            close_old_connections()
+
+    results.put((done, locked, time.perf_counter() - began))
+
+
+def run(mode, tuning, processes, operations):
+    """Ejecuta el escenario en una base nueva y retorna la fila de resultados."""
+    with tempfile.TemporaryDirectory() as directory:
+        database = Path(directory) / "bench.sqlite3"
+        context = multiprocessing.get_context("spawn")
+
+        setup = context.Process(target=prepare, args=(database, tuning))
+        setup.start()
+        setup.join()
+
+        start = context.Barrier(processes + 1)
+        results = context.Queue()
+        workers = [
+            context.Process(target=worker, args=(database, tuning, operations, n, start, results))
+            for n in range(processes)
+        ]
+        for process in workers:
+            process.start()
+
+        start.wait()
+        began = time.perf_counter()
+        outcomes = [results.get() for _ in workers]
+        elapsed = time.perf_counter() - began
+        for process in workers:
+            process.join()
+
+    done = sum(outcome[0] for outcome in outcomes)
+    locked = sum(outcome[1] for outcome in outcomes)
+    return [mode, done, locked, f"{elapsed:.2f} s", f"{done / elapsed:.0f}"]
+
+
+def main():
+    """Ejecuta el benchmark con y sin los PRAGMAs configurados."""
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    rows = [run(mode, tuning, processes, operations) for mode, tuning in MODES.items()]
+
+    print(f"{processes} procesos x {operations} operaciones (1 escritura cada {WRITE_EVERY})\n")
+    print_table(["PRAGMAs", "Operaciones", "Bloqueos", "Tiempo", "Ops/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    """
+    Configura Django para ejecutar un benchmark fuera de manage.py.
+    """
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "vetsoft.settings")
+
+    import django
+
+    django.setup()
+
+
+def create_database():
+    """
+    Crea una base de datos de prueba con todas las migraciones aplicadas.
+
+    Returns:
+        str: El nombre de la base de datos creada.
+    """
+    from django.db import connection
+
+    return connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+
+@contextmanager
+def timer(results, label):
+    """
+    Mide el tiempo de ejecución de un bloque y lo guarda en results[label] (en segundos).
+    """
+    start = time.perf_counter()
+    yield
+    results[label] = time.perf_counter() - start
+
+
+def print_table(headers, rows):
+    """
+    Imprime una tabla alineada en texto plano.
+    """
+    widths = [
+        max(len(str(value)) for value in column) for column in zip(headers, *rows)
+    ]
+    line = "  ".join("{:<%d}" % width for width in widths)
+    print(line.format(*headers))
+    print(line.format(*("-" * width for width in widths)))
+    for row in rows:
+        print(line.format(*row))
@@ -0,0 +1,69 @@
+"""
+Compara validar registros de mascotas uno por uno con validate_pet contra la
+validación por lote de pet_validator, sobre registros (diccionarios) y sobre
+columnas (una lista de valores por campo).
+
+Uno de cada cien registros es inválido. Validar de a uno calcula la fecha actual
+en cada llamada y arma un diccionario de errores por registro; el lote la calcula
+una sola vez y guarda solo las posiciones de los registros inválidos.
+
+Uso:
+    python -m benchmarks.validation [registros]
+"""
+
+import sys
+
+from benchmarks.utils import print_table, setup_django, timer
+
+# Uno de cada INVALID_EVERY registros tiene la fecha de nacimiento en el futuro
+INVALID_EVERY = 100
+
+
+def build_records(size):
+    """Arma `size` registros de mascotas."""
+    return [
+        {
+            "name": f"Mascota {n}",
+            "breed": "Caniche",
+            "birthday": "2999-01-01" if n % INVALID_EVERY == 0 else f"20{n % 20:02d}-05-10",
+        }
+        for n in range(size)
+    ]
+
+
+def main():
+    """Ejecuta las tres formas de validar sobre los mismos datos."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    setup_django()
+
+    from app.models import pet_validator, validate_pet
+
+    records = build_records(size)
+    columns = {field: [record[field] for record in records] for field in records[0]}
+
+    results = {}
+    with timer(results, "uno por uno (validate_pet)"):
+        invalid = sum(1 for record in records if validate_pet(record))
+    counts = {"uno por uno (validate_pet)": invalid}
+
+    with timer(results, "lote de registros (validate_records)"):
+        errors = pet_validator.validate_records(records)
+    counts["lote de registros (validate_records)"] = len(errors)
+
+    with timer(results, "lote de columnas (validate_columns)"):
+        errors = pet_validator.validate_columns(columns)
+    counts["lote de columnas (validate_columns)"] = len(errors)
+
+    baseline = results["uno por uno (validate_pet)"]
+    rows = [
+        [label, counts[label], f"{elapsed:.2f} s", f"{size / elapsed:,.0f}", f"{baseline / elapsed:.1f}x"]
+        for label, elapsed in results.items()
+    ]
+
+    print(f"{size:,} registros de mascotas ({size // INVALID_EVERY:,} inválidos)\n")
+    print_table(["Validación", "Inválidos", "Tiempo", "Registros/s", "Mejora"], rows)
+
+
+if __name__ == "__main__":
+    main()
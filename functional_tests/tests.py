@@ -172,16 +172,15 @@ class ClientsRepoTestCase(PlaywrightTestCase):
 
         self.page.goto(f"{self.live_server_url}{reverse('clients_repo')}")
 
-        edit_form = self.page.get_by_role(
-            "form", name="Formulario de eliminación de cliente"
-        )
-        client_id_input = edit_form.locator("input[name=client_id]")
+        delete_form = self.page.locator("#delete-form")
+        delete_button = self.page.get_by_role("button", name="Eliminar")
 
-        expect(edit_form).to_be_visible()
-        expect(edit_form).to_have_attribute("action", reverse("clients_delete"))
-        expect(client_id_input).not_to_be_visible()
-        expect(client_id_input).to_have_value(str(client.id))
-        expect(edit_form.get_by_role("button", name="Eliminar")).to_be_visible()
+        expect(delete_form).to_have_attribute("action", reverse("clients_delete"))
+        expect(delete_form).to_have_attribute("aria-label", "Formulario de eliminación de cliente")
+        expect(delete_button).to_be_visible()
+        expect(delete_button).to_have_attribute("form", "delete-form")
+        expect(delete_button).to_have_attribute("name", "client_id")
+        expect(delete_button).to_have_attribute("value", str(client.id))
 
     def test_should_can_be_able_to_delete_a_client(self):
         """Verifica si se puede eliminar un cliente."""
@@ -502,17 +501,15 @@ class PetsRepoTestCase(PlaywrightTestCase):
         
         self.page.goto(f"{self.live_server_url}{reverse('pets_repo')}")
         
-        edit_form = self.page.get_by_role(
-            "form", name="Formulario de eliminación de mascotas" 
-        
-        )
-        pet_id_input = edit_form.locator("input[name=pet_id]")
-        
-        expect(edit_form).to_be_visible()
-        expect(edit_form).to_have_attribute("action", reverse("pets_delete"))
-        expect(pet_id_input).not_to_be_visible()
-        expect(pet_id_input).to_have_value(str(pet.id))
-        expect(edit_form.get_by_role("button", name="Eliminar")).to_be_visible()
+        delete_form = self.page.locator("#delete-form")
+        delete_button = self.page.get_by_role("button", name="Eliminar")
+
+        expect(delete_form).to_have_attribute("action", reverse("pets_delete"))
+        expect(delete_form).to_have_attribute("aria-label", "Formulario de eliminación de mascotas")
+        expect(delete_button).to_be_visible()
+        expect(delete_button).to_have_attribute("form", "delete-form")
+        expect(delete_button).to_have_attribute("name", "pet_id")
+        expect(delete_button).to_have_attribute("value", str(pet.id))
     
     def test_should_be_able_to_delete_a_pet(self):
         """
@@ -883,20 +880,15 @@ class VetsRepoTestCase(PlaywrightTestCase):
         
         self.page.goto(f"{self.live_server_url}{reverse('vets_repo')}")
         
-        edit_form = self.page.get_by_role(
-            "form", name="Formulario de eliminación de veterinario"
-        )
-        
-        vet_id_input = edit_form.locator("input[name=vet_id]")
-        
-        expect(edit_form).to_be_visible()
-        
-        expect(edit_form).to_have_attribute("action", reverse("vets_delete"))
-        
-        expect(vet_id_input).not_to_be_visible()
-        expect(vet_id_input).to_have_value(str(vet.id))
-        
-        expect(edit_form.get_by_role("button", name="Eliminar")).to_be_visible()
+        delete_form = self.page.locator("#delete-form")
+        delete_button = self.page.get_by_role("button", name="Eliminar")
+
+        expect(delete_form).to_have_attribute("action", reverse("vets_delete"))
+        expect(delete_form).to_have_attribute("aria-label", "Formulario de eliminación de veterinario")
+        expect(delete_button).to_be_visible()
+        expect(delete_button).to_have_attribute("form", "delete-form")
+        expect(delete_button).to_have_attribute("name", "vet_id")
+        expect(delete_button).to_have_attribute("value", str(vet.id))
     
     def test_should_can_be_able_to_delete_a_vet(self):
         """
@@ -1120,16 +1112,15 @@ class ProvidersRepoTestCase(PlaywrightTestCase):
 
         self.page.goto(f"{self.live_server_url}{reverse('providers_repo')}")
 
-        delete_form = self.page.get_by_role(
-            "form", name="Formulario de eliminación de proveedor"
-        )
-        provider_id_input = delete_form.locator("input[name=provider_id]")
+        delete_form = self.page.locator("#delete-form")
+        delete_button = self.page.get_by_role("button", name="Eliminar")
 
-        expect(delete_form).to_be_visible()
         expect(delete_form).to_have_attribute("action", reverse("providers_delete"))
-        expect(provider_id_input).not_to_be_visible()
-        expect(provider_id_input).to_have_value(str(provider.id))
-        expect(delete_form.get_by_role("button", name="Eliminar")).to_be_visible()
+        expect(delete_form).to_have_attribute("aria-label", "Formulario de eliminación de proveedor")
+        expect(delete_button).to_be_visible()
+        expect(delete_button).to_have_attribute("form", "delete-form")
+        expect(delete_button).to_have_attribute("name", "provider_id")
+        expect(delete_button).to_have_attribute("value", str(provider.id))
 
     def test_should_be_able_to_delete_a_provider(self):
         """
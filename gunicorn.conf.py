@@ -0,0 +1,105 @@
+"""
+Configuración de gunicorn para servir la aplicación en producción.
+
+Todos los valores se pueden ajustar con variables de entorno:
+
+- GUNICORN_WORKER_CLASS: sync, gthread (por defecto) o uvicorn (ASGI).
+- WEB_CONCURRENCY: cantidad de procesos. Por defecto se deriva de las CPUs disponibles para el
+  proceso (respetando los límites del contenedor).
+- GUNICORN_THREADS: hilos por proceso con gthread.
+- GUNICORN_KEEPALIVE: segundos que se mantiene abierta una conexión sin requests.
+- GUNICORN_TIMEOUT: segundos antes de reiniciar un proceso que no responde.
+- GUNICORN_PRELOAD: si se carga la aplicación antes de crear los procesos.
+- PORT: el puerto en el que se escucha.
+"""
+
+import os
+
+
+def available_cpus():
+    """
+    Retorna la cantidad de CPUs que puede usar el proceso.
+
+    A diferencia de os.cpu_count(), respeta la afinidad de CPUs (p. ej. `docker run
+    --cpuset-cpus` o taskset). Si además hay una cuota de CPU del cgroup (`docker run
+    --cpus`), se usa el límite menor.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as file:
+            quota, period = file.read().split()
+    except (OSError, ValueError):
+        return cpus
+    if quota == "max":
+        return cpus
+    return max(1, min(cpus, -(-int(quota) // int(period))))
+
+
+WORKER_CLASSES = {
+    "sync": "sync",
+    "gthread": "gthread",
+    "uvicorn": "uvicorn_worker.UvicornWorker",
+}
+
+worker_class_name = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+if worker_class_name not in WORKER_CLASSES:
+    raise ValueError(
+        f"GUNICORN_WORKER_CLASS debe ser uno de: {', '.join(WORKER_CLASSES)}"
+    )
+
+worker_class = WORKER_CLASSES[worker_class_name]
+
+# Con uvicorn la aplicación se sirve por ASGI; con los demás, por WSGI
+if worker_class_name == "uvicorn":
+    wsgi_app = "vetsoft.asgi:application"
+else:
+    wsgi_app = "vetsoft.wsgi:application"
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# Los procesos sync atienden una request a la vez, por lo que se usan más procesos;
+# gthread y uvicorn atienden varias por proceso con hilos o de forma asíncrona
+cpus = available_cpus()
+default_workers = cpus * 2 + 1 if worker_class_name == "sync" else cpus + 1
+workers = int(os.getenv("WEB_CONCURRENCY", default_workers))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+
+# Con la cache en la memoria de cada proceso, la invalidación de los listados no llega
+# a los demás procesos, que mostrarían páginas viejas hasta REPOSITORY_CACHE_TIMEOUT
+if (
+    workers > 1
+    and os.getenv("CACHE_BACKEND") == "locmem"
+    and os.getenv("REPOSITORY_CACHE_TIMEOUT", "300").strip() != "0"
+):
+    raise ValueError(
+        "CACHE_BACKEND=locmem no se puede usar con varios procesos y la cache de listados activa: "
+        "use CACHE_BACKEND=file o redis, WEB_CONCURRENCY=1 o REPOSITORY_CACHE_TIMEOUT=0"
+    )
+
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() in ("1", "true", "yes")
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+
+# Reinicia cada proceso luego de una cantidad de requests para acotar el crecimiento de memoria
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+
+accesslog = os.getenv("GUNICORN_ACCESSLOG", "-")
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    """
+    Cierra las conexiones a la base de datos heredadas del proceso principal.
+
+    Con preload_app la aplicación se carga antes del fork, y una conexión abierta
+    durante la carga no debe compartirse entre procesos.
+    """
+    from django.db import connections
+
+    connections.close_all()
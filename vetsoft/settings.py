@@ -12,15 +12,41 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 
 import os
 import secrets
+import sys
+import tempfile
 from pathlib import Path
 
+import django
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 load_dotenv()
 
+
+def env_bool(name, default=False):
+    """
+    Lee una variable de entorno booleana ("1", "true", "yes" u "on" son verdaderos).
+    """
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def env_conn_max_age(name, default="0"):
+    """
+    Lee la duración máxima de una conexión persistente. "None" la mantiene abierta sin límite.
+    """
+    value = os.getenv(name, default)
+    return None if value.strip().lower() == "none" else int(value)
+
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Indica si el proceso ejecuta las pruebas (`manage.py test`)
+TESTING = sys.argv[1:2] == ["test"]
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.0/howto/deployment/checklist/
@@ -30,7 +56,7 @@ default_secret_key = secrets.token_urlsafe(50)
 SECRET_KEY = os.getenv("SECRET_KEY", default_secret_key)#"django-insecure-p)^5i@33!)v)l7*c#q)%j(g5d+**-yo%)6l*vg!gs_w-e=^_ig"
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = os.getenv("DEBUG")
+DEBUG = env_bool("DEBUG")
 
 ALLOWED_HOSTS = ['0.0.0.0', 'localhost', '127.0.0.1', '*', 'https://vetsoft-1-0.onrender.com']
 
@@ -53,6 +79,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "app.compression.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -63,12 +91,26 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "vetsoft.urls"
 
+# Los templates se compilan una sola vez por proceso (loader con cache, también con
+# DEBUG; el autoreload de runserver la vacía al editar un template). El backend registra
+# los tiempos de compilación y renderizado, que se consultan en /metrics/.
+
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "NAME": "django",
+        "BACKEND": "app.template_backend.DjangoTemplates",
         "DIRS": [],
-        "APP_DIRS": True,
+        "APP_DIRS": False,
         "OPTIONS": {
+            "loaders": [
+                (
+                    "app.template_backend.CachedLoader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
@@ -80,17 +122,112 @@ TEMPLATES = [
     },
 ]
 
+# Compila todos los templates al iniciar la aplicación, en lugar de en la primera request
+
+TEMPLATE_WARM_UP = env_bool("TEMPLATE_WARM_UP", default=not DEBUG and not TESTING)
+
 WSGI_APPLICATION = "vetsoft.wsgi.application"
 
+# Usa las vistas asíncronas (app/async_views.py) para los listados y formularios. Por
+# defecto se activan al servir la app con workers de uvicorn (ASGI); con WSGI las vistas
+# sincrónicas evitan crear un event loop por request.
+
+ASYNC_VIEWS = env_bool("ASYNC_VIEWS", default=os.getenv("GUNICORN_WORKER_CLASS") == "uvicorn")
+
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
+# CONN_MAX_AGE reutiliza la conexión entre requests (segundos, 0 la cierra en cada request)
+# y CONN_HEALTH_CHECKS verifica que siga viva antes de reutilizarla.
+
 DATABASES = {
     "default": {
         "ENGINE": os.getenv("DB_ENGINE", "django.db.backends.sqlite3"),
         "NAME": os.getenv("DB_NAME", str(BASE_DIR / "db.sqlite3")),
+        "USER": os.getenv("DB_USER", ""),
+        "PASSWORD": os.getenv("DB_PASSWORD", ""),
+        "HOST": os.getenv("DB_HOST", ""),
+        "PORT": os.getenv("DB_PORT", ""),
+        "CONN_MAX_AGE": env_conn_max_age("DB_CONN_MAX_AGE"),
+        "CONN_HEALTH_CHECKS": env_bool("DB_CONN_HEALTH_CHECKS"),
+        "OPTIONS": {},
+    }
+}
+
+# PRAGMAs que se aplican a cada conexión SQLite (ver app/sqlite.py). WAL permite leer
+# mientras otro proceso escribe, y busy_timeout espera (ms) en lugar de fallar con
+# "database is locked". cache_size negativo se expresa en KiB. SQLITE_TUNING=false
+# deja los valores por defecto de SQLite.
+
+SQLITE_PRAGMAS = (
+    {
+        "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000")),
+        "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(128 * 1024 * 1024))),
+        "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", "-20000")),
+        "temp_store": os.getenv("SQLITE_TEMP_STORE", "MEMORY"),
     }
+    if env_bool("SQLITE_TUNING", default=True)
+    else {}
+)
+
+# Pool de conexiones de psycopg para PostgreSQL (requiere Django 5.1+ y psycopg[pool]).
+# Reemplaza a las conexiones persistentes, por lo que CONN_MAX_AGE debe ser 0.
+
+if env_bool("DB_POOL"):
+    if DATABASES["default"]["ENGINE"] != "django.db.backends.postgresql":
+        raise ImproperlyConfigured("DB_POOL solo está disponible con PostgreSQL")
+    if django.VERSION < (5, 1):
+        raise ImproperlyConfigured(
+            "DB_POOL requiere Django 5.1 o superior; use DB_CONN_MAX_AGE para reutilizar conexiones"
+        )
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+        "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+        "timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+    }
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# CACHE_BACKEND: "file" (compartida entre los procesos del mismo equipo, por defecto),
+# "locmem" (memoria de cada proceso) o "redis" (cualquier servidor compatible con Redis,
+# requiere redis-py). Con locmem, la invalidación de los listados solo llega al proceso
+# que atendió la escritura y los demás procesos de gunicorn mostrarían datos viejos,
+# por eso solo es el valor por defecto en las pruebas (gunicorn.conf.py rechaza locmem
+# con varios procesos si la cache de listados está activa).
+
+CACHE_BACKENDS = {
+    "locmem": ("django.core.cache.backends.locmem.LocMemCache", "vetsoft"),
+    "file": (
+        "django.core.cache.backends.filebased.FileBasedCache",
+        os.path.join(tempfile.gettempdir(), "vetsoft-cache"),
+    ),
+    "redis": ("django.core.cache.backends.redis.RedisCache", "redis://127.0.0.1:6379/0"),
+}
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "locmem" if TESTING else "file")
+
+if CACHE_BACKEND not in CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        f"CACHE_BACKEND debe ser uno de: {', '.join(CACHE_BACKENDS)}"
+    )
+
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND][0],
+        "LOCATION": os.getenv("CACHE_LOCATION") or CACHE_BACKENDS[CACHE_BACKEND][1],
+    },
+    # Fragmentos de templates que solo dependen del código (navbar, cards del inicio).
+    # Se guardan en la memoria de cada proceso sin vencimiento, por lo que se
+    # descartan al reiniciar la app con una nueva versión.
+    "fragments": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "vetsoft-fragments",
+    },
 }
 
 
@@ -130,7 +267,105 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+# Bootstrap y sus iconos están en app/static/vendor, sin depender de una CDN. `collectstatic`
+# (se ejecuta al construir la imagen de Docker) los copia a STATIC_ROOT con el hash del
+# contenido en el nombre y genera sus versiones .gz y .br. WhiteNoise los sirve desde
+# el proceso de la app, eligiendo la versión comprimida según Accept-Encoding y con
+# `Cache-Control: immutable` para los archivos con hash.
+STATIC_ROOT = Path(os.getenv("STATIC_ROOT", BASE_DIR / "staticfiles"))
+
+# El manifiesto (archivos con hash) se usa con DEBUG desactivado solo si ya se ejecutó
+# collectstatic, o al ejecutarlo: sin STATIC_ROOT/staticfiles.json cada página fallaría
+# al buscar sus archivos, por lo que se sirven desde app/static como en desarrollo.
+STATIC_MANIFEST = env_bool(
+    "STATIC_MANIFEST",
+    default=not DEBUG
+    and not TESTING
+    and (sys.argv[1:2] == ["collectstatic"] or (STATIC_ROOT / "staticfiles.json").exists()),
+)
+
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": (
+            "whitenoise.storage.CompressedManifestStaticFilesStorage"
+            if STATIC_MANIFEST
+            else "django.contrib.staticfiles.storage.StaticFilesStorage"
+        ),
+    },
+}
+
+# Sin el manifiesto (desarrollo, pruebas o antes de collectstatic) los archivos se
+# sirven desde app/static
+WHITENOISE_USE_FINDERS = not STATIC_MANIFEST
+
+WHITENOISE_AUTOREFRESH = not STATIC_MANIFEST
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+# Listados (repositorios)
+# Tamaño de página de la paginación por cursor y el máximo que se puede pedir con ?page_size=
+
+REPOSITORY_PAGE_SIZE = int(os.getenv("REPOSITORY_PAGE_SIZE", "50"))
+
+REPOSITORY_MAX_PAGE_SIZE = int(os.getenv("REPOSITORY_MAX_PAGE_SIZE", "500"))
+
+# Cantidad de filas que se leen y renderizan por bloque en el listado completo (?stream=1)
+
+REPOSITORY_STREAM_CHUNK_SIZE = int(os.getenv("REPOSITORY_STREAM_CHUNK_SIZE", "2000"))
+
+# Segundos que se guardan en cache las páginas de los listados (0 las desactiva).
+# Se invalidan al guardar o eliminar un registro, por lo que el tiempo solo acota
+# cuánto puede quedar desactualizada una página si se escribe en la base por fuera
+# de la app. En las pruebas se desactiva salvo que se configure explícitamente.
+
+REPOSITORY_CACHE_TIMEOUT = int(os.getenv("REPOSITORY_CACHE_TIMEOUT", "0" if TESTING else "300"))
+
+# Cantidad de ids por consulta DELETE al eliminar los registros seleccionados en un listado
+
+BULK_DELETE_BATCH_SIZE = int(os.getenv("BULK_DELETE_BATCH_SIZE", "500"))
+
+
+# API JSON
+# Cantidad máxima de registros que se pueden crear, actualizar o eliminar en una request
+
+API_MAX_BATCH_SIZE = int(os.getenv("API_MAX_BATCH_SIZE", "5000"))
+
+
+# Métricas (/metrics/)
+# Por defecto solo las ven los usuarios staff; activarlo las expone sin autenticación
+# (p. ej. si el endpoint solo es accesible desde la red del monitoreo)
+
+METRICS_PUBLIC = env_bool("METRICS_PUBLIC")
+
+
+# Compresión de las respuestas (app/compression.py)
+# Tipos de contenido que se comprimen y tamaño mínimo en bytes de las respuestas
+# comunes (las streaming se comprimen siempre). Se usa brotli si el cliente lo acepta
+# y está instalado (y COMPRESSION_BROTLI activo), y si no gzip. La calidad de brotli
+# y el nivel de gzip equilibran el tamaño con el costo de comprimir en cada request.
+
+COMPRESSION_CONTENT_TYPES = frozenset(
+    (
+        "text/html",
+        "text/plain",
+        "text/csv",
+        "text/css",
+        "text/javascript",
+        "application/json",
+        "application/x-ndjson",
+        "image/svg+xml",
+    )
+)
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "500"))
+
+COMPRESSION_BROTLI = env_bool("COMPRESSION_BROTLI", default=True)
+
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))